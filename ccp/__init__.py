@@ -133,8 +133,10 @@ _pio.templates.default = "ccp"
 ###############################################################################
 
 from .config.fluids import fluid_list
-from .state import State
-from .point import Point
+from . import parallel
+from .state import State, StateArray
+from .point import Point, LazyPoint
+from .point_table import PointTable, PointRecord
 from .curve import Curve
 from .impeller import Impeller, impeller_example
 from .fo import FlowOrifice
@@ -143,7 +145,11 @@ from .evaluation import Evaluation
 
 __all__ = [
     "State",
+    "StateArray",
     "Point",
+    "LazyPoint",
+    "PointTable",
+    "PointRecord",
     "Curve",
     "Impeller",
     "FlowOrifice",
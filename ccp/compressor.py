@@ -169,9 +169,9 @@ class StraightThrough(Impeller):
 
             Ts1f = point.suc.T()
             # dummy state to calculate Tend
-            dummy_state = copy(point.disch)
-            dummy_state.update(p=point.suc.p(), h=dummy_state.h())
-            Tend = dummy_state.T()
+            with point.disch.scratch() as dummy_state:
+                dummy_state.update(p=point.suc.p(), h=dummy_state.h())
+                Tend = dummy_state.T()
             Tseal = point.seal_gas_temperature
             if Tseal == None:
                 Tseal = Q_(0, "kelvin")
@@ -228,9 +228,11 @@ class StraightThrough(Impeller):
                 ms1f_sp = ms1r_sp - mend_sp
                 Ts1f_sp = guarantee_point.suc.T()
                 # dummy state to calculate Tend
-                dummy_state = copy(initial_point_rotor_sp.disch)
-                dummy_state.update(p=initial_point_rotor_sp.suc.p(), h=dummy_state.h())
-                Tend_sp = dummy_state.T()
+                with initial_point_rotor_sp.disch.scratch() as dummy_state:
+                    dummy_state.update(
+                        p=initial_point_rotor_sp.suc.p(), h=dummy_state.h()
+                    )
+                    Tend_sp = dummy_state.T()
                 Ts1r_sp_new = (ms1f_sp * Ts1f_sp + mend_sp * Tend_sp) / (
                     ms1f_sp + mend_sp
                 )
@@ -775,44 +777,46 @@ class BackToBack(Impeller):
                 T=guarantee_point_sec2.suc.T(),
                 fluid=initial_point.suc.fluid,
             )
-            end_seal_state_downstream_sp = copy(initial_point.disch)
-            end_seal_state_downstream_sp.update(
-                p=guarantee_point_sec1.suc.p(), h=end_seal_state_upstream_sp.h()
-            )
-            Tend_sp = end_seal_state_downstream_sp.T()
+            with initial_point.disch.scratch() as end_seal_state_downstream_sp:
+                end_seal_state_downstream_sp.update(
+                    p=guarantee_point_sec1.suc.p(), h=end_seal_state_upstream_sp.h()
+                )
+                Tend_sp = end_seal_state_downstream_sp.T()
 
-            mend_sp = flow_m_seal(
-                k_seal=k_end_seal,
-                state_up=end_seal_state_upstream_sp,
-                state_down=end_seal_state_downstream_sp,
-            )
+                mend_sp = flow_m_seal(
+                    k_seal=k_end_seal,
+                    state_up=end_seal_state_upstream_sp,
+                    state_down=end_seal_state_downstream_sp,
+                )
 
             Ts1f_sp = guarantee_point_sec1.suc.T()
             qs1r_sp = flow_from_phi(D=point.D, phi=point.phi, speed=self.speed_operational)
             ps1r_sp = guarantee_point_sec1.suc.p()
             vs1f_sp = guarantee_point_sec1.suc.v()
-            dummy_suc = copy(guarantee_point_sec1.suc)
 
             error = 1
             dm = Q_(1, "kg/s")
             ms1f_sp = qs1r_sp / vs1f_sp  # initial guess
-            while error > 0.00001:
-                ms1r_sp = ms1f_sp + mend_sp
-                Ts1r_sp = (mend_sp * Tend_sp + ms1f_sp * Ts1f_sp) / ms1r_sp
-                dummy_suc.update(p=ps1r_sp, T=Ts1r_sp)
-                vs1r_sp = dummy_suc.v()
-                qs1r_sp_1 = ms1r_sp * vs1r_sp
-
-                fx = -qs1r_sp + qs1r_sp_1
-                ms1f_sp_new = ms1f_sp + dm
-                ms1r_sp_new = ms1f_sp_new + mend_sp
-                Ts1r_sp_new = (ms1f_sp_new * Ts1f_sp + mend_sp * Tend_sp) / ms1r_sp_new
-                dummy_suc.update(p=ps1r_sp, T=Ts1r_sp_new)
-                vs1r_sp_new = dummy_suc.v()
-                qs1r_sp_1_new = ms1r_sp_new * vs1r_sp_new
-                dfx = (qs1r_sp_1_new - qs1r_sp_1) / dm
-                ms1f_sp = ms1f_sp - (fx / dfx)
-                error = ((fx**2) ** 0.5).m
+            with guarantee_point_sec1.suc.scratch() as dummy_suc:
+                while error > 0.00001:
+                    ms1r_sp = ms1f_sp + mend_sp
+                    Ts1r_sp = (mend_sp * Tend_sp + ms1f_sp * Ts1f_sp) / ms1r_sp
+                    dummy_suc.update_si(p=ps1r_sp.m_as("Pa"), T=Ts1r_sp.m_as("K"))
+                    vs1r_sp = Q_(dummy_suc.v_si(), "m**3/kg")
+                    qs1r_sp_1 = ms1r_sp * vs1r_sp
+
+                    fx = -qs1r_sp + qs1r_sp_1
+                    ms1f_sp_new = ms1f_sp + dm
+                    ms1r_sp_new = ms1f_sp_new + mend_sp
+                    Ts1r_sp_new = (
+                        ms1f_sp_new * Ts1f_sp + mend_sp * Tend_sp
+                    ) / ms1r_sp_new
+                    dummy_suc.update_si(p=ps1r_sp.m_as("Pa"), T=Ts1r_sp_new.m_as("K"))
+                    vs1r_sp_new = Q_(dummy_suc.v_si(), "m**3/kg")
+                    qs1r_sp_1_new = ms1r_sp_new * vs1r_sp_new
+                    dfx = (qs1r_sp_1_new - qs1r_sp_1) / dm
+                    ms1f_sp = ms1f_sp - (fx / dfx)
+                    error = ((fx**2) ** 0.5).m
 
             ms1f_sp_array[i] = ms1f_sp
 
@@ -908,11 +912,11 @@ class BackToBack(Impeller):
                 state_up=sec2_disch,
                 state_down=point_r_sp.disch,
             )
-            div_wall_downstream_state = copy(sec2_disch)
-            div_wall_downstream_state.update(
-                p=point_r_sp.disch.p(), h=div_wall_downstream_state.h()
-            )
-            Tdiv_sp = div_wall_downstream_state.T()
+            with sec2_disch.scratch() as div_wall_downstream_state:
+                div_wall_downstream_state.update(
+                    p=point_r_sp.disch.p(), h=div_wall_downstream_state.h()
+                )
+                Tdiv_sp = div_wall_downstream_state.T()
 
             # calculate flange disch
             Td1r_sp = point_r_sp.disch.T()
@@ -1,2 +1,17 @@
 POLYTROPIC_METHOD = "schultz"
 EOS = "REFPROP"
+# maximum number of flash results kept in the ccp.state cache (0 disables it)
+STATE_CACHE_SIZE = 0
+# significant digits of the input pair used to build the ccp.state cache keys
+STATE_CACHE_DIGITS = 10
+# maximum number of interpolated curves kept by each ccp.Impeller (0 disables it)
+CURVE_CACHE_SIZE = 32
+# significant digits of the speed (rad/s) used to build the curve cache keys
+CURVE_CACHE_DIGITS = 10
+# backend for parallel calculations: "serial", "threads", "processes" or a
+# concurrent.futures.Executor (see ccp.parallel)
+PARALLEL_BACKEND = "processes"
+# maximum number of workers for parallel calculations (None uses all processors)
+PARALLEL_MAX_WORKERS = None
+# calculations with less items than this are carried out serially
+PARALLEL_MIN_SIZE = 8
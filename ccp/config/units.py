@@ -118,73 +118,100 @@ def check_units(func):
     0.0127
     """
 
+    args_names = inspect.getfullargspec(func)[0]
+    # base unit for each parameter, computed once at decoration time
+    args_units = [_base_unit(arg_name) for arg_name in args_names]
+    kwargs_units = dict(zip(args_names, args_units))
+
     @wraps(func)
     def inner(*args, **kwargs):
-        base_unit_args = []
-        args_names = inspect.getfullargspec(func)[0]
-
-        for arg_name, arg_value in zip(args_names, args):
-            names = arg_name.split("_")
-            if "units" in names:
-                base_unit_args.append(arg_value)
-                continue
-
-            # treat flow_v and flow_m separately
-            if "flow_v" in arg_name:
-                names.insert(0, "flow_v")
-            if "flow_m" in arg_name:
-                names.insert(0, "flow_m")
-
-            if arg_name not in names:
-                # check first for arg_name in units
-                names.insert(0, arg_name)
-            for name in names:
-                if name in units and arg_value is not None:
-                    # For now, we only return the magnitude for the converted Quantity
-                    # If pint is fully adopted by ross in the future, and we have all Quantities
-                    # using it, we could remove this, which would allows us to use pint in its full capability
-                    try:
-                        base_unit_args.append(arg_value.to(units[name]))
-                    except AttributeError:
-                        try:
-                            base_unit_args.append(Q_(arg_value, units[name]))
-                        except TypeError:
-                            # Handle erros that we get with bool for example
-                            base_unit_args.append(arg_value)
-                    break
-            else:
-                base_unit_args.append(arg_value)
+        base_unit_args = [
+            arg_value
+            if arg_unit is None or arg_value is None
+            else _to_base_unit(arg_value, arg_unit)
+            for arg_unit, arg_value in zip(args_units, args)
+        ]
 
         base_unit_kwargs = {}
         for k, v in kwargs.items():
-            names = k.split("_")
-            if "units" in names:
+            try:
+                unit = kwargs_units[k]
+            except KeyError:
+                # keyword arguments not in the signature (e.g. **kwargs)
+                unit = kwargs_units[k] = _base_unit(k)
+            if unit is None or v is None:
                 base_unit_kwargs[k] = v
-                continue
-
-            # treat flow_v and flow_m separately
-            if "flow_v" in k:
-                names.insert(0, "flow_v")
-            if "flow_m" in k:
-                names.insert(0, "flow_m")
-
-            if k not in names:
-                # check first for arg_name in units
-                names.insert(0, k)
-            for name in names:
-                if name in units and v is not None:
-                    try:
-                        base_unit_kwargs[k] = v.to(units[name])
-                    except AttributeError:
-                        try:
-                            base_unit_kwargs[k] = Q_(v, units[name])
-                        except TypeError:
-                            # Handle errors that we get with bool for example
-                            base_unit_kwargs[k] = v
-                    break
             else:
-                base_unit_kwargs[k] = v
+                base_unit_kwargs[k] = _to_base_unit(v, unit)
 
         return func(*base_unit_args, **base_unit_kwargs)
 
     return inner
+
+
+def _base_unit(arg_name):
+    """Return the base unit for an argument name or None if it has no units.
+
+    The name is split on '_' and each part is checked against the units
+    dictionary, as described in :py:func:`check_units`.
+    """
+    names = arg_name.split("_")
+    if "units" in names:
+        return None
+
+    # treat flow_v and flow_m separately
+    if "flow_v" in arg_name:
+        names.insert(0, "flow_v")
+    if "flow_m" in arg_name:
+        names.insert(0, "flow_m")
+
+    if arg_name not in names:
+        # check first for arg_name in units
+        names.insert(0, arg_name)
+    for name in names:
+        if name in units:
+            return ureg.Unit(units[name])
+
+    return None
+
+
+# (factor, offset) for each (unit, base unit) pair already converted
+_conversion_factors = {}
+
+
+def _conversion_factor(unit, base_unit):
+    """Return (factor, offset) so that base = factor * value + offset."""
+    offset = Q_(0.0, unit).to(base_unit).magnitude
+    factor = Q_(1.0, unit).to(base_unit).magnitude - offset
+    return factor, offset
+
+
+def _to_base_unit(value, base_unit):
+    """Convert value to base_unit.
+
+    Quantities are converted with a cached (factor, offset) pair, so repeated
+    conversions between the same units do not go through the pint registry.
+    Values without units are assumed to be given in the base unit.
+    """
+    if not isinstance(value, pint.Quantity):
+        # For now, we only return the magnitude for the converted Quantity
+        # If pint is fully adopted by ross in the future, and we have all Quantities
+        # using it, we could remove this, which would allows us to use pint in its full capability
+        try:
+            return value.to(base_unit)
+        except AttributeError:
+            try:
+                return Q_(value, base_unit)
+            except TypeError:
+                # Handle errors that we get with bool for example
+                return value
+
+    key = (value.units, base_unit)
+    try:
+        factor, offset = _conversion_factors[key]
+    except KeyError:
+        factor, offset = _conversion_factors[key] = _conversion_factor(*key)
+
+    if factor == 1.0 and offset == 0.0:
+        return Q_(value.magnitude, base_unit)
+    return Q_(value.magnitude * factor + offset, base_unit)
@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict, namedtuple
 from functools import reduce
 
 
@@ -16,3 +18,97 @@ def r_getattr(obj, attr, *args):
         return getattr(obj, attr, *args)
 
     return reduce(_getattr, [obj] + attr.split("."))
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """Bounded least recently used cache with hit/miss counters.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of items kept in the cache.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Return the value for key, marking it as the most recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Add value to the cache, discarding the least recently used items."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > max(self.maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all items and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return hits, misses, maxsize and currsize as a CacheInfo tuple."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class LazyAttribute:
+    """Attribute created on first access.
+
+    This is a non-data descriptor that calls factory(obj, *args) the first
+    time the attribute is accessed in an instance. The result is stored in
+    the instance __dict__, so that following accesses do not go through the
+    descriptor and the attribute can be set or deleted as usual.
+
+    Parameters
+    ----------
+    factory : callable
+        Function called with the instance and args to create the attribute.
+    *args
+        Additional arguments passed to factory.
+    """
+
+    def __init__(self, factory, *args):
+        self.factory = factory
+        self.args = args
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.factory(obj, *self.args)
+        obj.__dict__[self.name] = value
+
+        return value
+
+
+def add_lazy_attribute(cls, name, factory, *args):
+    """Add a LazyAttribute to cls, e.g.: add_lazy_attribute(Curve, 'head_plot', plot_func, 'head')."""
+    attribute = LazyAttribute(factory, *args)
+    attribute.__set_name__(cls, name)
+    setattr(cls, name, attribute)
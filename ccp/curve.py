@@ -6,6 +6,7 @@ from scipy.interpolate import interp1d
 import plotly.graph_objects as go
 
 from ccp import Q_, ureg, Point
+from ccp.config.utilities import add_lazy_attribute
 
 
 class StateParameter:
@@ -14,14 +15,7 @@ class StateParameter:
         self.attr = attr
 
     def __call__(self, *args, **kwargs):
-        values = []
-
-        for point in self.curve_state_object:
-            values.append(getattr(getattr(point, self.attr)(), "magnitude"))
-
-        units = getattr(getattr(point, self.attr)(), "units")
-
-        return Q_(values, units)
+        return self.curve_state_object._values(self.attr)
 
 
 def state_parameter(curve_state_object, attr):
@@ -152,25 +146,7 @@ class InterpolatedFunction:
         self.attr = attr
 
     def __call__(self, *args, **kwargs):
-        curve_state_object = self.curve_state_object
-        attr = self.attr
-        values = getattr(curve_state_object, attr)
-        if callable(values):
-            values = values()
-
-        units = values.units
-
-        if len(values) < 3:
-            interpolation_degree = 1
-        else:
-            interpolation_degree = 3
-
-        interpol_function = interp1d(
-            curve_state_object.flow_v.magnitude,
-            values.magnitude,
-            kind=interpolation_degree,
-            fill_value="extrapolate",
-        )
+        interpol_function, units = self.curve_state_object._interpolant(self.attr)
 
         try:
             args = [arg.magnitude for arg in args]
@@ -195,26 +171,58 @@ class _CurveState:
     # >>> curve.suc.p()
     (100000, 100000) pascal
 
+    Values are taken from the curve data (see Curve.data).
     """
 
-    def __init__(self, points, flow_v, speed):
-        self.flow_v = flow_v
-        self.points = points
-        self.speed = speed
+    def __init__(self, curve, name):
+        self.curve = curve
+        self.name = name
 
-        # set a method for each suction attribute in the list
-        for attr in ["p", "T", "h", "s", "rho"]:
-            func = state_parameter(self, attr)
-            setattr(self, attr, func)
+    @property
+    def points(self):
+        return [getattr(point, self.name) for point in self.curve]
 
-            interpol_func = interpolated_function(self, attr)
-            setattr(self, f"{attr}_interpolated", interpol_func)
+    @property
+    def flow_v(self):
+        return self.curve.flow_v
 
-            plot = plot_func(self, attr)
-            setattr(self, f"{attr}_plot", plot)
+    @property
+    def speed(self):
+        return self.curve.speed
 
     def __getitem__(self, item):
-        return self.points.__getitem__(item)
+        return getattr(self.curve[item], self.name)
+
+    def _values(self, attr):
+        return self.curve._values(f"{self.name}_{attr}")
+
+    def _interpolant(self, attr):
+        return self.curve._interpolant(f"{self.name}_{attr}")
+
+
+# state attributes stored for the suction and discharge of each point
+_state_attributes = ["p", "T", "h", "s", "rho"]
+
+# set a method for each state attribute in the list, created on first access
+for _attr in _state_attributes:
+    add_lazy_attribute(_CurveState, _attr, state_parameter, _attr)
+    add_lazy_attribute(
+        _CurveState, f"{_attr}_interpolated", interpolated_function, _attr
+    )
+    add_lazy_attribute(_CurveState, f"{_attr}_plot", plot_func, _attr)
+
+
+# curve parameters with <param>_interpolated and <param>_plot methods
+_curve_parameters = [
+    "head",
+    "eff",
+    "power",
+    "power_shaft",
+    "torque",
+    "phi",
+    "psi",
+    "flow_m",
+]
 
 
 class Curve:
@@ -233,51 +241,107 @@ class Curve:
     def __init__(self, points):
         if len(points) < 2:
             raise TypeError("At least 2 points should be given.")
-        self.points = sorted(points, key=lambda p: p.flow_v)
+        self.points = points
 
-        _flow_v_values = [p.flow_v.magnitude for p in self]
-        _flow_v_units = self[0].flow_v.units
-        self.flow_v = Q_(_flow_v_values, _flow_v_units)
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = sorted(points, key=lambda p: p.flow_v)
+        self._update()
+
+    def _update(self):
+        """Store the curve values in a structured array and reset interpolants.
+
+        The values for each point are stored in self.data, with one field
+        for each parameter (e.g. 'head', 'disch_p'), and their units in
+        self.units. Interpolants are created from self.data on first use and
+        cached until the points of the curve change.
+        """
+        self._points.sort(key=lambda p: p.flow_v)
+        self._points_ids = tuple(id(point) for point in self._points)
+        self._interpolants = {}
 
         self.speed = self[0].speed
-        self.power_losses = self.points[0].power_losses
+        self.power_losses = self._points[0].power_losses
         # change the following check in the future
         for point in self:
             if self.speed != point.speed:
                 raise ValueError("Speed for each point should be equal")
 
-        self.suc = _CurveState(
-            [p.suc for p in self], flow_v=self.flow_v, speed=self.speed
-        )
-        self.disch = _CurveState(
-            [p.disch for p in self], flow_v=self.flow_v, speed=self.speed
-        )
-
-        for param in [
-            "head",
-            "eff",
-            "power",
-            "power_shaft",
-            "torque",
-            "phi",
-            "psi",
-            "flow_m",
-        ]:
+        columns = {}
+        self.units = {}
+        for param in ["flow_v"] + _curve_parameters:
             values = []
+            units = None
             for point in self:
                 try:
                     values.append(getattr(getattr(point, param), "magnitude"))
                     units = getattr(getattr(point, param), "units")
                 except AttributeError:
-                    continue
+                    values.append(np.nan)
+            columns[param] = values
+            self.units[param] = units
+        for state in ["suc", "disch"]:
+            for attr in _state_attributes:
+                values = [getattr(getattr(point, state), attr)() for point in self]
+                columns[f"{state}_{attr}"] = [value.magnitude for value in values]
+                self.units[f"{state}_{attr}"] = values[0].units
+
+        self.data = np.empty(len(self._points), dtype=[(k, float) for k in columns])
+        for column, values in columns.items():
+            self.data[column] = values
+
+        self.suc = _CurveState(self, "suc")
+        self.disch = _CurveState(self, "disch")
+
+    def _current_data(self):
+        """Return self.data, updated if the points list was modified in place."""
+        if self._points_ids != tuple(id(point) for point in self._points):
+            # points list was modified in place
+            self._update()
+
+        return self.data
+
+    def _values(self, column):
+        """Return a column of the curve data as a pint.Quantity."""
+        return Q_(self._current_data()[column], self.units[column])
+
+    def _interpolant(self, column):
+        """Return the interpolant for a column and its units.
+
+        The interpolant is created on first use and cached until the points
+        of the curve change.
+        """
+        data = self._current_data()
+        try:
+            return self._interpolants[column]
+        except KeyError:
+            pass
 
-            setattr(self, param, Q_(values, units))
+        values = data[column]
+        if len(values) < 3:
+            interpolation_degree = 1
+        else:
+            interpolation_degree = 3
+
+        interpol_function = interp1d(
+            data["flow_v"],
+            values,
+            kind=interpolation_degree,
+            fill_value="extrapolate",
+        )
+        self._interpolants[column] = (interpol_function, self.units[column])
 
-            interpol_func = interpolated_function(self, param)
-            setattr(self, f"{param}_interpolated", interpol_func)
+        return self._interpolants[column]
 
-            plot = plot_func(self, param)
-            setattr(self, param + "_plot", plot)
+    def __getstate__(self):
+        attributes = self.__dict__.copy()
+        attributes["_interpolants"] = {}
+
+        return attributes
 
     def __getitem__(self, item):
         return self.points.__getitem__(item)
@@ -342,3 +406,15 @@ class Curve:
         return cls(
             [Point(**Point._dict_from_load(kwargs)) for kwargs in parameters.values()]
         )
+
+
+def _curve_column(column):
+    return property(lambda self: self._values(column))
+
+
+for _param in ["flow_v"] + _curve_parameters:
+    setattr(Curve, _param, _curve_column(_param))
+
+for _param in _curve_parameters:
+    add_lazy_attribute(Curve, f"{_param}_interpolated", interpolated_function, _param)
+    add_lazy_attribute(Curve, f"{_param}_plot", plot_func, _param)
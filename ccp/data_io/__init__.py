@@ -5,4 +5,10 @@ before beeing loaded.
 
 """
 
-from .processing import fluctuation, fluctuation_data, mean_data, filter_data
+from .processing import (
+    fluctuation,
+    fluctuation_data,
+    mean_data,
+    filter_data,
+    filter_data_chunks,
+)
@@ -1,5 +1,6 @@
 """Data processing functions for ccp."""
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,14 +23,110 @@ def fluctuation(x):
     Examples
     --------
     >>> fluctuation([1, 2, 3, 4, 5])
-    80.0
+    133.33333333333334
     >>> fluctuation([1, 1, 1, 1, 1])
     0.0
     """
+    x = np.asarray(x)
     if x.mean() == 0:
         return 100
     else:
-        return 100 * (x.max() - x.min()) / x.mean()
+        return float(100 * (x.max() - x.min()) / x.mean())
+
+
+def _is_time_window(window):
+    """Check if the window is a time span (e.g. "15min") instead of a number of rows."""
+    return not isinstance(window, (int, np.integer))
+
+
+def _window_tail(df, window, start=None):
+    """Return the rows of df needed to complete the rolling windows of new rows.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Data already received.
+    window : int, str, pandas.Timedelta
+        Window size for rolling calculation (see filter_data).
+    start : pandas.Timestamp, optional
+        Time of the first row that will be calculated again. If None, only
+        rows after the last row of df are considered.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Last rows of df.
+    """
+    if start is None:
+        position = len(df)
+        start = df.index[-1] if len(df) else None
+    else:
+        position = df.index.searchsorted(start, side="left")
+
+    if not _is_time_window(window):
+        first = position - (window - 1)
+    elif start is None:
+        first = 0
+    else:
+        # one row before the window is kept, so that the rows after start are
+        # not considered in the initial (incomplete) windows
+        first = df.index.searchsorted(start - pd.Timedelta(window), side="right") - 1
+
+    return df.iloc[max(first, 0) :]
+
+
+def _rolling_data(df, window=3):
+    """Calculate the rolling fluctuation and mean of dataframe columns.
+
+    Rolling max, min and mean are calculated with the pandas reductions in a
+    single rolling pass, instead of calling fluctuation for each window.
+    Windows with mean equal to zero have fluctuation equal to 100.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame, numpy.ndarray
+        Data with one column for each parameter.
+    window : int, str, pandas.Timedelta, optional
+        Window size for rolling calculation. Number of rows, or a time span
+        (e.g. "15min") for data with a DatetimeIndex. The default is 3.
+
+    Returns
+    -------
+    fluctuation_df, mean_df : pandas.DataFrame
+        Dataframes with fluctuation and mean values.
+    """
+    if not isinstance(df, pd.DataFrame):
+        df = pd.DataFrame(df)
+    rolling = df.apply(pd.to_numeric).rolling(window=window)
+    mean_df = rolling.mean()
+    fluctuation_df = 100 * (rolling.max() - rolling.min()) / mean_df
+    fluctuation_df = fluctuation_df.mask(mean_df == 0, 100).fillna(0.0)
+
+    if _is_time_window(window):
+        # rows at the beginning do not have a complete window
+        if len(df):
+            complete = df.index >= df.index[0] + pd.Timedelta(window)
+            fluctuation_df, mean_df = fluctuation_df[complete], mean_df[complete]
+        return fluctuation_df, mean_df
+
+    return fluctuation_df[window - 1 :], mean_df[window - 1 :]
+
+
+def _resample(mean_df, rule):
+    """Aggregate the filtered data in periods.
+
+    The values for each period are the mean of the valid rows. Periods
+    without valid rows have the mean of all rows and are flagged as invalid.
+    Periods without rows are removed.
+    """
+    valid = mean_df["valid"]
+    values = mean_df.drop(columns="valid")
+    all_values = values.resample(rule).mean()
+    resampled = values[valid].resample(rule).mean().reindex(all_values.index)
+    resampled = resampled.fillna(all_values)
+    resampled["valid"] = valid.astype(float).resample(rule).max() == 1
+
+    return resampled[valid.resample(rule).count() > 0]
 
 
 def fluctuation_data(df, window=3):
@@ -37,10 +134,11 @@ def fluctuation_data(df, window=3):
 
     Parameters
     ----------
-    df : pandas.DataFrame
+    df : pandas.DataFrame, numpy.ndarray
         Dataframe with data to be filtered.
-    window : int, optional
-        Window size for rolling calculation. The default is 3.
+    window : int, str, pandas.Timedelta, optional
+        Window size for rolling calculation. Number of rows, or a time span
+        (e.g. "15min") for data with a DatetimeIndex. The default is 3.
 
     Returns
     -------
@@ -53,26 +151,15 @@ def fluctuation_data(df, window=3):
     >>> import pandas as pd
     >>> df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
     >>> fluctuation_data(df)
-         a    b
-    0  0.0  0.0
-    1  0.0  0.0
-    2  0.0  0.0
+           a     b
+    2  100.0  40.0
     >>> df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
     >>> fluctuation_data(df, window=2)
-            a    b
-    0     0.0  0.0
-    1  1000.0  0.0
-    2  1000.0  0.0
+               a          b
+    1  66.666667  22.222222
+    2  40.000000  18.181818
     """
-    fluctuation_df = (
-        df.apply(pd.to_numeric)
-        .rolling(
-            window=window,
-        )
-        .apply(fluctuation)
-        .fillna(0.0)
-    )
-    fluctuation_df = fluctuation_df[window - 1 :]
+    fluctuation_df, _ = _rolling_data(df, window=window)
     return fluctuation_df
 
 
@@ -83,10 +170,11 @@ def mean_data(df, window=3):
 
     Parameters
     ----------
-    df : pandas.DataFrame
+    df : pandas.DataFrame, numpy.ndarray
         Dataframe with data to be filtered.
-    window : int, optional
-        Window size for rolling calculation. The default is 3.
+    window : int, str, pandas.Timedelta, optional
+        Window size for rolling calculation. Number of rows, or a time span
+        (e.g. "15min") for data with a DatetimeIndex. The default is 3.
 
     Returns
     -------
@@ -98,26 +186,16 @@ def mean_data(df, window=3):
     --------
     >>> import pandas as pd
     >>> df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
-    >>> fluctuation_data(df)
+    >>> mean_data(df)
          a    b
-    0  0.0  0.0
-    1  0.0  0.0
-    2  0.0  0.0
+    2  2.0  5.0
     >>> df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
-    >>> fluctuation_data(df, window=2)
-            a    b
-    0     0.0  0.0
-    1  1000.0  0.0
-    2  1000.0  0.0
+    >>> mean_data(df, window=2)
+         a    b
+    1  1.5  4.5
+    2  2.5  5.5
     """
-    mean_df = (
-        df.apply(pd.to_numeric)
-        .rolling(
-            window=window,
-        )
-        .mean()
-    )
-    mean_df = mean_df[window - 1 :]
+    _, mean_df = _rolling_data(df, window=window)
     return mean_df
 
 
@@ -129,6 +207,7 @@ def filter_data(
     pressure_fluctuation=2,
     speed_fluctuation=0.5,
     drop_invalid_values=True,
+    resample=None,
 ):
     """Filter data according to fluctuation values.
 
@@ -143,14 +222,21 @@ def filter_data(
     As per ASME PTC 10-1997, the minimum duration of a test point is 15 minutes.
     Assuming that we need a minimum of 3 measurements to calculate the fluctuation, the
     time span between each measurement is 7.5 minutes.
+    For data with irregular or high frequency samples (e.g. 1 s), the window can
+    be given as a time span (e.g. window="15min") for a DataFrame with a
+    DatetimeIndex, and the results can be aggregated with resample (e.g.
+    resample="15min"), so that a single row for each period is used in the
+    thermodynamic calculations.
 
     Parameters
     ----------
     df : pandas.DataFrame
         Dataframe with data to be filtered.
-    window : int, optional
+    window : int, str, pandas.Timedelta, optional
         Window size for rolling calculation, meaning how many rolls will be used
-        to calculate the fluctuation.
+        to calculate the fluctuation, or a time span (e.g. "15min") for data with a
+        DatetimeIndex. Rows without a complete window at the beginning of the data
+        are removed.
         The default is 3.
     data_type : dict
         Dictionary with data types for each column.
@@ -168,6 +254,11 @@ def filter_data(
         Drop invalid values from the dataframe.
         If false, a column 'valid' will be added to the dataframe with True for valid.
         The default is True.
+    resample : str, pandas.Timedelta, optional
+        Period (e.g. "15min") used to aggregate the filtered data (DatetimeIndex
+        only). Each period has the mean of its valid rows and is valid if it has
+        valid rows. If None, data is not aggregated.
+        The default is None.
 
     Returns
     -------
@@ -180,60 +271,149 @@ def filter_data(
     >>> df = pd.DataFrame({'a': [1, 2, 3, 4, 4.01, 4.02], 'b': [4, 5, 6, 6.01, 6.02, 6.03]})
     >>> data_type = {'a': 'pressure', 'b': 'temperature'}
     >>> filter_data(df, window=3, data_type=data_type)
+          a     b  valid
+    5  4.01  6.02   True
     """
-    fluctuation_df = fluctuation_data(df, window=window)
-    mean_df = mean_data(df, window=window)
+    fluctuation_df, mean_df = _rolling_data(df, window=window)
     mean_df["valid"] = True
     # filter mean_df based on fluctuation_df max values
+    for column, property_type in data_type.items():
+        if property_type == "pressure":
+            max_fluctuation = pressure_fluctuation
+            # remove pressure values below 0
+            invalid = mean_df[column] < 0
+        elif property_type == "temperature":
+            max_fluctuation = temperature_fluctuation
+            # remove temperature values below 0
+            invalid = mean_df[column] < 0
+        elif property_type == "speed":
+            max_fluctuation = speed_fluctuation
+            # remove speed values below 1
+            invalid = mean_df[column] < 1
+        elif property_type == "delta_p":
+            # delta_p is only available if the flow is calculated
+            if column not in mean_df.columns:
+                continue
+            max_fluctuation = 100
+            # remove pressure values equal to 0
+            invalid = mean_df[column] <= 0
+        else:
+            raise ValueError(
+                f"Invalid data type for column {column}. "
+                "Valid data types are: pressure, temperature and speed."
+            )
+        invalid |= fluctuation_df[column] > max_fluctuation
+        if drop_invalid_values:
+            mean_df[column] = mean_df[column].mask(invalid)
+        else:
+            mean_df.loc[invalid, "valid"] = False
+
     if drop_invalid_values:
-        for column, property_type in data_type.items():
-            if property_type == "pressure":
-                max_fluctuation = pressure_fluctuation
-                # remove pressure values below 0
-                mean_df.loc[mean_df[column] < 0, column] = None
-            elif property_type == "temperature":
-                max_fluctuation = temperature_fluctuation
-                # remove temperature values below 0
-                mean_df.loc[mean_df[column] < 0, column] = None
-            elif property_type == "speed":
-                max_fluctuation = speed_fluctuation
-                # remove speed values below 1
-                mean_df.loc[mean_df[column] < 1, column] = None
-            elif property_type == "delta_p":
-                max_fluctuation = 100
-                # remove pressure values equal to 0
-                if "delta_p" in mean_df.columns:
-                    mean_df.loc[mean_df[column] <= 0, column] = None
-            else:
-                raise ValueError(
-                    f"Invalid data type for column {column}. "
-                    "Valid data types are: pressure, temperature and speed."
-                )
-            mean_df.loc[fluctuation_df[column] > max_fluctuation, column] = None
         mean_df = mean_df.dropna()
-    else:
-        for column, property_type in data_type.items():
-            if property_type == "pressure":
-                max_fluctuation = pressure_fluctuation
-                # remove pressure values below 0
-                mean_df.loc[mean_df[column] < 0, "valid"] = False
-            elif property_type == "temperature":
-                max_fluctuation = temperature_fluctuation
-                # remove temperature values below 0
-                mean_df.loc[mean_df[column] < 0, "valid"] = False
-            elif property_type == "speed":
-                max_fluctuation = speed_fluctuation
-                # remove speed values below 1
-                mean_df.loc[mean_df[column] < 1, "valid"] = False
-            elif property_type == "delta_p":
-                max_fluctuation = 100
-                # remove pressure values equal to 0
-                if "delta_p" in mean_df.columns:
-                    mean_df.loc[mean_df[column] <= 0, "valid"] = False
-            else:
-                raise ValueError(
-                    f"Invalid data type for column {column}. "
-                    "Valid data types are: pressure, temperature and speed."
-                )
-            mean_df.loc[fluctuation_df[column] > max_fluctuation, "valid"] = False
+
+    if resample is not None:
+        mean_df = _resample(mean_df, resample)
+
     return mean_df
+
+
+def filter_data_chunks(
+    chunks,
+    window=3,
+    data_type=None,
+    temperature_fluctuation=0.5,
+    pressure_fluctuation=2,
+    speed_fluctuation=0.5,
+    drop_invalid_values=True,
+    resample=None,
+):
+    """Filter data read in chunks.
+
+    Each chunk is filtered with :py:func:`filter_data`. The last rows of a
+    chunk (window - 1 rows, or the rows within the time window) are carried to
+    the next one, so that the results are the same as filtering all data at
+    once, while only one chunk is kept in memory. With resample, the last
+    period of each chunk is yielded with the next chunk, since it may continue
+    there.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Iterable with pandas.DataFrame objects (e.g. the reader returned by
+        pandas.read_csv with chunksize).
+    window : int, str, pandas.Timedelta, optional
+        Window size for rolling calculation, meaning how many rolls will be used
+        to calculate the fluctuation, or a time span (e.g. "15min") for data with a
+        DatetimeIndex. Rows without a complete window at the beginning of the data
+        are removed.
+        The default is 3.
+    data_type : dict
+        Dictionary with data types for each column.
+        Values for data_type can be: "pressure", "temperature", "speed".
+    temperature_fluctuation : float, optional
+        Maximum fluctuation for temperature data.
+        The default is 0.5.
+    pressure_fluctuation : float, optional
+        Maximum fluctuation for pressure data.
+        The default is 2.
+    speed_fluctuation : float, optional
+        Maximum fluctuation for speed data.
+        The default is 0.5.
+    drop_invalid_values : bool, optional
+        Drop invalid values from the dataframe.
+        If false, a column 'valid' will be added to the dataframe with True for valid.
+        The default is True.
+    resample : str, pandas.Timedelta, optional
+        Period (e.g. "15min") used to aggregate the filtered data.
+        The default is None.
+
+    Yields
+    ------
+    pandas.DataFrame
+        Filtered dataframe for each chunk.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({'a': [1, 2, 3, 4, 4.01, 4.02], 'b': [4, 5, 6, 6.01, 6.02, 6.03]})
+    >>> data_type = {'a': 'pressure', 'b': 'temperature'}
+    >>> chunks = (df[i : i + 2] for i in range(0, len(df), 2))
+    >>> pd.concat(filter_data_chunks(chunks, data_type=data_type))
+          a     b  valid
+    5  4.01  6.02   True
+    """
+    tail = None
+    last = None
+    # filtered rows of the last period, which may continue in the next chunk
+    pending = None
+    for chunk in chunks:
+        if tail is not None:
+            chunk = pd.concat([tail, chunk])
+        filtered = filter_data(
+            chunk,
+            window=window,
+            data_type=data_type,
+            temperature_fluctuation=temperature_fluctuation,
+            pressure_fluctuation=pressure_fluctuation,
+            speed_fluctuation=speed_fluctuation,
+            drop_invalid_values=drop_invalid_values,
+        )
+        if last is not None and _is_time_window(window):
+            filtered = filtered[filtered.index > last]
+        last = chunk.index[-1]
+        tail = _window_tail(chunk, window)
+
+        if resample is not None:
+            if pending is not None:
+                filtered = pd.concat([pending, filtered])
+            resampled = _resample(filtered, resample)
+            if len(resampled):
+                pending = filtered[filtered.index >= resampled.index[-1]]
+                filtered = resampled.iloc[:-1]
+            else:
+                filtered = resampled
+
+        yield filtered
+
+    if pending is not None:
+        yield _resample(pending, resample)
@@ -1,17 +1,18 @@
 """Module for performance evaluation based on historical data."""
 
-import multiprocessing
 import zipfile
+import numpy as np
 import toml
 import pandas as pd
 import io
 import pickle
 from .data_io import filter_data
-from .state import State
+from .data_io.processing import _is_time_window, _resample, _window_tail
+from .state import State, StateArray
 from .point import Point
-from .fo import FlowOrifice
+from .fo import calc_flow_batch
 from .impeller import Impeller
-from . import Q_
+from . import Q_, parallel
 from sklearn.cluster import KMeans
 from tqdm.auto import tqdm
 
@@ -35,6 +36,7 @@ class Evaluation:
         verbose=False,
         n_clusters=5,
         calculate_points=True,
+        resample=None,
         **kwargs,
     ):
         """Initialize the evaluation class.
@@ -52,9 +54,10 @@ class Evaluation:
             - Suction temperature: should be 'Ts' (degK) in the DataFrame;
             - Discharge temperature: should be 'Td' (degK) in the DataFrame;
             - Speed: should be 'speed' (rad/s) in the DataFrame.
-        window : int, optional
+        window : int, str, optional
             Window size for rolling calculation, meaning how many rolls will be used
-            to calculate the fluctuation.
+            to calculate the fluctuation, or a time span (e.g. "15min") for data
+            with a DatetimeIndex.
             The default is 3.
         data_units : dict
             Dictionary with data units for each column.
@@ -83,6 +86,12 @@ class Evaluation:
         calculate_points : bool, optional
             If True, calculates the performance points for the given data.
             The default is True.
+        resample : str, optional
+            Period (e.g. "15min") used to aggregate the filtered data before the
+            flow and points are calculated, so that a single point is calculated
+            for each period (see ccp.data_io.filter_data).
+            If None, a point is calculated for each row.
+            The default is None.
         verbose : bool, optional
             If True, shows progress bar.
 
@@ -110,6 +119,7 @@ class Evaluation:
         self.d = d
         self.tappings = tappings
         self.n_clusters = n_clusters
+        self.resample = resample
 
         # check if we are loading from a zip file where the impellers are available
         if kwargs.get("impellers_new") is None:
@@ -130,6 +140,7 @@ class Evaluation:
             temperature_fluctuation=self.temperature_fluctuation,
             pressure_fluctuation=self.pressure_fluctuation,
             speed_fluctuation=self.speed_fluctuation,
+            resample=self.resample,
         )
 
         df = self.calculate_flow(df)
@@ -148,6 +159,16 @@ class Evaluation:
         kmeans.fit(data_norm)
         self.kmeans = kmeans
 
+        # the largest distance from a sample to its cluster center is used to
+        # check if new data is represented by the clusters (see append)
+        distance = kmeans.transform(data_norm).min(axis=1)
+        self.cluster_radius = np.array(
+            [distance[kmeans.labels_ == i].max() for i in range(kmeans.n_clusters)]
+        )
+        self._samples_fitted = len(df)
+        self._samples_appended = 0
+        self._samples_outside = 0
+
         # Format results as a DataFrame
         df["cluster"] = kmeans.labels_
         for i in range(kmeans.n_clusters):
@@ -182,56 +203,38 @@ class Evaluation:
         if not ("flow_v" in df.columns or "flow_m" in df.columns):
             calculate_flow = True
 
-        # create density column
-        df["v_s"] = 0
-        df["speed_sound"] = 0
-
-        state = State(
-            p=Q_(df.ps[0], self.data_units["ps"]),
-            T=Q_(df.Ts[0], self.data_units["Ts"]),
-            fluid=self.operation_fluid,
-        )
-
-        for i, row in df.iterrows():
-            # check if flow_v or flow_m are in df columns, otherwise calculate flow
-
-            if calculate_flow:
-                if "p_downstream" in df.columns:
-                    state_upstream = False
-                    state.update(
-                        p=Q_(row.p_downstream, self.data_units["p_downstream"]),
-                        T=Q_(row.Ts, self.data_units["Ts"]),
-                    )
-                elif "p_upstream" in df.columns:
-                    state_upstream = True
-                    state.update(
-                        p=Q_(row.p_upstream, self.data_units["p_upstream"]),
-                        T=Q_(row.Ts, self.data_units["Ts"]),
-                    )
-                else:
-                    raise ValueError(
-                        "Pressure upstream/downstream fo not found in the DataFrame."
-                    )
-
-                delta_p = Q_(row.delta_p, self.data_units["delta_p"])
-                fo = FlowOrifice(
-                    state,
-                    delta_p,
-                    self.D,
-                    self.d,
-                    tappings=self.tappings,
-                    state_upstream=state_upstream,
+        Ts = Q_(df["Ts"].array, self.data_units["Ts"])
+        if calculate_flow:
+            # states are calculated for all rows at once and the flow orifice
+            # equations are solved with arrays (see ccp.fo.calc_flow_batch)
+            delta_p = Q_(df["delta_p"].array, self.data_units["delta_p"])
+            if "p_downstream" in df.columns:
+                p_upstream = (
+                    Q_(df["p_downstream"].array, self.data_units["p_downstream"])
+                    + delta_p
                 )
-                df.loc[i, "flow_m"] = fo.qm.m
-                df.loc[i, "flow_v"] = (fo.qm * state.v()).m
+            elif "p_upstream" in df.columns:
+                p_upstream = Q_(df["p_upstream"].array, self.data_units["p_upstream"])
             else:
-                state.update(
-                    p=Q_(row.ps, self.data_units["ps"]),
-                    T=Q_(row.Ts, self.data_units["Ts"]),
+                raise ValueError(
+                    "Pressure upstream/downstream fo not found in the DataFrame."
                 )
 
-            df.loc[i, "v_s"] = state.v().m
-            df.loc[i, "speed_sound"] = state.speed_sound().m
+            state = StateArray(p=p_upstream, T=Ts, fluid=self.operation_fluid)
+            flow_m = calc_flow_batch(
+                state, delta_p, self.D, self.d, tappings=self.tappings
+            )
+            df["flow_m"] = flow_m.to("kg/s").m
+            df["flow_v"] = (flow_m * state.v()).to("m³/s").m
+        else:
+            state = StateArray(
+                p=Q_(df["ps"].array, self.data_units["ps"]),
+                T=Ts,
+                fluid=self.operation_fluid,
+            )
+
+        df["v_s"] = state.v().to("m³/kg").m
+        df["speed_sound"] = state.speed_sound().to("m/s").m
 
         # check if flow_v or flow_m is in the DataFrame
         if (not calculate_flow) and (
@@ -285,102 +288,190 @@ class Evaluation:
                 pressure_fluctuation=self.pressure_fluctuation,
                 speed_fluctuation=self.speed_fluctuation,
                 drop_invalid_values=drop_invalid_values,
+                resample=self.resample,
             )
 
         df = self.calculate_flow(df)
 
+        return self._calculate_points(df)
+
+    def _calculate_points(self, df):
+        """Calculate the performance points for filtered data with flow."""
         # assign to a cluster
-        df["cluster"] = 0
-
-        for i, row in df.iterrows():
-            new_data = row[["speed_sound", "ps", "Ts"]].array
-            new_data = (new_data - self.data_mean.array) / self.data_std.array
-            df.loc[i, "cluster"] = self.kmeans.predict(new_data.reshape(1, -1))[0]
-
-        points = []
-        expected_points = []
-
-        args_list = []
-        for i, row in df.iterrows():
-            # calculate point
-            arg_dict = {
-                "flow_v": row.flow_v,
-                "speed": Q_(row.speed, self.data_units["speed"]),
-                "suc": State(
-                    p=Q_(row.ps, self.data_units["ps"]),
-                    T=Q_(row.Ts, self.data_units["Ts"]),
-                    fluid=self.operation_fluid,
-                ),
-                "disch": State(
-                    p=Q_(row.pd, self.data_units["pd"]),
-                    T=Q_(row.Td, self.data_units["Td"]),
-                    fluid=self.operation_fluid,
-                ),
-                "imp_new": self.impellers_new[int(row.cluster)],
-                "valid": row.valid,
-            }
+        df["cluster"] = self.kmeans.predict(self._normalize(df))
+
+        # rows are sent to the workers as arrays (SI units), the impellers for
+        # each cluster are sent once to each worker
+        units = self.data_units
+        rows = np.column_stack(
+            [
+                Q_(df["ps"].array, units["ps"]).to("Pa").m,
+                Q_(df["Ts"].array, units["Ts"]).to("degK").m,
+                Q_(df["pd"].array, units["pd"]).to("Pa").m,
+                Q_(df["Td"].array, units["Td"]).to("degK").m,
+                df["flow_v"].to_numpy(dtype=float),
+                Q_(df["speed"].array, units["speed"]).to("rad/s").m,
+                df["cluster"].to_numpy(dtype=float),
+                df["valid"].to_numpy(dtype=float),
+            ]
+        )
 
-            args_list.append(arg_dict)
-
-        with multiprocessing.Pool() as pool:
-            print("Calculating points...")
-            points += tqdm(pool.imap(create_points_parallel, args_list))
-            print("Calculating expected points...")
-            expected_points += tqdm(pool.imap(get_interpolated_point, args_list))
-
-        # start column with -1, if this value remains, it means that the point was not calculated due to invalid data
-        df["eff"] = -1
-        df["head"] = -1
-        df["power"] = -1
-        df["p_disch"] = -1
-        df["expected_eff"] = -1
-        df["expected_head"] = -1
-        df["expected_power"] = -1
-        df["expected_p_disch"] = -1
-        df["delta_eff"] = -1
-        df["delta_head"] = -1
-        df["delta_power"] = -1
-        df["delta_p_disch"] = -1
-
-        for i, point_op, point_expected in zip(df.index, points, expected_points):
-            # if point_op is None, it means that the point was not calculated due to invalid data
-            if point_op is not None:
-                df.loc[i, "eff"] = point_op.eff.m
-                df.loc[i, "head"] = point_op.head.m
-                df.loc[i, "power"] = point_op.power.m
-                df.loc[i, "p_disch"] = point_op.disch.p("bar").m
-                df.loc[i, "expected_eff"] = point_expected.eff.m
-                df.loc[i, "expected_head"] = point_expected.head.m
-                df.loc[i, "expected_power"] = point_expected.power.m
-                df.loc[i, "expected_p_disch"] = point_expected.disch.p("bar").m
-                df.loc[i, "delta_eff"] = (point_op.eff - point_expected.eff).m * 100
-                df.loc[i, "delta_head"] = (
-                    (point_op.head - point_expected.head) / point_expected.head
-                ).m * 100
-                df.loc[i, "delta_power"] = (
-                    (point_op.power - point_expected.power) / point_expected.power
-                ).m * 100
-                df.loc[i, "delta_p_disch"] = (
-                    (point_op.disch.p("bar") - point_expected.disch.p("bar"))
-                    / point_expected.disch.p("bar")
-                ).m * 100
+        print("Calculating points...")
+        try:
+            results = parallel.map_chunks(
+                calculate_points_chunk,
+                rows,
+                initializer=set_points_context,
+                initargs=(self.impellers_new, self.operation_fluid),
+            )
+        finally:
+            # context set in this process by the serial and thread backends
+            _points_context.clear()
+        results = pd.DataFrame(results, index=df.index, columns=_points_columns)
+
+        # fill with -1 the points that were not calculated due to invalid data
+        calculated = results.notna().all(axis=1)
+        for param in _points_columns:
+            df[param] = results[param].where(calculated, -1)
+        delta_eff = (results.eff - results.expected_eff) * 100
+        df["delta_eff"] = delta_eff.where(calculated, -1)
+        for param in ["head", "power", "p_disch"]:
+            expected = results[f"expected_{param}"]
+            delta = (results[param] - expected) / expected * 100
+            df[f"delta_{param}"] = delta.where(calculated, -1)
 
         # plot eff in plot with colormap showing the time
+        df["timescale"] = _timescale(df.index)
 
-        # define the time delta and use that as a scale from 0 to 100
-        total_time = df.index[-1] - df.index[0]
+        return df
+
+    def _normalize(self, df):
+        """Normalize the data used for clustering with the fitted mean and std."""
+        data = df[["speed_sound", "ps", "Ts"]]
+        return (data - self.data_mean) / self.data_std
+
+    def append(self, new_data, refit=False, max_drift=0.1):
+        """Calculate the performance points for new data.
+
+        Only the new rows are filtered and calculated (with resample, the last
+        period is calculated again and replaced in self.df). The last rows of the
+        current data are used to complete the rolling window, new points are
+        assigned to the clusters already fitted and calculated with the
+        converted impellers. Clusters are fitted again and impellers are
+        converted again only if refit is True or if the data drift from the
+        clusters (see max_drift).
+
+        Parameters
+        ----------
+        new_data : pandas.DataFrame
+            Historical data for the new samples, with the same columns and units
+            as the data used in the initialization.
+        refit : bool, optional
+            If True, fit the clusters, convert the impellers and calculate the
+            points again for all data (see :py:meth:`refit`).
+            The default is False.
+        max_drift : float, optional
+            Maximum ratio of samples outside the clusters (farther from the
+            center than the samples used in the fit). If exceeded, the clusters
+            are fitted again. If None, drift is not checked.
+            The default is 0.1.
 
-        # create column for timescale
-        df["timescale"] = 0
+        Returns
+        -------
+        df : pandas.DataFrame
+            DataFrame with the calculated points for the new data.
+        """
+        last = self.data.index[-1]
+        # with resample, the last period is calculated again with the new data
+        start = None
+        if self.resample is not None and len(self.df):
+            start = self.df.index[-1]
 
-        if len(df) > 1:
-            for i, row in df.iterrows():
-                # calculate seconds from i sample to start. Remember that i here is the index which is datetime
-                sample_time = i - df.index[0]
-                df.loc[i, "timescale"] = sample_time.seconds / total_time.seconds
+        # rows needed to complete the rolling window for the first new samples
+        tail = _window_tail(self.data, self.window, start)
+        self.data = pd.concat([self.data, new_data])
+
+        df = filter_data(
+            pd.concat([tail, new_data]),
+            data_type=self.data_type,
+            window=self.window,
+            temperature_fluctuation=self.temperature_fluctuation,
+            pressure_fluctuation=self.pressure_fluctuation,
+            speed_fluctuation=self.speed_fluctuation,
+        )
+        if start is not None:
+            df = _resample(df[df.index >= start], self.resample)
+        elif self.resample is not None:
+            df = _resample(df[df.index > last], self.resample)
+        elif _is_time_window(self.window):
+            df = df[df.index > last]
+        df = self.calculate_flow(df)
+
+        distance = self.kmeans.transform(self._normalize(df))
+        cluster = distance.argmin(axis=1)
+        outside = distance.min(axis=1) > self.cluster_radius[cluster]
+        self._samples_appended += len(df)
+        self._samples_outside += int(outside.sum())
+
+        if refit or (max_drift is not None and self.drift > max_drift):
+            self.refit()
+            return self.df.loc[df.index]
+
+        df = self._calculate_points(df)
+        self.df = pd.concat([self.df.drop(df.index, errors="ignore"), df])
+        self.df["timescale"] = _timescale(self.df.index)
 
         return df
 
+    def stream(self, frames, refit=False, max_drift=0.1):
+        """Calculate the performance points for frames of data as they arrive.
+
+        Each frame is added with :py:meth:`append`.
+
+        Parameters
+        ----------
+        frames : iterable
+            Iterable (e.g. a generator reading from the historian) that yields
+            pandas.DataFrame objects with new samples.
+        refit : bool, optional
+            If True, fit the clusters again for each frame.
+            The default is False.
+        max_drift : float, optional
+            Maximum ratio of samples outside the clusters before fitting them
+            again. The default is 0.1.
+
+        Yields
+        ------
+        df : pandas.DataFrame
+            DataFrame with the calculated points for each frame.
+        """
+        for frame in frames:
+            yield self.append(frame, refit=refit, max_drift=max_drift)
+
+    @property
+    def drift(self):
+        """Ratio of samples outside the clusters since they were fitted.
+
+        A sample is outside the clusters if it is farther from the center of
+        its cluster than all samples used in the fit.
+        """
+        return self._samples_outside / (self._samples_fitted + self._samples_appended)
+
+    def refit(self, calculate_points=True):
+        """Fit the clusters, convert the impellers and calculate the points.
+
+        All data (including data added with :py:meth:`append`) is used.
+
+        Parameters
+        ----------
+        calculate_points : bool, optional
+            If True, calculates the performance points for all data.
+            The default is True.
+        """
+        self._run()
+        if calculate_points:
+            self.df = self.calculate_points()
+
     def save(self, path):
         # create zip file and save dataframe as parquet and impellers
         with zipfile.ZipFile(path, "w") as zip_file:
@@ -393,6 +484,10 @@ class Evaluation:
             for i, imp in enumerate(self.impellers_new):
                 with zip_file.open(f"imp_new_{i}.pickle", "w") as pickle_file:
                     pickle.dump(imp, pickle_file)
+            # fitted clusters, used to add new data with append
+            with zip_file.open("clusters.pickle", "w") as pickle_file:
+                clusters = {attr: getattr(self, attr) for attr in _cluster_attributes}
+                pickle.dump(clusters, pickle_file)
             # create dict with arguments and save to toml
             args_dict = {
                 "operation_fluid": self.operation_fluid,
@@ -401,6 +496,7 @@ class Evaluation:
                 "temperature_fluctuation": self.temperature_fluctuation,
                 "pressure_fluctuation": self.pressure_fluctuation,
                 "speed_fluctuation": self.speed_fluctuation,
+                "resample": self.resample,
             }
             zip_file.writestr("args.toml", toml.dumps(args_dict))
 
@@ -442,34 +538,123 @@ class Evaluation:
                 temperature_fluctuation=args_dict["temperature_fluctuation"],
                 pressure_fluctuation=args_dict["pressure_fluctuation"],
                 speed_fluctuation=args_dict["speed_fluctuation"],
+                resample=args_dict.get("resample"),
                 impellers_new=impellers_new,
                 df=df,
             )
             evaluation.impellers_new = impellers_new
+            # load fitted clusters
+            if "clusters.pickle" in zip_file.namelist():
+                with zip_file.open("clusters.pickle", "r") as pickle_file:
+                    clusters = pickle.load(pickle_file)
+                for attr, value in clusters.items():
+                    setattr(evaluation, attr, value)
 
             return evaluation
 
 
-def create_points_parallel(x):
-    if not x["valid"]:
-        return None
-    # delete arguments not used for point calculation
-    del x["imp_new"]
-    del x["valid"]
-    try:
-        p = Point(**x)
-    except:
-        print("Error for point with args:", x)
-        return None
-    return p
-
-
-def get_interpolated_point(x):
-    if not x["valid"]:
-        return None
-    try:
-        imp_new = x["imp_new"]
-        expected_point = imp_new.point(flow_v=x["flow_v"], speed=x["speed"])
-    except:
-        print("Error for expected point with args:", x)
-    return expected_point
+# attributes of the fitted clusters, saved with the evaluation
+_cluster_attributes = (
+    "kmeans",
+    "data_mean",
+    "data_std",
+    "cluster_radius",
+    "_samples_fitted",
+    "_samples_appended",
+    "_samples_outside",
+)
+
+
+def _timescale(index):
+    """Time from start for each sample, scaled from 0 to 1.
+
+    Parameters
+    ----------
+    index : pandas.DatetimeIndex
+        Time of each sample.
+
+    Returns
+    -------
+    timescale : numpy.ndarray, int
+        Timescale for each sample, 0 if there is a single sample.
+    """
+    if len(index) < 2:
+        return 0
+
+    # define the time delta and use that as a scale from 0 to 1
+    total_time = index[-1] - index[0]
+    # seconds from each sample to start
+    sample_time = index - index[0]
+
+    return np.asarray(sample_time.total_seconds() / total_time.total_seconds())
+
+
+# columns returned by calculate_points_chunk (SI units, p_disch in bar)
+_points_columns = [
+    "eff",
+    "head",
+    "power",
+    "p_disch",
+    "expected_eff",
+    "expected_head",
+    "expected_power",
+    "expected_p_disch",
+]
+
+# impellers and fluid used by calculate_points_chunk in each worker
+_points_context = {}
+
+
+def set_points_context(impellers, fluid):
+    """Set the impellers (one for each cluster) and fluid used in a worker."""
+    _points_context["impellers"] = impellers
+    _points_context["fluid"] = fluid
+
+
+def calculate_points_chunk(rows):
+    """Calculate the operation and expected points for a chunk of rows.
+
+    Parameters
+    ----------
+    rows : numpy.ndarray
+        Array with columns ps, Ts, pd, Td, flow_v, speed (SI units), cluster
+        and valid.
+
+    Returns
+    -------
+    results : numpy.ndarray
+        Array with the columns in _points_columns. Rows that are not valid or
+        that could not be calculated are filled with NaN.
+    """
+    impellers = _points_context["impellers"]
+    fluid = _points_context["fluid"]
+    results = np.full((len(rows), len(_points_columns)), np.nan)
+
+    for i, (ps, Ts, pd_, Td, flow_v, speed, cluster, valid) in enumerate(rows):
+        if not valid:
+            continue
+        try:
+            suc = State(p=ps, T=Ts, fluid=fluid)
+            disch = State(p=pd_, T=Td, fluid=fluid)
+            point = Point(suc=suc, disch=disch, flow_v=flow_v, speed=speed)
+        except Exception:
+            print("Error for point with args:", rows[i])
+            continue
+        try:
+            expected_point = impellers[int(cluster)].point(flow_v=flow_v, speed=speed)
+        except Exception:
+            print("Error for expected point with args:", rows[i])
+            continue
+
+        results[i] = [
+            point.eff.m,
+            point.head.m,
+            point.power.m,
+            point.disch.p("bar").m,
+            expected_point.eff.m,
+            expected_point.head.m,
+            expected_point.power.m,
+            expected_point.disch.p("bar").m,
+        ]
+
+    return results
@@ -3,7 +3,7 @@
 import numpy as np
 from scipy.optimize import newton
 from ccp.config.units import check_units
-from ccp import Q_
+from ccp import Q_, StateArray
 
 
 class FlowOrifice:
@@ -106,22 +106,7 @@ class FlowOrifice:
 
         def update_Reyn(Reyn):
             Reyn = Q_(Reyn, "dimensionless")
-            # calc C
-            C = (
-                0.5961
-                + 0.0261 * beta**2
-                - 0.216 * beta**8
-                + 0.000521 * (1e6 * beta / Reyn) ** 0.7
-                + (0.0188 + 0.0063 * (19000 * beta / Reyn) ** 0.8)
-                * beta**3.5
-                * (1e6 / Reyn) ** 0.3
-                + (0.043 + 0.080 * np.e ** (-10 * L1) - 0.123 * np.e ** (-7 * L1))
-                * (1 - 0.11 * (19000 * beta / Reyn) ** 0.8)
-                * (beta**4 / (1 - beta**4))
-                - 0.031 * (M2 - 0.8 * M2**1.1) * beta**1.3
-            )
-            if D < Q_(71.12, "mm"):
-                C += 0.011 * (0.75 - beta) * (2.8 - D / Q_(25.4, "mm"))
+            C = _discharge_coefficient(beta, Reyn, L1, M2, D)
             self.flow_m = (
                 C
                 / (np.sqrt(1 - beta**4))
@@ -136,3 +121,122 @@ class FlowOrifice:
         newton(update_Reyn, 1e8, tol=1e-5)
 
         return self.flow_m.to("kg/s")
+
+
+def _discharge_coefficient(beta, Reyn, L1, M2, D):
+    """Discharge coefficient (Reader-Harris/Gallagher equation, ISO 5167-2).
+
+    Works with pint quantities or with floats and arrays in SI units.
+    """
+    C = (
+        0.5961
+        + 0.0261 * beta**2
+        - 0.216 * beta**8
+        + 0.000521 * (1e6 * beta / Reyn) ** 0.7
+        + (0.0188 + 0.0063 * (19000 * beta / Reyn) ** 0.8)
+        * beta**3.5
+        * (1e6 / Reyn) ** 0.3
+        + (0.043 + 0.080 * np.e ** (-10 * L1) - 0.123 * np.e ** (-7 * L1))
+        * (1 - 0.11 * (19000 * beta / Reyn) ** 0.8)
+        * (beta**4 / (1 - beta**4))
+        - 0.031 * (M2 - 0.8 * M2**1.1) * beta**1.3
+    )
+    if D < Q_(71.12, "mm"):
+        C += 0.011 * (0.75 - beta) * (2.8 - D / Q_(25.4, "mm"))
+
+    return C
+
+
+@check_units
+def calc_flow_batch(
+    state, delta_p, D, d, tappings="flange", tol=1e-12, max_iterations=100
+):
+    """Mass flow through a flow orifice for arrays of upstream states.
+
+    Array version of :py:meth:`FlowOrifice.calc_flow`. The ISO 5167 equations
+    are solved for all rows at once, with a fixed-point iteration on the
+    Reynolds number.
+
+    Parameters
+    ----------
+    state : ccp.StateArray
+        States upstream the orifice.
+    delta_p : pint.Quantity, array-like
+        Pressure drop across the orifice (Pa).
+    D : float, pint.Quantity
+        Pipe diameter (m).
+    d : float, pint.Quantity
+        Orifice diameter (m).
+    tappings : str, optional
+        Tappings of the orifice.
+        Options are "flange", "corner" or "D D/2".
+        Default is "flange".
+    tol : float, optional
+        Relative tolerance for the Reynolds number. Default is 1e-12.
+    max_iterations : int, optional
+        Maximum number of iterations. Default is 100.
+
+    Returns
+    -------
+    flow_m : pint.Quantity
+        Mass flow (kg/s) for each state. NaN for states that could not be
+        calculated.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> from ccp.fo import calc_flow_batch
+    >>> Q_ = ccp.Q_
+    >>> fluid = {"R134A": 0.018, "R1234ZE": 31.254, "N2": 67.588, "o2": 1.14}
+    >>> state = ccp.StateArray(p=Q_([10], "bar"), T=Q_([40], "degC"), fluid=fluid)
+    >>> flow_m = calc_flow_batch(state, Q_(0.1, "bar"), Q_(250, "mm"), Q_(170, "mm"))
+    >>> flow_m.to("kg/h")
+    <Quantity([36408.68715534], 'kilogram / hour')>
+    """
+    if tappings not in ("corner", "D D/2", "flange"):
+        raise ValueError('tappings must be "corner", "D D/2" or "flange"')
+    if not isinstance(state, StateArray):
+        raise TypeError("state should be a ccp.StateArray.")
+
+    D = D.to("m").m
+    d = d.to("m").m
+    delta_p = np.asarray(delta_p.to("Pa").m, dtype=float)
+    p1 = state.p("Pa").m
+    p2 = p1 - delta_p
+    rho = state.rho("kg/m**3").m
+    mu = state.viscosity("Pa*s").m
+    k = state.kv().m
+
+    beta = d / D
+    e = 1 - (0.351 + 0.256 * (beta**4) + 0.93 * (beta**8)) * (1 - (p2 / p1) ** (1 / k))
+    if tappings == "corner":
+        L1 = L2 = 0
+    elif tappings == "D D/2":
+        L1 = 1
+        L2 = 0.47
+    elif tappings == "flange":
+        L1 = L2 = 0.0254 / D
+    M2 = 2 * L2 / (1 - beta)
+    D_quantity = Q_(D, "m")
+
+    # flow_m = C * flow_factor, with C depending on the Reynolds number
+    flow_factor = (
+        1 / (np.sqrt(1 - beta**4)) * e * (np.pi / 4) * d**2 * np.sqrt(2 * delta_p * rho)
+    )
+
+    def discharge_coefficient(Reyn):
+        C = _discharge_coefficient(beta, Reyn, L1, M2, D_quantity)
+        return Q_(C).m_as("dimensionless")
+
+    Reyn = np.full_like(flow_factor, 1e8)
+    for _ in range(max_iterations):
+        flow_m = discharge_coefficient(Reyn) * flow_factor
+        Reyn_new = 4 * flow_m / (mu * np.pi * D)
+        converged = np.abs(Reyn_new - Reyn) <= tol * np.abs(Reyn_new)
+        Reyn = Reyn_new
+        if np.all(converged | np.isnan(Reyn)):
+            break
+
+    flow_m = discharge_coefficient(Reyn) * flow_factor
+
+    return Q_(flow_m, "kg/s")
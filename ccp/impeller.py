@@ -1,7 +1,6 @@
 """Module to define impeller class."""
 
 import csv
-import multiprocessing
 import warnings
 
 import toml
@@ -12,12 +11,18 @@ from pathlib import Path
 import numpy as np
 import plotly.graph_objects as go
 from openpyxl import Workbook
-from scipy.interpolate import interp1d, UnivariateSpline, PchipInterpolator
-from scipy.optimize import fsolve
+from scipy.interpolate import UnivariateSpline, PchipInterpolator
 
-from ccp import Q_, State, Point, Curve
+import ccp
+from ccp import Q_, State, StateArray, Point, Curve, PointTable
+from ccp.point import _polytropic_batch_methods, phi, psi, mach, reynolds
 from ccp.config.units import check_units
-from ccp.config.utilities import r_getattr, r_setattr
+from ccp.config.utilities import (
+    LRUCache,
+    r_getattr,
+    r_setattr,
+    add_lazy_attribute,
+)
 from ccp.data_io.read_csv import read_data_from_engauge_csv
 from ccp.plotly_theme import tableau_colors
 
@@ -45,12 +50,11 @@ def impeller_state_parameter(impeller_state_object, attr):
 
 
 class ImpellerState:
-    def __init__(self, curves_state):
+    def __init__(self, curves_state, impeller=None, name="disch"):
         self.curves_state = curves_state
-
-        for attr in ["p", "T", "h", "s", "rho"]:
-            func = impeller_state_parameter(self, attr)
-            setattr(self, attr, func)
+        # used for plots such as impeller.disch.p_plot
+        self.impeller = impeller
+        self.name = name
 
     def __getitem__(self, item):
         return self.curves_state.__getitem__(item)
@@ -134,7 +138,7 @@ class ImpellerPlotFunction:
             attr_str = attr.split(".")[-1]
         else:
             attr_str = attr
-        
+
         try:
             attr_units = kwargs.get(
                 f"{attr_str}_units", r_getattr(impeller_object.curves[0], attr).units
@@ -320,6 +324,44 @@ def compare_impeller_plot_function(impeller_object, attr):
     return CompareImpellerPlotFunction(impeller_object, attr)
 
 
+def _impeller_state_plot_function(impeller_state_object, attr):
+    return impeller_plot_function(
+        impeller_state_object.impeller, f"{impeller_state_object.name}.{attr}"
+    )
+
+
+def _impeller_state_compare_function(impeller_state_object, attr):
+    return compare_impeller_plot_function(
+        impeller_state_object.impeller, f"{impeller_state_object.name}.{attr}"
+    )
+
+
+# set a method for each state attribute in the list, created on first access
+for _attr in ["p", "T", "h", "s", "rho"]:
+    add_lazy_attribute(ImpellerState, _attr, impeller_state_parameter, _attr)
+    add_lazy_attribute(
+        ImpellerState, f"{_attr}_plot", _impeller_state_plot_function, _attr
+    )
+    add_lazy_attribute(
+        ImpellerState, f"{_attr}_compare", _impeller_state_compare_function, _attr
+    )
+
+
+# impeller parameters with <param>_plot and <param>_compare methods
+_impeller_parameters = [
+    "head",
+    "eff",
+    "power",
+    "power_shaft",
+    "torque",
+    "psi",
+    "phi",
+    "flow_v",
+    "flow_m",
+    "speed",
+]
+
+
 class Impeller:
     """An impeller with a performance map.
 
@@ -373,42 +415,64 @@ class Impeller:
             curves.append(curve)
             setattr(self, f"curve_{int(curve.speed.magnitude)}", curve)
         self.curves = curves
-        self.disch = ImpellerState([c.disch for c in self.curves])
-
-        for attr in [
-            "disch.p",
-            "disch.T",
-            "disch.h",
-            "disch.s",
-            "disch.rho",
-            "head",
-            "eff",
-            "power",
-            "power_shaft",
-            "torque",
-            "psi",
-            "phi",
-            "flow_v",
-            "flow_m",
-            "speed",
-        ]:
+        self.disch = ImpellerState([c.disch for c in self.curves], self, "disch")
+
+        # for disch.p etc values are defined in ImpellerState
+        for attr in _impeller_parameters:
             values = []
-            # for disch.p etc values are defined in _Impeller_State
-            if "." not in attr:
-                for c in self.curves:
-                    param = r_getattr(c, attr)
-                    values.append(param.magnitude)
-                units = param.units
-                r_setattr(self, attr, Q_(values, units))
-
-            r_setattr(self, f"{attr}_plot", impeller_plot_function(self, attr))
-            r_setattr(
-                self, f"{attr}_compare", compare_impeller_plot_function(self, attr)
-            )
+            for c in self.curves:
+                param = r_getattr(c, attr)
+                values.append(param.magnitude)
+            units = param.units
+            r_setattr(self, attr, Q_(values, units))
 
     def __getitem__(self, item):
         return self.points.__getitem__(item)
 
+    def __getstate__(self):
+        attributes = self.__dict__.copy()
+        attributes.pop("_curve_cache", None)
+        attributes.pop("_curve_cache_key", None)
+
+        return attributes
+
+    def _get_curve_cache(self):
+        """Return the cache with the interpolated curves.
+
+        The cache is created on first use and recreated if the impeller
+        curves or their points change, including points replaced in place in
+        the curve lists.
+        """
+        for curve in self.curves:
+            # update curves with points modified in place before building the key
+            curve._current_data()
+        key = tuple((id(curve), curve._points_ids) for curve in self.curves)
+        if self.__dict__.get("_curve_cache_key") != key:
+            self._curve_cache = LRUCache(maxsize=ccp.config.CURVE_CACHE_SIZE)
+            self._curve_cache_key = key
+        self._curve_cache.maxsize = ccp.config.CURVE_CACHE_SIZE
+
+        return self._curve_cache
+
+    def curve_cache_info(self):
+        """Statistics for the cache of interpolated curves.
+
+        Curves calculated with :py:meth:`curve` are kept in a cache, with
+        keys given by the speed rounded to ccp.config.CURVE_CACHE_DIGITS
+        significant digits. Up to ccp.config.CURVE_CACHE_SIZE curves are
+        kept (0 disables the cache).
+
+        Returns
+        -------
+        info : CacheInfo
+            Named tuple with hits, misses, maxsize and currsize.
+        """
+        return self._get_curve_cache().info()
+
+    def curve_cache_clear(self):
+        """Remove all curves from the cache and reset its counters."""
+        self._get_curve_cache().clear()
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             points_other = sorted(other.points, key=lambda x: x.flow_v)
@@ -446,19 +510,15 @@ class Impeller:
         if flow_v is None and flow_m is None:
             raise ValueError("Either flow_v or flow_m must be defined.")
 
-        current_curve = self.curve(speed)
-        if flow_m:
-            flow_v = current_curve.points[0].suc.v() * flow_m
-
-        func_T = interp1d(
-            current_curve.flow_v.m, current_curve.disch.T().m, fill_value="extrapolate"
-        )
-        func_p = interp1d(
-            current_curve.flow_v.m, current_curve.disch.p().m, fill_value="extrapolate"
+        suc, speed, power_losses, flows, disch_Ts, disch_ps = self._interpolate_speed(
+            speed
         )
+        if flow_m:
+            flow_v = suc.v() * flow_m
 
-        min_flow_v = min(current_curve.flow_v)
-        max_flow_v = max(current_curve.flow_v)
+        flow_v_units = self.curves[0].flow_v.units
+        min_flow_v = Q_(flows[0], flow_v_units)
+        max_flow_v = Q_(flows[-1], flow_v_units)
         if flow_v < min_flow_v or max_flow_v < flow_v:
             warnings.warn(
                 f"Expected point is being extrapolated.\n"
@@ -466,52 +526,18 @@ class Impeller:
                 f"Expected point flow: {flow_v:.3f~P}"
             )
 
-        flow_at_min_p = (
-            np.log(current_curve[-1].disch.p().m + np.exp(4 * max_flow_v.m))
-        ) / 4
-        flow_at_min_T = (
-            np.log(
-                current_curve[-1].disch.T().m
-                - current_curve.points[0].suc.T().m
-                + np.exp(4 * max_flow_v.m)
-            )
-        ) / 4
-
-        # Extrapolation code for choke region
-        if flow_v <= max_flow_v:
-            disch_p = func_p(flow_v)
-        elif flow_v.m < flow_at_min_p:
-            disch_p = round(
-                current_curve[-1].disch.p().m
-                + np.exp(4 * current_curve[-1].flow_v.m)
-                - np.exp(4 * flow_v.m),
-                2,
-            )
-        else:
-            disch_p = 0.001
-
-        if flow_v <= max_flow_v:
-            disch_T = func_T(flow_v)
-        elif flow_v.m < flow_at_min_T:
-            disch_T = round(
-                current_curve[-1].disch.T().m
-                + np.exp(4 * current_curve[-1].flow_v.m)
-                - np.exp(4 * flow_v.m),
-                2,
-            )
-        else:
-            disch_T = current_curve.points[0].suc.T().m
+        disch_p, disch_T = _discharge_values(
+            flow_v.to(flow_v_units).m, flows, disch_ps, disch_Ts, suc.T().m
+        )
 
         p0 = self.points[0]
         disch = State(p=disch_p, T=disch_T, fluid=p0.suc.fluid)
 
-        power_losses = current_curve.power_losses
-
         point = Point(
             suc=p0.suc,
             disch=disch,
             flow_v=flow_v,
-            speed=current_curve.speed,
+            speed=speed,
             b=p0.b,
             D=p0.D,
             power_losses=power_losses,
@@ -519,6 +545,221 @@ class Impeller:
 
         return point
 
+    @check_units
+    def points_batch(self, flow_v=None, flow_m=None, speed=None, materialize=False):
+        """Calculate points in the performance map for arrays of flow and speed.
+
+        Array version of :py:meth:`point`. Queries are grouped by speed, so
+        that the curve for each speed is interpolated once, and the discharge
+        states are calculated with a single ccp.StateArray. Head and
+        efficiency are calculated with the batch functions for the method set
+        in ccp.config.POLYTROPIC_METHOD. Methods without a batch version
+        (e.g. 'huntington') are calculated point by point.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, array-like
+            Volumetric flow (m³/s).
+        flow_m : pint.Quantity, array-like
+            Mass flow (kg/s).
+        speed : pint.Quantity, array-like, float
+            Speed (rad/s). A single value is used for all flows.
+        materialize : bool, optional
+            If True, a list with ccp.Point objects is returned instead of
+            the table. Default is False.
+
+        Returns
+        -------
+        points : ccp.PointTable, list
+            Table with one row for each flow and speed, in the order they
+            were given, or a list with ccp.Point if materialize is True.
+        """
+        if speed is None:
+            raise ValueError("Speed must be defined.")
+        if flow_v is None and flow_m is None:
+            raise ValueError("Either flow_v or flow_m must be defined.")
+
+        suc = self.points[0].suc
+        if flow_v is None:
+            flow_v = suc.v() * flow_m
+        flow_v, speed = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(flow_v.to("m**3/s").m, dtype=float)),
+            np.atleast_1d(np.asarray(speed.to("rad/s").m, dtype=float)),
+        )
+        size = len(flow_v)
+
+        flow_v_units = self.curves[0].flow_v.units
+        flow = Q_(flow_v, "m**3/s").to(flow_v_units).m
+        disch_p = np.empty(size)
+        disch_T = np.empty(size)
+        power_losses = np.empty(size)
+        extrapolated = 0
+
+        speeds, inverse = np.unique(speed, return_inverse=True)
+        for i, speed_value in enumerate(speeds):
+            rows = inverse.reshape(-1) == i
+            _, _, losses, flows, disch_Ts, disch_ps = self._interpolate_speed(
+                Q_(speed_value, "rad/s")
+            )
+            disch_p[rows], disch_T[rows] = _discharge_values(
+                flow[rows], flows, disch_ps, disch_Ts, suc.T().m
+            )
+            power_losses[rows] = losses.to("W").m
+            extrapolated += np.count_nonzero(
+                (flow[rows] < flows[0]) | (flows[-1] < flow[rows])
+            )
+
+        if extrapolated:
+            warnings.warn(
+                f"{extrapolated} of {size} expected points are being extrapolated."
+            )
+
+        p0 = self.points[0]
+        polytropic_method = ccp.config.POLYTROPIC_METHOD
+        if materialize or polytropic_method not in _polytropic_batch_methods:
+            points = [
+                Point(
+                    suc=suc,
+                    disch=State(p=disch_p[i], T=disch_T[i], fluid=suc.fluid),
+                    flow_v=flow_v[i],
+                    speed=speed[i],
+                    b=p0.b,
+                    D=p0.D,
+                    power_losses=power_losses[i],
+                    polytropic_method=polytropic_method,
+                )
+                for i in range(size)
+            ]
+            if materialize:
+                return points
+            return PointTable.from_points(points)
+
+        disch = StateArray(p=disch_p, T=disch_T, fluid=suc.fluid, EOS=suc.EOS)
+        suc_columns = {
+            attr: np.full(size, getattr(suc, f"{attr}_si")())
+            for attr in ["p", "T", "h", "s", "rho"]
+        }
+        args = (suc_columns, disch)
+        if polytropic_method == "schultz":
+            disch_s = StateArray(
+                p=disch_p, s=suc_columns["s"], fluid=suc.fluid, EOS=suc.EOS
+            )
+            args += (disch_s,)
+        head_func, eff_func = _polytropic_batch_methods[polytropic_method]
+        head = head_func(*args).m
+        eff = eff_func(*args).m
+        flow_m = flow_v * suc.rho_si()
+        flow_v = Q_(flow_v, "m**3/s")
+        speed = Q_(speed, "rad/s")
+
+        data = dict(
+            flow_v=flow_v,
+            flow_m=flow_m,
+            speed=speed,
+            head=head,
+            eff=eff,
+            power=flow_m * head / eff,
+            power_losses=power_losses,
+            phi=phi(flow_v, speed, p0.D),
+            psi=psi(Q_(head, "J/kg"), speed, p0.D),
+            mach=mach(suc, speed, p0.D),
+            reynolds=reynolds(suc, speed, p0.b, p0.D),
+            b=p0.b,
+            D=p0.D,
+        )
+        for attr in ["p", "T", "h", "s", "rho"]:
+            data[f"suc_{attr}"] = suc_columns[attr]
+            data[f"disch_{attr}"] = getattr(disch, attr)()
+
+        return PointTable(
+            data, fluid=suc.fluid, EOS=suc.EOS, polytropic_method=polytropic_method
+        )
+
+    def _interpolate_speed(self, speed):
+        """Interpolate the curve values for a speed.
+
+        The flow, discharge temperature and discharge pressure of each point
+        in the two closest curves are linearly interpolated with the speed,
+        without calculating the states for the interpolated curve.
+
+        Parameters
+        ----------
+        speed : pint.Quantity
+            Speed (rad/s).
+
+        Returns
+        -------
+        suc : ccp.State
+            Suction state for the interpolated curve.
+        speed : pint.Quantity
+            Speed for the interpolated curve.
+        power_losses : pint.Quantity
+            Power losses for the interpolated curve.
+        flow_v, disch_T, disch_p : np.ndarray
+            Values for each point in the curve sorted by flow, in the curve
+            units.
+        """
+        # curve values, updated if the points were modified in place
+        data = [curve._current_data() for curve in self.curves]
+
+        # handle case where we only have one curve and can't interpolate
+        if len(self.curves) == 1:
+            curve = self.curves[0]
+            if speed is not None and not np.allclose(speed, curve.speed):
+                raise ValueError(f"Can only interpolate for speed={curve.speed}")
+            return (
+                curve.points[0].suc,
+                curve.speed,
+                curve.power_losses,
+                data[0]["flow_v"],
+                data[0]["disch_T"],
+                data[0]["disch_p"],
+            )
+
+        power_losses = calculate_power_losses(
+            power_losses_ref=self.curves[0].power_losses,
+            speed_ref=self.curves[0].speed,
+            speed=speed,
+        )
+
+        speeds = np.array([curve.speed.magnitude for curve in self.curves])
+        idx_0, idx_1 = find_closest_speeds(speeds, speed.magnitude)
+        factor = (speed.magnitude - speeds[idx_0]) / (speeds[idx_1] - speeds[idx_0])
+
+        # points are paired by their position in each curve
+        data_0 = data[idx_0]
+        data_1 = data[idx_1]
+        if len(data_0) != len(data_1):
+            raise ValueError(
+                f"Curves for speeds {self.curves[idx_0].speed:.6g~P} and "
+                f"{self.curves[idx_1].speed:.6g~P} have {len(data_0)} and "
+                f"{len(data_1)} points. Curves are interpolated point by point, "
+                f"so they should have the same number of points."
+            )
+        flow_v, disch_T = get_interpolated_values(
+            factor,
+            data_0["flow_v"],
+            data_0["disch_T"],
+            data_1["flow_v"],
+            data_1["disch_T"],
+        )
+        _, disch_p = get_interpolated_values(
+            factor,
+            data_0["flow_v"],
+            data_0["disch_p"],
+            data_1["flow_v"],
+            data_1["disch_p"],
+        )
+        values = [flow_v, disch_T, disch_p]
+        order = np.argsort(flow_v, kind="stable")
+
+        return (
+            self.points[0].suc,
+            speed,
+            power_losses,
+            *[v[order] for v in values],
+        )
+
     @check_units
     def curve(self, speed=None):
         """Calculate specific point in the performance map.
@@ -526,6 +767,10 @@ class Impeller:
         Given a speed this method will calculate a curve in the
         impeller map according to these arguments.
 
+        Interpolated curves are cached (see :py:meth:`curve_cache_info`), so
+        the same ccp.Curve object is returned for repeated speeds and it
+        should not be modified.
+
         Parameters
         ----------
         speed : pint.Quantity, float
@@ -536,10 +781,8 @@ class Impeller:
         curve : ccp.Curve
             Point in the performance map.
         """
-        speeds = np.array([curve.speed.magnitude for curve in self.curves])
-
         # handle case where we only have one curve and can't interpolate
-        if len(speeds) == 1:
+        if len(self.curves) == 1:
             current_curve = self.curves[0]
             if speed is not None and not np.allclose(speed, current_curve.speed):
                 raise ValueError(
@@ -547,49 +790,28 @@ class Impeller:
                 )
             return current_curve
 
-        # calculate power losses
-        power_losses = calculate_power_losses(
-            power_losses_ref=self.curves[0].power_losses,
-            speed_ref=self.curves[0].speed,
-            speed=speed,
-        )
-
-        closest_curves_idxs = find_closest_speeds(speeds, speed.magnitude)
-        curves = [
-            self.curves[closest_curves_idxs[0]],
-            self.curves[closest_curves_idxs[1]],
-        ]
+        cache = self._get_curve_cache()
+        if cache.maxsize > 0:
+            digits = ccp.config.CURVE_CACHE_DIGITS
+            cache_key = float(f"{speed.to('rad/s').m:.{digits}g}")
+            current_curve = cache.get(cache_key)
+            if current_curve is not None:
+                return current_curve
 
-        # calculate factor
-        speed_range = curves[1].speed.magnitude - curves[0].speed.magnitude
-        factor = (speed.magnitude - curves[0].speed.magnitude) / speed_range
+        suc, speed, power_losses, flows, disch_Ts, disch_ps = self._interpolate_speed(
+            speed
+        )
 
         current_curve = []
         p0 = self.points[0]
-        number_of_points = len(curves[0])
-
-        for i in range(number_of_points):
-            flow_T, disch_T = get_interpolated_values(
-                factor,
-                curves[0].flow_v.magnitude[i],
-                curves[0][i].disch.T().m,
-                curves[1].flow_v.magnitude[i],
-                curves[1][i].disch.T().m,
-            )
-            flow_p, disch_p = get_interpolated_values(
-                factor,
-                curves[0].flow_v.magnitude[i],
-                curves[0][i].disch.p().m,
-                curves[1].flow_v.magnitude[i],
-                curves[1][i].disch.p().m,
-            )
 
+        for flow_v, disch_T, disch_p in zip(flows, disch_Ts, disch_ps):
             disch = State(p=disch_p, T=disch_T, fluid=p0.suc.fluid)
 
             p = Point(
-                suc=p0.suc,
+                suc=suc,
                 disch=disch,
-                flow_v=(flow_T + flow_p) / 2,
+                flow_v=flow_v,
                 speed=speed,
                 power_losses=power_losses,
                 b=p0.b,
@@ -599,6 +821,8 @@ class Impeller:
             current_curve.append(p)
 
         current_curve = Curve(current_curve)
+        if cache.maxsize > 0:
+            cache.put(cache_key, current_curve)
 
         return current_curve
 
@@ -639,27 +863,31 @@ class Impeller:
                 )
             original_impeller = original_impeller[np.argmin(np.abs(speed_sound_diff))]
 
-        for curve in original_impeller.curves:
-            with multiprocessing.Pool() as pool:
-                converter_args = [(p, suc, find) for p in curve]
-                converted_points = pool.map(converter, converter_args)
+        # convert the points for all curves in a single call to the workers
+        converter_args = [
+            (p, suc, find) for curve in original_impeller.curves for p in curve
+        ]
+        converted = iter(ccp.parallel.map(converter, converter_args))
 
-                if speed is None or speed == "same":
-                    speed_mean = np.mean([p.speed.magnitude for p in converted_points])
-                else:
-                    speed_mean = speed
+        for curve in original_impeller.curves:
+            converted_points = [next(converted) for p in curve]
 
-                converted_points = [
-                    Point.convert_from(
-                        p,
-                        suc=p.suc,
-                        find="volume_ratio",
-                        speed=speed_mean,
-                    )
-                    for p in converted_points
-                ]
+            if speed is None or speed == "same":
+                speed_mean = np.mean([p.speed.magnitude for p in converted_points])
+            else:
+                speed_mean = speed
+
+            converted_points = [
+                Point.convert_from(
+                    p,
+                    suc=p.suc,
+                    find="volume_ratio",
+                    speed=speed_mean,
+                )
+                for p in converted_points
+            ]
 
-                all_converted_points += converted_points
+            all_converted_points += converted_points
 
         converted_impeller = cls(all_converted_points)
         if speed == "same":
@@ -823,7 +1051,7 @@ class Impeller:
         if list(Q_(1, flow_units).dimensionality.keys())[0] == "[mass]":
             flow_type = "mass"
 
-        points = []
+        all_args = []
 
         curves = {}
         for k, v in args.items():
@@ -946,8 +1174,9 @@ class Impeller:
                     arg_dict["flow_m"] = Q_(flow, flow_units)
                 args_list.append(arg_dict)
 
-            with multiprocessing.Pool() as pool:
-                points += pool.map(create_points_parallel, args_list)
+            all_args += args_list
+
+        points = list(ccp.parallel.map(create_points_parallel, all_args))
 
         return cls(points)
 
@@ -1321,6 +1550,13 @@ class Impeller:
                     writer.writerow({"Speed (RPM)": speed, "Volume Flow (m3/h)": flow})
 
 
+for _param in _impeller_parameters:
+    add_lazy_attribute(Impeller, f"{_param}_plot", impeller_plot_function, _param)
+    add_lazy_attribute(
+        Impeller, f"{_param}_compare", compare_impeller_plot_function, _param
+    )
+
+
 def find_closest_speeds(array, value):
     diff = array - value
     idx = np.abs(diff).argmin()
@@ -1338,15 +1574,91 @@ def find_closest_speeds(array, value):
     return np.array(idx)
 
 
+def _interpolate_linear(x, xp, fp):
+    """Linear interpolation with extrapolation from the first and last points.
+
+    x can be a float or an array.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.interp(x, xp, fp)
+    y = np.where(x < xp[0], fp[0] + (x - xp[0]) * (fp[1] - fp[0]) / (xp[1] - xp[0]), y)
+    y = np.where(
+        x > xp[-1], fp[-1] + (x - xp[-1]) * (fp[-1] - fp[-2]) / (xp[-1] - xp[-2]), y
+    )
+
+    return y if y.ndim else float(y)
+
+
+def _discharge_values(flow, flows, disch_ps, disch_Ts, suc_T):
+    """Discharge pressure and temperature for flows in an interpolated curve.
+
+    Values are linearly interpolated between the curve points (and
+    extrapolated before the first point). After the last point, values are
+    extrapolated to the choke region with an exponential decay.
+
+    Parameters
+    ----------
+    flow : float, np.ndarray
+        Volumetric flow, in the curve units.
+    flows, disch_ps, disch_Ts : np.ndarray
+        Flow, discharge pressure and discharge temperature for each point in
+        the curve, sorted by flow.
+    suc_T : float
+        Suction temperature, in the curve units.
+
+    Returns
+    -------
+    disch_p, disch_T : float, np.ndarray
+        Discharge pressure and temperature.
+    """
+    flow = np.asarray(flow, dtype=float)
+    flow_at_min_p = (np.log(disch_ps[-1] + np.exp(4 * flows[-1]))) / 4
+    flow_at_min_T = (np.log(disch_Ts[-1] - suc_T + np.exp(4 * flows[-1]))) / 4
+
+    # Extrapolation code for choke region
+    with np.errstate(over="ignore"):
+        choke_p = np.round(disch_ps[-1] + np.exp(4 * flows[-1]) - np.exp(4 * flow), 2)
+        choke_T = np.round(disch_Ts[-1] + np.exp(4 * flows[-1]) - np.exp(4 * flow), 2)
+    disch_p = np.where(
+        flow <= flows[-1],
+        _interpolate_linear(flow, flows, disch_ps),
+        np.where(flow < flow_at_min_p, choke_p, 0.001),
+    )
+    disch_T = np.where(
+        flow <= flows[-1],
+        _interpolate_linear(flow, flows, disch_Ts),
+        np.where(flow < flow_at_min_T, choke_T, suc_T),
+    )
+
+    if disch_p.ndim:
+        return disch_p, disch_T
+    return float(disch_p), float(disch_T)
+
+
 def get_interpolated_values(fac, flow_0, val_0, flow_1, val_1):
-    x0 = [flow_0, val_0]
-    if fac > 0.5:
-        x0 = [flow_1, val_1]
+    """Interpolate flow and a value between points of two curves.
+
+    This is the closed-form solution of system_to_interpolate: the flow is
+    interpolated with the speed factor and the value is taken on the line
+    between the two points. Arguments can be floats or arrays with the
+    values for all points in the curves.
 
-    result = fsolve(system_to_interpolate, x0, args=(fac, flow_0, val_0, flow_1, val_1))
+    Parameters
+    ----------
+    fac : float
+        Speed factor: (speed - speed_0) / (speed_1 - speed_0).
+    flow_0, val_0 : float, np.ndarray
+        Flow and value for the point in the first curve.
+    flow_1, val_1 : float, np.ndarray
+        Flow and value for the point in the second curve.
 
-    flow_x = result[0]
-    val_x = result[1]
+    Returns
+    -------
+    flow_x, val_x : float, np.ndarray
+        Interpolated flow and value.
+    """
+    flow_x = flow_0 + fac * (flow_1 - flow_0)
+    val_x = val_0 + fac * (val_1 - val_0)
 
     return flow_x, val_x
 
@@ -0,0 +1,329 @@
+"""Pool of workers used for parallel calculations.
+
+The backend is chosen with ccp.config.PARALLEL_BACKEND:
+
+- "serial": calculations are carried out in the current process;
+- "threads": a pool of threads;
+- "processes": a pool of processes (default);
+- a concurrent.futures.Executor supplied by the user.
+
+The number of workers is set with ccp.config.PARALLEL_MAX_WORKERS (None uses
+the number of processors). Calls with less than ccp.config.PARALLEL_MIN_SIZE
+items are calculated serially, since for small tasks starting the workers
+and sending the arguments is slower than the calculation itself.
+
+The thread or process pool is created on first use and reused by the
+following calls, so that the worker processes (and the ccp import with the
+REFPROP setup in each of them) are started only once per session. The pool
+is shut down when the interpreter exits.
+
+Examples
+--------
+>>> import ccp
+>>> ccp.parallel.configure(max_workers=2)
+>>> list(ccp.parallel.map(abs, [-1, 2]))
+[1, 2]
+>>> ccp.parallel.shutdown()
+"""
+
+import atexit
+import builtins
+import itertools
+import math
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+import ccp
+
+_backends = ("serial", "threads", "processes")
+
+_executor = None
+# (backend, max_workers) used to create the current executor
+_executor_key = None
+_lock = threading.Lock()
+# tokens that identify the initializer calls of map_chunks
+_tokens = itertools.count()
+# token of the last initializer call applied in this worker process
+_worker_token = None
+
+
+def _initializer():
+    """Load ccp (REFPROP setup, pint registry) once in each worker."""
+    import ccp  # noqa: F401
+
+
+def _config_values():
+    """Current values of the ccp.config settings used in the calculations."""
+    return {
+        k: v
+        for k, v in vars(ccp.config).items()
+        if k.isupper() and not k.startswith("PARALLEL_")
+    }
+
+
+class _Task:
+    """Callable sent to the worker processes with the settings from ccp.config.
+
+    Workers are started once, so changes in ccp.config (e.g. EOS or
+    POLYTROPIC_METHOD) made after that are applied before calling func.
+
+    If given, initializer(*initargs) is called before func, once for each
+    token in a worker. The arguments are pickled once when the task is
+    created, instead of once for each chunk sent to the workers.
+    """
+
+    def __init__(self, func, config, initializer=None, initargs=(), token=None):
+        self.func = func
+        self.config = config
+        self.initializer = initializer
+        self.initargs = pickle.dumps(initargs)
+        self.token = token
+
+    def __call__(self, x):
+        global _worker_token
+
+        for k, v in self.config.items():
+            setattr(ccp.config, k, v)
+        if self.initializer is not None and (
+            self.token is None or self.token != _worker_token
+        ):
+            self.initializer(*pickle.loads(self.initargs))
+            _worker_token = self.token
+        return self.func(x)
+
+
+def _backend():
+    """Return the backend set in ccp.config.PARALLEL_BACKEND.
+
+    Daemonic processes (e.g. workers of another pool) are not allowed to
+    create child processes, so the "processes" backend falls back to
+    "serial" in that case.
+    """
+    backend = ccp.config.PARALLEL_BACKEND
+    if isinstance(backend, Executor):
+        return backend
+    if backend not in _backends:
+        raise ValueError(
+            f"Parallel backend {backend!r} is not available. "
+            f"Options are: {', '.join(_backends)} or a concurrent.futures.Executor."
+        )
+    if backend == "processes" and multiprocessing.current_process().daemon:
+        return "serial"
+
+    return backend
+
+
+def _number_of_workers(executor):
+    """Number of workers used to split the tasks in chunks."""
+    workers = getattr(executor, "_max_workers", None)
+    if workers is None:
+        workers = ccp.config.PARALLEL_MAX_WORKERS or os.cpu_count() or 1
+
+    return workers
+
+
+def default_chunksize(size, workers):
+    """Number of items sent to a worker in each task.
+
+    Items are split in about 4 chunks per worker, as in
+    multiprocessing.Pool.map, so that the workers are kept busy while the
+    number of tasks (and the pickling overhead for each of them) is low.
+
+    Parameters
+    ----------
+    size : int
+        Number of items.
+    workers : int
+        Number of workers.
+
+    Returns
+    -------
+    chunksize : int
+
+    Examples
+    --------
+    >>> import ccp
+    >>> ccp.parallel.default_chunksize(1000, 4)
+    63
+    """
+    chunksize, extra = divmod(size, 4 * workers)
+    if extra:
+        chunksize += 1
+
+    return max(chunksize, 1)
+
+
+def configure(max_workers=None, executor=None, backend=None):
+    """Configure the executor used for parallel calculations.
+
+    This sets ccp.config.PARALLEL_BACKEND and ccp.config.PARALLEL_MAX_WORKERS.
+    The current pool is shut down and a new one is created on first use.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of workers. Default is the number of processors.
+    executor : concurrent.futures.Executor, optional
+        Executor supplied by the user. It is not shut down by ccp.
+    backend : str, optional
+        "serial", "threads" or "processes". Default is "processes" if
+        executor is not given.
+    """
+    shutdown()
+    if executor is not None:
+        backend = executor
+    elif backend is None:
+        backend = "processes"
+    ccp.config.PARALLEL_BACKEND = backend
+    ccp.config.PARALLEL_MAX_WORKERS = max_workers
+
+
+def get_executor():
+    """Return the executor for the configured backend.
+
+    The thread or process pool is created on first use, and recreated if
+    ccp.config.PARALLEL_BACKEND or ccp.config.PARALLEL_MAX_WORKERS change.
+
+    Returns
+    -------
+    executor : concurrent.futures.Executor, None
+        Executor, or None for the "serial" backend.
+    """
+    global _executor, _executor_key
+
+    backend = _backend()
+    if isinstance(backend, Executor):
+        return backend
+    if backend == "serial":
+        return None
+
+    with _lock:
+        key = (backend, ccp.config.PARALLEL_MAX_WORKERS)
+        if _executor is None or _executor_key != key:
+            if _executor is not None:
+                _executor.shutdown()
+            if backend == "processes":
+                _executor = ProcessPoolExecutor(
+                    max_workers=key[1], initializer=_initializer
+                )
+            else:
+                _executor = ThreadPoolExecutor(max_workers=key[1])
+            _executor_key = key
+
+        return _executor
+
+
+def map(func, iterable, chunksize=None):
+    """Apply func to each item of iterable with the configured backend.
+
+    Parameters
+    ----------
+    func : callable
+        Function with a single argument. For the process pool it has to be
+        defined at module level so that it can be pickled.
+    iterable : iterable
+        Arguments for func.
+    chunksize : int, optional
+        Number of items sent to a worker in each task (process pool only).
+        Default is given by :py:func:`default_chunksize`.
+
+    Returns
+    -------
+    results : iterator
+        Results in the same order as the arguments.
+    """
+    items = list(iterable)
+    executor = None
+    if len(items) >= ccp.config.PARALLEL_MIN_SIZE:
+        executor = get_executor()
+    if executor is None:
+        return builtins.map(func, items)
+
+    if isinstance(executor, ProcessPoolExecutor):
+        func = _Task(func, _config_values())
+        if chunksize is None:
+            chunksize = default_chunksize(len(items), _number_of_workers(executor))
+    else:
+        chunksize = 1
+
+    return executor.map(func, items, chunksize=chunksize)
+
+
+def map_chunks(func, array, initializer=None, initargs=()):
+    """Apply func to chunks of rows of an array and join the results.
+
+    The rows are split in chunks with :py:func:`default_chunksize`, so that
+    each task sends a compact array to the workers instead of one object per
+    row. Data shared by all chunks (e.g. impellers) should be set up with
+    initializer, which is called once in each worker.
+
+    For process executors, initializer and initargs are sent with the chunks
+    and the call is cached in each worker process under a token for this
+    call, so the persistent pool is reused. For the other backends
+    initializer is called once in the current process.
+
+    Parameters
+    ----------
+    func : callable
+        Function that takes an array with a chunk of rows and returns an
+        array with one row of results for each of them.
+    array : numpy.ndarray
+        Array with one row for each task.
+    initializer : callable, optional
+        Function called to set up the workers.
+    initargs : tuple, optional
+        Arguments for initializer.
+
+    Returns
+    -------
+    results : numpy.ndarray
+        Results for all rows, in the same order as array.
+    """
+    size = len(array)
+    executor = None
+    if size >= ccp.config.PARALLEL_MIN_SIZE:
+        executor = get_executor()
+    if executor is None:
+        if initializer is not None:
+            initializer(*initargs)
+        return func(array)
+
+    workers = _number_of_workers(executor)
+    chunks = np.array_split(array, math.ceil(size / default_chunksize(size, workers)))
+
+    if not isinstance(executor, ProcessPoolExecutor):
+        if initializer is not None:
+            initializer(*initargs)
+        return np.concatenate(list(executor.map(func, chunks)))
+
+    # pid in the token, since executors supplied by the user can be shared
+    token = (os.getpid(), next(_tokens))
+    task = _Task(func, _config_values(), initializer, initargs, token)
+    return np.concatenate(list(executor.map(task, chunks)))
+
+
+def shutdown(wait=True):
+    """Shut down the thread or process pool created by ccp.
+
+    Executors supplied by the user are not shut down.
+
+    Parameters
+    ----------
+    wait : bool, optional
+        If True, wait for the pending tasks to finish. Default is True.
+    """
+    global _executor, _executor_key
+
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+        _executor = None
+        _executor_key = None
+
+
+atexit.register(shutdown)
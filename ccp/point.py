@@ -1,15 +1,65 @@
-from copy import copy
+from collections import namedtuple
 
+import CoolProp.CoolProp as CP
 import numpy as np
 import toml
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from scipy.optimize import newton
+from scipy.optimize import newton, root_scalar
 
 import ccp.config
-from .state import State
+from .state import State, StateArray
 from ccp.config.units import check_units, Q_
-from ccp.config.utilities import r_getattr
+from ccp.config.utilities import r_getattr, add_lazy_attribute
+
+# arguments that define how a point is calculated (see Point._calc_from_*)
+_POINT_ARGUMENTS = (
+    "suc",
+    "disch",
+    "disch_p",
+    "flow_v",
+    "flow_m",
+    "speed",
+    "head",
+    "eff",
+    "power",
+    "phi",
+    "psi",
+    "volume_ratio",
+    "pressure_ratio",
+    "disch_T",
+    "power_losses",
+    "power_shaft",
+    "torque",
+)
+
+
+# point and state attributes with a <attr>_plot method
+_point_plot_attributes = ("head", "eff", "power", "power_shaft", "torque")
+_state_plot_attributes = ("p", "T", "h", "s", "rho")
+
+
+def _tokenize_calc_from(name):
+    """Split a _calc_from_* method name in the point arguments it uses.
+
+    Arguments are matched greedily from the longest name, so that
+    'disch_p_eff' is split in ('disch_p', 'eff') and not in ('disch', ...).
+
+    Returns None if the name can not be split in point arguments.
+    """
+    suffix = name[len("_calc_from_") :]
+    arguments = sorted(_POINT_ARGUMENTS, key=len, reverse=True)
+    tokens = []
+    while suffix:
+        for argument in arguments:
+            if suffix == argument or suffix.startswith(argument + "_"):
+                tokens.append(argument)
+                suffix = suffix[len(argument) + 1 :]
+                break
+        else:
+            return None
+
+    return tokens
 
 
 class Point:
@@ -167,8 +217,10 @@ class Point:
         if polytropic_method is None:
             polytropic_method = ccp.config.POLYTROPIC_METHOD
 
-        self.head_calc_func = globals()[f"head_pol_{polytropic_method}"]
-        self.eff_calc_func = globals()[f"eff_pol_{polytropic_method}"]
+        self.head_calc_func, self.eff_calc_func = _polytropic_functions(
+            polytropic_method
+        )
+        self.polytropic_method = polytropic_method
 
         self.suc = suc
         self.disch = disch
@@ -199,11 +251,6 @@ class Point:
         self.convection_constant = convection_constant
         self.casing_heat_loss = None
 
-        # dummy state used to avoid copying states
-        self._dummy_state = copy(self.suc)
-
-        kwargs_list = []
-        kwargs_dict = {}
         reasonable_ranges = {
             "eff": (0.3, 1.0),
             "head": (0, 1e15),
@@ -211,33 +258,47 @@ class Point:
         }
         out_of_range_dict = {}
 
-        for k in [
-            "suc",
-            "disch",
-            "disch_p",
-            "flow_v",
-            "flow_m",
-            "speed",
-            "head",
-            "eff",
-            "power",
-            "phi",
-            "psi",
-            "volume_ratio",
-            "pressure_ratio",
-            "disch_T",
-            "power_losses",
-            "power_shaft",
-            "torque",
-        ]:
-            if getattr(self, k) is not None:
-                kwargs_list.append(k)
-                kwargs_dict[k] = getattr(self, k)
+        kwargs_dict = {
+            k: v
+            for k, v in zip(
+                _POINT_ARGUMENTS,
+                (
+                    suc,
+                    disch,
+                    disch_p,
+                    flow_v,
+                    flow_m,
+                    speed,
+                    head,
+                    eff,
+                    power,
+                    phi,
+                    psi,
+                    volume_ratio,
+                    pressure_ratio,
+                    disch_T,
+                    power_losses,
+                    power_shaft,
+                    torque,
+                ),
+            )
+            if v is not None
+        }
 
-        kwargs_str = "_".join(sorted(kwargs_list))
+        try:
+            calc_from = self._dispatch_calc_from[frozenset(kwargs_dict)]
+        except KeyError:
+            valid = "\n".join(
+                sorted(", ".join(sorted(args)) for args in self._dispatch_calc_from)
+            )
+            raise ValueError(
+                f"A point can not be calculated from "
+                f"{', '.join(sorted(kwargs_dict))}.\n"
+                f"Valid combinations of arguments are:\n{valid}"
+            )
 
         try:
-            getattr(self, "_calc_from_" + kwargs_str)()
+            calc_from(self)
         except (ValueError, RuntimeError) as e:
             kwargs_repr = (
                 str(kwargs_dict)
@@ -262,8 +323,7 @@ class Point:
                 f"The following kwargs seems out of reasonable range: {out_of_range_dict}."
             )
 
-        self.reynolds = reynolds(self.suc, self.speed, self.b, self.D)
-        self.mach = mach(self.suc, self.speed, self.D)
+        self._calc_reynolds_mach()
 
         self.phi_ratio = Q_(1.0, "dimensionless")
         self.psi_ratio = Q_(1.0, "dimensionless")
@@ -275,15 +335,45 @@ class Point:
 
         self._add_point_plot()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_calc_from = cls._build_dispatch_calc_from()
+
+    @classmethod
+    def _build_dispatch_calc_from(cls):
+        """Map each set of arguments to the _calc_from_* method that uses it.
+
+        The table is built once per class, so subclasses that add or
+        override _calc_from_* methods get their own table.
+        """
+        dispatch = {}
+        for name in dir(cls):
+            if not name.startswith("_calc_from_"):
+                continue
+            tokens = _tokenize_calc_from(name)
+            if tokens is not None:
+                dispatch[frozenset(tokens)] = getattr(cls, name)
+
+        return dispatch
+
+    def _calc_reynolds_mach(self):
+        """Calculate the Reynolds and Mach numbers for the point."""
+        self.reynolds = reynolds(self.suc, self.speed, self.b, self.D)
+        self.mach = mach(self.suc, self.speed, self.D)
+
     def _add_point_plot(self):
-        """Add plot to point after point is fully defined."""
+        """Add plot to point after point is fully defined.
+
+        The plot methods (e.g. point.head_plot and point.suc.p_plot) are only
+        created on first access. Here the suction and discharge states are
+        bound to this point.
+        """
         for state in ["suc", "disch"]:
-            for attr in ["p", "T", "h", "s", "rho"]:
-                plot = plot_func(self, ".".join([state, attr]))
-                setattr(getattr(self, state), attr + "_plot", plot)
-        for attr in ["head", "eff", "power", "power_shaft", "torque"]:
-            plot = plot_func(self, attr)
-            setattr(self, attr + "_plot", plot)
+            state_object = getattr(self, state)
+            state_object._plot_point = (self, state)
+            # remove plots created for another point with the same state
+            for attr in _state_plot_attributes:
+                state_object.__dict__.pop(f"{attr}_plot", None)
 
     def __str__(self):
         return (
@@ -297,7 +387,7 @@ class Point:
         )
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if isinstance(other, Point):
             if (
                 self.suc == other.suc
                 and np.allclose(self.speed, other.speed)
@@ -404,24 +494,48 @@ class Point:
         # consider first an isentropic compression
         disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
 
-        def update_state(x, update_type):
-            if update_type == "pressure":
-                disch.update(rho=disch_rho, p=x)
-            elif update_type == "temperature":
-                disch.update(rho=disch_rho, T=x)
-            new_eff = self.eff_calc_func(self.suc, disch)
+        disch_rho_si = disch_rho.to("kg/m**3").magnitude
+        eff_si = eff.to("dimensionless").magnitude
+
+        def update_state(x, update_type, derivative=True):
+            if update_type == "p":
+                disch.update_si(rho=disch_rho_si, p=x)
+            elif update_type == "T":
+                disch.update_si(rho=disch_rho_si, T=x)
+            new_head = self.head_calc_func(self.suc, disch).magnitude
+            dh_disch = disch.h_si() - suc.h_si()
+            new_eff = new_head / dh_disch
             if not 0.0 < new_eff < 1.5:
                 raise ValueError("Efficiency did not converge")
+            if not derivative:
+                return new_eff - eff_si
+
+            dhead, dh = _head_derivative(suc, disch, new_head, update_type, "rho")
+            deff = (dhead * dh_disch - new_head * dh) / dh_disch**2
 
-            return (new_eff - eff).magnitude
+            return new_eff - eff_si, deff
 
         try:
-            newton(update_state, disch.T().magnitude, args=("temperature",), tol=1e-1)
+            result = _solve_disch(
+                lambda x, **kwargs: update_state(x, "T", **kwargs),
+                disch,
+                "T",
+                "rho",
+                xtol=1e-1,
+            )
+            disch.update_si(rho=disch_rho_si, T=result.root)
         except ValueError:
             # re-instantiate disch, since update with temperature not converging
             # might break the state
             disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
-            newton(update_state, disch.p().magnitude, args=("pressure",), tol=1e-1)
+            result = _solve_disch(
+                lambda x, **kwargs: update_state(x, "p", **kwargs),
+                disch,
+                "p",
+                "rho",
+                xtol=1e-1,
+            )
+            disch.update_si(rho=disch_rho_si, p=result.root)
 
         self.disch = disch
         self.head = self.head_calc_func(suc, disch)
@@ -1317,6 +1431,31 @@ class Point:
         return fig
 
 
+Point._dispatch_calc_from = Point._build_dispatch_calc_from()
+
+
+class LazyPoint(Point):
+    """A performance point with deferred secondary calculations.
+
+    Same as :py:class:`ccp.Point`, but the Reynolds and Mach numbers are only
+    calculated when they are first accessed. This is useful when a large
+    number of points is created and only the performance parameters are used.
+    """
+
+    def _calc_reynolds_mach(self):
+        pass
+
+    def __getattr__(self, name):
+        # only called if the attribute was not found in the instance
+        if name not in ("reynolds", "mach"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        Point._calc_reynolds_mach(self)
+
+        return self.__dict__[name]
+
+
 def plot_func(self, attr):
     def inner(*args, plot_kws=None, **kwargs):
         """Plot parameter versus volumetric flow.
@@ -1366,6 +1505,24 @@ def plot_func(self, attr):
     return inner
 
 
+def _state_plot_func(state, attr):
+    """Plot for a state attribute, e.g. point.suc.p_plot."""
+    try:
+        point, state_name = state._plot_point
+    except AttributeError:
+        raise AttributeError(
+            f"'{state.__class__.__name__}' object has no attribute '{attr}_plot'"
+        )
+
+    return plot_func(point, f"{state_name}.{attr}")
+
+
+for _attr in _point_plot_attributes:
+    add_lazy_attribute(Point, f"{_attr}_plot", plot_func, _attr)
+for _attr in _state_plot_attributes:
+    add_lazy_attribute(State, f"{_attr}_plot", _state_plot_func, _attr)
+
+
 def n_exp(suc, disch):
     r"""Polytropic exponent.
 
@@ -1389,12 +1546,12 @@ def n_exp(suc, disch):
     n_exp : float
         Polytropic exponent.
     """
-    ps = suc.p()
-    vs = 1 / suc.rho()
-    pd = disch.p()
-    vd = 1 / disch.rho()
+    ps = suc.p_si()
+    vs = suc.v_si()
+    pd = disch.p_si()
+    vd = disch.v_si()
 
-    return np.log(pd / ps) / np.log(vs / vd)
+    return Q_(np.log(pd / ps) / np.log(vs / vd), "dimensionless")
 
 
 def head_pol(suc, disch):
@@ -1423,14 +1580,14 @@ def head_pol(suc, disch):
         Polytropic head (J/kg).
     """
 
-    n = n_exp(suc, disch)
+    n = n_exp(suc, disch).magnitude
 
-    p2 = disch.p()
-    v2 = 1 / disch.rho()
-    p1 = suc.p()
-    v1 = 1 / suc.rho()
+    p2 = disch.p_si()
+    v2 = disch.v_si()
+    p1 = suc.p_si()
+    v1 = suc.v_si()
 
-    return (n / (n - 1)) * (p2 * v2 - p1 * v1).to("joule/kilogram")
+    return Q_((n / (n - 1)) * (p2 * v2 - p1 * v1), "joule/kilogram")
 
 
 def eff_pol(suc, disch):
@@ -1449,11 +1606,11 @@ def eff_pol(suc, disch):
         Polytropic efficiency (dimensionless).
 
     """
-    wp = head_pol(suc, disch)
+    wp = head_pol(suc, disch).magnitude
 
-    dh = disch.h() - suc.h()
+    dh = disch.h_si() - suc.h_si()
 
-    return wp / dh
+    return Q_(wp / dh, "dimensionless")
 
 
 def head_isentropic(suc, disch):
@@ -1472,10 +1629,10 @@ def head_isentropic(suc, disch):
         Isentropic head.
     """
     # define state to isentropic discharge using dummy state
-    disch_s = copy(disch)
-    disch_s.update(p=disch.p(), s=suc.s())
+    with disch.scratch() as disch_s:
+        disch_s.update_si(p=disch.p_si(), s=suc.s_si())
 
-    return head_pol(suc, disch_s).to("joule/kilogram")
+        return head_pol(suc, disch_s)
 
 
 def eff_isentropic(suc, disch):
@@ -1493,10 +1650,10 @@ def eff_isentropic(suc, disch):
     eff_isentropic : pint.Quantity
         Isentropic efficiency.
     """
-    ws = head_isentropic(suc, disch)
-    dh = disch.h() - suc.h()
+    ws = head_isentropic(suc, disch).magnitude
+    dh = disch.h_si() - suc.h_si()
 
-    return ws / dh
+    return Q_(ws / dh, "dimensionless")
 
 
 def f_schultz(suc, disch):
@@ -1523,13 +1680,14 @@ def f_schultz(suc, disch):
     """
 
     # define state to isentropic discharge using dummy state
-    disch_s = copy(disch)
-    disch_s.update(p=disch.p(), s=suc.s())
+    with disch.scratch() as disch_s:
+        disch_s.update_si(p=disch.p_si(), s=suc.s_si())
 
-    h2s_h1 = disch_s.h() - suc.h()
-    h_isen = head_isentropic(suc, disch)
+        h2s_h1 = disch_s.h_si() - suc.h_si()
+        # same as head_isentropic(suc, disch), reusing the isentropic discharge
+        h_isen = head_pol(suc, disch_s).magnitude
 
-    return h2s_h1 / h_isen
+    return Q_(h2s_h1 / h_isen, "dimensionless")
 
 
 def head_pol_schultz(suc, disch):
@@ -1556,10 +1714,10 @@ def head_pol_schultz(suc, disch):
     head_pol_schultz : pint.Quantity
         Schultz polytropic head (J/kg).
     """
-    f = f_schultz(suc, disch)
-    head = head_pol(suc, disch)
+    f = f_schultz(suc, disch).magnitude
+    head = head_pol(suc, disch).magnitude
 
-    return f * head
+    return Q_(f * head, "joule/kilogram")
 
 
 def eff_pol_schultz(suc, disch):
@@ -1577,10 +1735,10 @@ def eff_pol_schultz(suc, disch):
     eff_pol_schultz : pint.Quantity
         Schultz polytropic efficiency (dimensionless).
     """
-    wp = head_pol_schultz(suc, disch)
-    dh = disch.h() - suc.h()
+    wp = head_pol_schultz(suc, disch).magnitude
+    dh = disch.h_si() - suc.h_si()
 
-    return (wp / dh).to("dimensionless")
+    return Q_(wp / dh, "dimensionless")
 
 
 def head_pol_mallen_saville(suc, disch):
@@ -1605,11 +1763,13 @@ def head_pol_mallen_saville(suc, disch):
         Mallen-Saville polytropic polytropic head (J/kg).
     """
 
-    head = (disch.h() - suc.h()) - (disch.s() - suc.s()) * (
-        disch.T() - suc.T()
-    ) / np.log(disch.T() / suc.T())
+    Ts = suc.T_si()
+    Td = disch.T_si()
+    head = (disch.h_si() - suc.h_si()) - (disch.s_si() - suc.s_si()) * (
+        Td - Ts
+    ) / np.log(Td / Ts)
 
-    return head
+    return Q_(head, "joule/kilogram")
 
 
 def eff_pol_mallen_saville(suc, disch):
@@ -1627,16 +1787,125 @@ def eff_pol_mallen_saville(suc, disch):
     eff_pol_mallen_saville : pint.Quantity
         Mallen-Saville polytropic efficiency (dimensionless).
     """
-    wp = head_pol_mallen_saville(suc, disch)
-    dh = disch.h() - suc.h()
+    wp = head_pol_mallen_saville(suc, disch).magnitude
+    dh = disch.h_si() - suc.h_si()
 
-    return (wp / dh).to("dimensionless")
+    return Q_(wp / dh, "dimensionless")
+
+
+# number of steps used by the reference head in the adaptive mode (tol given)
+_REFERENCE_NUM_STEPS_COARSE = 4
+_REFERENCE_MAX_NUM_STEPS = 1024
+
+ReferenceHeadInfo = namedtuple("ReferenceHeadInfo", ["num_steps", "tol", "flashes"])
+
+
+def _reference_head(suc, disch, num_steps, eff0, step, tol=None, richardson=True):
+    """Integrate the reference head along the polytropic path.
+
+    The integration state is kept locally and a single work state (see
+    :py:meth:`ccp.State.scratch`) is reused for all flashes, so this function
+    can be used concurrently from threads or processes.
+
+    Parameters
+    ----------
+    suc : ccp.State
+        Suction state.
+    disch : ccp.State
+        Discharge state.
+    num_steps : int
+        Number of steps in the integration (initial number if tol is given).
+    eff0 : float
+        Initial estimate for the efficiency.
+    step : callable
+        Function step(state, e, p0, p1, guess) that updates the work state
+        from p0 to p1 for the efficiency e and returns (x, flashes), where x
+        is the solved variable and flashes the number of flashes used. x is
+        passed as guess to the same step in the next efficiency iteration
+        (None for the first), which is used to warm start the step.
+    tol : float, optional
+        Relative tolerance in the head. If given, num_steps is doubled until
+        the estimated relative error is lower than tol.
+    richardson : bool, optional
+        If True (default), the returned values are obtained with Richardson
+        extrapolation of the last two grids. Only used if tol is given.
+
+    Returns
+    -------
+    head : float
+        Reference head (J/kg).
+    eff : float
+        Reference efficiency.
+    info : ReferenceHeadInfo
+        Number of steps of the finest grid, achieved relative tolerance (None
+        if tol is not given) and total number of flashes.
+    """
+    ps = suc.p_si()
+    pd = disch.p_si()
+    Ts = suc.T_si()
+    Td = disch.T_si()
+    flashes = [0]
+
+    def integrate(num_steps, eff0):
+        rc = (pd / ps) ** (1 / num_steps)
+        p_intervals = [ps]
+        p = ps
+        for i in range(num_steps):
+            p = p * rc
+            p_intervals.append(p)
+
+        warm_start = [None] * num_steps
+        path = {}
+
+        with suc.scratch() as state:
+
+            def calc_eff(e):
+                state.update_si(p=ps, T=Ts)
+                flashes[0] += 1
+                head = 0.0
+                for i in range(num_steps):
+                    p0, p1 = p_intervals[i], p_intervals[i + 1]
+                    v0 = state.v_si()
+                    warm_start[i], n = step(state, e, p0, p1, warm_start[i])
+                    flashes[0] += n
+                    head += _head_pol_kernel(p0, v0, p1, state.v_si())
+
+                path["head"] = head
+
+                return Td - state.T_si()
+
+            eff = newton(calc_eff, eff0)
+
+        return path["head"], eff
 
+    head, eff = integrate(num_steps, eff0)
+    if tol is None:
+        return head, eff, ReferenceHeadInfo(num_steps, None, flashes[0])
 
-_ref_H = 0
+    while True:
+        num_steps *= 2
+        head_coarse, eff_coarse = head, eff
+        head, eff = integrate(num_steps, eff_coarse)
+        # error estimate for the fine grid, the head of each step is second
+        # order in the pressure step
+        error = float(abs(head - head_coarse))
+        if richardson:
+            error /= 3
+        error /= abs(head)
 
+        if error <= tol or num_steps >= _REFERENCE_MAX_NUM_STEPS:
+            break
 
-def head_reference(suc, disch, num_steps=100):
+    if richardson:
+        head += (head - head_coarse) / 3
+        eff += (eff - eff_coarse) / 3
+
+    return head, eff, ReferenceHeadInfo(num_steps, error, flashes[0])
+
+
+def head_reference(
+    suc, disch, num_steps=None, tol=None, richardson=True, full_output=False
+):
     r"""Reference head.
 
     The reference head consists of the integration of :math:`v dp` along the
@@ -1664,6 +1933,19 @@ def head_reference(suc, disch, num_steps=100):
         Suction state.
     disch : ccp.State
         Discharge state.
+    num_steps : int, optional
+        Number of steps in the integration. Default is 100, or 4 if tol is
+        given.
+    tol : float, optional
+        Relative tolerance in the head. If given, the integration starts
+        with a coarse grid of num_steps and the number of steps is doubled
+        until the estimated relative error is lower than tol (or 1024 steps
+        are reached). Each refinement is started from the previous efficiency.
+    richardson : bool, optional
+        If True (default), Richardson extrapolation of the last two grids is
+        applied to the head and efficiency. Only used if tol is given.
+    full_output : bool, optional
+        If True, the integration information is also returned.
 
     Returns
     -------
@@ -1671,56 +1953,47 @@ def head_reference(suc, disch, num_steps=100):
        Reference head as described by :cite:`huntington1985`. (J/kg).
     eff_reference : float
         Reference efficiency as described by :cite:`huntington1985` (dimensionless).
+    info : ReferenceHeadInfo
+        Number of steps of the finest grid, achieved relative tolerance (None
+        if tol is not given) and total number of flashes.
+        Only returned if full_output is True.
     """
 
-    def calc_step_discharge_temp(T1, p1, p0, h0, v0, e):
-        s1 = State(p=p1, T=T1, fluid=suc.fluid)
-        h1 = s1.h()
+    def step(state, e, p0, p1, guess):
+        T0 = state.T_si()
+        h0 = state.h_si()
+        v0 = state.v_si()
 
-        vm = (v0 + s1.v()) / 2
-        delta_p = Q_(p1 - p0, "Pa")
-        H0 = vm * delta_p
-        H1 = e * (h1 - h0)
+        def calc_step_discharge_temp(T1):
+            state.update_si(p=p1, T=T1)
+            H0 = (v0 + state.v_si()) / 2 * (p1 - p0)
+            H1 = e * (state.h_si() - h0)
 
-        return (H1 - H0).magnitude
-
-    def calc_eff(e, suc, disch):
-        rc = (disch.p().m / suc.p().m) ** (1 / num_steps)
-        p_intervals = [suc.p().m]
-        p = suc.p().m
-        for i in range(num_steps):
-            next_p = p * rc
-            p = next_p
-            p_intervals.append(p)
-
-        T0 = suc.T().magnitude
-
-        global _ref_H
-
-        _ref_H = 0
-
-        # TODO implement p_intervals considering pressure ratio
-        for p0, p1 in zip(p_intervals[:-1], p_intervals[1:]):
-            s0 = State(p=p0, T=T0, fluid=suc.fluid)
-            T1 = newton(
-                calc_step_discharge_temp, (T0 + 1e-3), args=(p1, p0, s0.h(), s0.v(), e)
-            )
-            s1 = State(p=p1, T=T1, fluid=suc.fluid)
-            _ref_H += head_pol(s0, s1)
+            return H1 - H0
 
-            T0 = T1
+        if guess is None:
+            guess = T0 + 1e-3
+        T1, result = newton(calc_step_discharge_temp, guess, full_output=True)
+        state.update_si(p=p1, T=T1)
 
-        return disch.T().magnitude - T1
+        return T1, result.function_calls + 1
 
-    _ref_eff = newton(calc_eff, 0.8, args=(suc, disch))
+    if num_steps is None:
+        num_steps = 100 if tol is None else _REFERENCE_NUM_STEPS_COARSE
 
-    return _ref_H, _ref_eff
+    head, eff, info = _reference_head(
+        suc, disch, num_steps, 0.8, step, tol=tol, richardson=richardson
+    )
 
+    if full_output:
+        return Q_(head, "joule/kilogram"), eff, info
 
-_ref_H_2017 = 0
+    return Q_(head, "joule/kilogram"), eff
 
 
-def head_reference_2017(suc, disch, num_steps=100):
+def head_reference_2017(
+    suc, disch, num_steps=None, tol=None, richardson=True, full_output=False
+):
     r"""Reference head.
 
     The reference head consists of the integration along the
@@ -1749,6 +2022,19 @@ def head_reference_2017(suc, disch, num_steps=100):
         Suction state.
     disch : ccp.State
         Discharge state.
+    num_steps : int, optional
+        Number of steps in the integration. Default is 100, or 4 if tol is
+        given.
+    tol : float, optional
+        Relative tolerance in the head. If given, the integration starts
+        with a coarse grid of num_steps and the number of steps is doubled
+        until the estimated relative error is lower than tol (or 1024 steps
+        are reached). Each refinement is started from the previous efficiency.
+    richardson : bool, optional
+        If True (default), Richardson extrapolation of the last two grids is
+        applied to the head and efficiency. Only used if tol is given.
+    full_output : bool, optional
+        If True, the integration information is also returned.
 
     Returns
     -------
@@ -1756,50 +2042,53 @@ def head_reference_2017(suc, disch, num_steps=100):
        Reference head as described by :cite:`huntington2017`. (J/kg).
     eff_reference : float
         Reference efficiency as described by :cite:`huntington2017` (dimensionless).
+    info : ReferenceHeadInfo
+        Number of steps of the finest grid, achieved relative tolerance (None
+        if tol is not given) and total number of flashes.
+        Only returned if full_output is True.
     """
-    R = suc.gas_constant() / suc.molar_mass()
-    rc = (disch.p().m / suc.p().m) ** (1 / num_steps)
-    p_intervals = [suc.p().m]
-    p = suc.p().m
-    for i in range(num_steps):
-        next_p = p * rc
-        p = next_p
-        p_intervals.append(p)
-
-    state1 = ccp.State(p=suc.p(), s=suc.s(), fluid=suc.fluid)
-    def calc_step_discharge_z(s1, s0, p1, p0, z0, R, e):
-        state1.update(p=p1, s=s1) 
-        z1 = state1.z()
-        a = (z0 * (p1 / p0) - z1) / ((p1 / p0) - 1)
-        b = (z1 - z0) / ((p1 / p0) - 1)
+    R = (suc.gas_constant() / suc.molar_mass()).to("joule/(kelvin kilogram)").m
+    molar_mass = suc.molar_mass().m
+    gas_constant = suc.gas_constant().m
 
-        return (
-            (R * ((1 - e) / e)) * (a * np.log(p1 / p0) + b * ((p1 / p0) - 1))
-            - (state1.s() - Q_(s0, state1.s().units))
-        ).magnitude
+    def z(state):
+        return (state.p_si() * molar_mass) / (
+            state.rho_si() * gas_constant * state.T_si()
+        )
+
+    def step(state, e, p0, p1, guess):
+        s0 = state.s_si()
+        z0 = z(state)
 
-    def calc_eff(e, suc, disch, p_intervals):
-        global _ref_H_2017
-        _ref_H_2017 = 0
-        s0 = suc.s().magnitude
+        def calc_step_discharge_z(s1):
+            state.update_si(p=p1, s=s1)
+            z1 = z(state)
+            a = (z0 * (p1 / p0) - z1) / ((p1 / p0) - 1)
+            b = (z1 - z0) / ((p1 / p0) - 1)
 
-        for p0, p1 in zip(p_intervals[:-1], p_intervals[1:]):
-            state0 = ccp.State(p=p0, s=s0, fluid=suc.fluid)
-            z0 = state0.z()
+            return (R * ((1 - e) / e)) * (a * np.log(p1 / p0) + b * ((p1 / p0) - 1)) - (
+                state.s_si() - s0
+            )
+
+        if guess is None:
+            guess = s0 + 1e-8
+        s1, result = newton(calc_step_discharge_z, guess, full_output=True)
+        state.update_si(p=p1, s=s1)
 
-            s1 = newton(calc_step_discharge_z, (s0 + 1e-8), args=(s0, p1, p0, z0, R, e))
-            state1 = ccp.State(p=p1, s=s1, fluid=suc.fluid)
-            _ref_H_2017 += ccp.point.head_pol(state0, state1)
+        return s1, result.function_calls + 1
 
-            s0 = s1
-            T1 = state1.T().magnitude
+    if num_steps is None:
+        num_steps = 100 if tol is None else _REFERENCE_NUM_STEPS_COARSE
 
-        return disch.T().magnitude - T1
+    eff0 = eff_pol_huntington(suc, disch).m
+    head, eff, info = _reference_head(
+        suc, disch, num_steps, eff0, step, tol=tol, richardson=richardson
+    )
 
-    eff0 = ccp.point.eff_pol_huntington(suc, disch)
-    _ref_eff = newton(calc_eff, eff0, args=(suc, disch, p_intervals))
+    if full_output:
+        return Q_(head, "joule/kilogram"), eff, info
 
-    return _ref_H_2017, _ref_eff
+    return Q_(head, "joule/kilogram"), eff
 
 
 def f_sandberg_colby(suc, disch):
@@ -2022,6 +2311,409 @@ def eff_pol_huntington(suc, disch):
     return eff
 
 
+# head and efficiency functions for each polytropic method
+_polytropic_methods = {
+    "schultz": (head_pol_schultz, eff_pol_schultz),
+    "mallen_saville": (head_pol_mallen_saville, eff_pol_mallen_saville),
+    "sandberg_colby": (head_pol_sandberg_colby, eff_pol_sandberg_colby),
+    "huntington": (head_pol_huntington, eff_pol_huntington),
+}
+
+
+def _polytropic_functions(polytropic_method):
+    """Return the head and efficiency functions for a polytropic method."""
+    try:
+        return _polytropic_methods[polytropic_method]
+    except KeyError:
+        raise ValueError(
+            f"Polytropic method {polytropic_method!r} is not available. "
+            f"Options are: {', '.join(_polytropic_methods)}."
+        )
+
+
+# SI units used by the batch functions for each property column
+_batch_units = {
+    "p": "pascal",
+    "T": "degK",
+    "v": "m**3/kg",
+    "rho": "kg/m**3",
+    "h": "joule/kilogram",
+    "s": "joule/(kelvin kilogram)",
+}
+
+
+def _batch_column(states, name):
+    """Return the SI magnitudes of a property column as a float array.
+
+    states can be a ccp.StateArray or a mapping (e.g. dict or
+    pandas.DataFrame) with the columns p, T, v (or rho), h and s given as
+    floats in SI units or pint quantities.
+    """
+    if isinstance(states, StateArray):
+        values = getattr(states, name)()
+    else:
+        try:
+            values = states[name]
+        except KeyError:
+            if name != "v":
+                raise
+            return 1 / _batch_column(states, "rho")
+
+    try:
+        return np.asarray(values.to(_batch_units[name]).magnitude, dtype=float)
+    except AttributeError:
+        return np.asarray(values, dtype=float)
+
+
+def _disch_s_batch(suc, disch, disch_s=None):
+    """Isentropic discharge states (discharge pressure and suction entropy)."""
+    if disch_s is not None:
+        return disch_s
+    if not isinstance(suc, StateArray):
+        raise TypeError(
+            "disch_s (isentropic discharge columns) is required when suc is not "
+            "a ccp.StateArray."
+        )
+
+    return StateArray(
+        p=_batch_column(disch, "p"),
+        s=_batch_column(suc, "s"),
+        fluid=suc.fluid,
+        EOS=suc.EOS,
+    )
+
+
+def _n_exp_kernel(ps, vs, pd, vd):
+    return np.log(pd / ps) / np.log(vs / vd)
+
+
+def _head_pol_kernel(ps, vs, pd, vd):
+    n = _n_exp_kernel(ps, vs, pd, vd)
+    return (n / (n - 1)) * (pd * vd - ps * vs)
+
+
+def _head_pol_batch(suc, disch):
+    return _head_pol_kernel(
+        _batch_column(suc, "p"),
+        _batch_column(suc, "v"),
+        _batch_column(disch, "p"),
+        _batch_column(disch, "v"),
+    )
+
+
+def _dh_batch(suc, disch):
+    return _batch_column(disch, "h") - _batch_column(suc, "h")
+
+
+def _f_schultz_batch(suc, disch, disch_s=None):
+    disch_s = _disch_s_batch(suc, disch, disch_s)
+    h2s_h1 = _batch_column(disch_s, "h") - _batch_column(suc, "h")
+    h_isen = _head_pol_batch(suc, disch_s)
+
+    return h2s_h1 / h_isen
+
+
+def _head_pol_mallen_saville_batch(suc, disch):
+    Ts = _batch_column(suc, "T")
+    Td = _batch_column(disch, "T")
+    ds = _batch_column(disch, "s") - _batch_column(suc, "s")
+
+    return _dh_batch(suc, disch) - ds * (Td - Ts) / np.log(Td / Ts)
+
+
+def _f_sandberg_colby_batch(suc, disch):
+    Tm = (_batch_column(suc, "T") + _batch_column(disch, "T")) / 2
+    ds = _batch_column(disch, "s") - _batch_column(suc, "s")
+
+    return (_dh_batch(suc, disch) - Tm * ds) / _head_pol_batch(suc, disch)
+
+
+def n_exp_batch(suc, disch):
+    """Polytropic exponent for arrays of states.
+
+    Array version of :py:func:`n_exp`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p and v (or rho).
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p and v (or rho).
+
+    Returns
+    -------
+    n_exp : pint.Quantity
+        Polytropic exponent (dimensionless).
+    """
+    n = _n_exp_kernel(
+        _batch_column(suc, "p"),
+        _batch_column(suc, "v"),
+        _batch_column(disch, "p"),
+        _batch_column(disch, "v"),
+    )
+    return Q_(n, "dimensionless")
+
+
+def head_pol_batch(suc, disch):
+    """Polytropic head for arrays of states.
+
+    Array version of :py:func:`head_pol`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p and v (or rho).
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p and v (or rho).
+
+    Returns
+    -------
+    head_pol : pint.Quantity
+        Polytropic head (J/kg).
+    """
+    return Q_(_head_pol_batch(suc, disch), "joule/kilogram")
+
+
+def eff_pol_batch(suc, disch):
+    """Polytropic efficiency for arrays of states.
+
+    Array version of :py:func:`eff_pol`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, v (or rho) and h.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p, v (or rho) and h.
+
+    Returns
+    -------
+    eff_pol : pint.Quantity
+        Polytropic efficiency (dimensionless).
+    """
+    return Q_(_head_pol_batch(suc, disch) / _dh_batch(suc, disch), "dimensionless")
+
+
+def head_isentropic_batch(suc, disch, disch_s=None):
+    """Isentropic head for arrays of states.
+
+    Array version of :py:func:`head_isentropic`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, v (or rho) and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p and v (or rho).
+    disch_s : ccp.StateArray, dict, pandas.DataFrame, optional
+        Isentropic discharge states, with columns p, v (or rho) and h.
+        If None, they are calculated from suc, which should be a StateArray.
+
+    Returns
+    -------
+    head_isentropic : pint.Quantity
+        Isentropic head (J/kg).
+    """
+    disch_s = _disch_s_batch(suc, disch, disch_s)
+    return Q_(_head_pol_batch(suc, disch_s), "joule/kilogram")
+
+
+def eff_isentropic_batch(suc, disch, disch_s=None):
+    """Isentropic efficiency for arrays of states.
+
+    Array version of :py:func:`eff_isentropic`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, v (or rho), h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p, v (or rho) and h.
+    disch_s : ccp.StateArray, dict, pandas.DataFrame, optional
+        Isentropic discharge states, with columns p, v (or rho) and h.
+        If None, they are calculated from suc, which should be a StateArray.
+
+    Returns
+    -------
+    eff_isentropic : pint.Quantity
+        Isentropic efficiency (dimensionless).
+    """
+    disch_s = _disch_s_batch(suc, disch, disch_s)
+    return Q_(_head_pol_batch(suc, disch_s) / _dh_batch(suc, disch), "dimensionless")
+
+
+def f_schultz_batch(suc, disch, disch_s=None):
+    """Schultz polytropic factor for arrays of states.
+
+    Array version of :py:func:`f_schultz`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, v (or rho), h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p and v (or rho).
+    disch_s : ccp.StateArray, dict, pandas.DataFrame, optional
+        Isentropic discharge states, with columns p, v (or rho) and h.
+        If None, they are calculated from suc, which should be a StateArray.
+
+    Returns
+    -------
+    f_schultz : pint.Quantity
+        Schultz polytropic factor (dimensionless).
+    """
+    return Q_(_f_schultz_batch(suc, disch, disch_s), "dimensionless")
+
+
+def head_pol_schultz_batch(suc, disch, disch_s=None):
+    """Schultz polytropic head for arrays of states.
+
+    Array version of :py:func:`head_pol_schultz`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, v (or rho), h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p and v (or rho).
+    disch_s : ccp.StateArray, dict, pandas.DataFrame, optional
+        Isentropic discharge states, with columns p, v (or rho) and h.
+        If None, they are calculated from suc, which should be a StateArray.
+
+    Returns
+    -------
+    head_pol_schultz : pint.Quantity
+        Schultz polytropic head (J/kg).
+
+    Examples
+    --------
+    >>> import ccp
+    >>> Q_ = ccp.Q_
+    >>> suc = {"p": Q_([1, 1], "bar"), "v": [0.8, 0.8], "h": [0, 0], "s": [0, 0]}
+    >>> disch = {"p": Q_([3, 4], "bar"), "v": [0.4, 0.35], "h": [2e5, 2.6e5]}
+    >>> disch_s = {"p": Q_([3, 4], "bar"), "v": [0.36, 0.3], "h": [1.6e5, 2e5]}
+    >>> ccp.point.head_pol_schultz_batch(suc, disch, disch_s).m.round(1)
+    array([169176.9, 217362.6])
+    """
+    f = _f_schultz_batch(suc, disch, disch_s)
+    return Q_(f * _head_pol_batch(suc, disch), "joule/kilogram")
+
+
+def eff_pol_schultz_batch(suc, disch, disch_s=None):
+    """Schultz polytropic efficiency for arrays of states.
+
+    Array version of :py:func:`eff_pol_schultz`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, v (or rho), h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p, v (or rho) and h.
+    disch_s : ccp.StateArray, dict, pandas.DataFrame, optional
+        Isentropic discharge states, with columns p, v (or rho) and h.
+        If None, they are calculated from suc, which should be a StateArray.
+
+    Returns
+    -------
+    eff_pol_schultz : pint.Quantity
+        Schultz polytropic efficiency (dimensionless).
+    """
+    head = _f_schultz_batch(suc, disch, disch_s) * _head_pol_batch(suc, disch)
+    return Q_(head / _dh_batch(suc, disch), "dimensionless")
+
+
+def head_pol_mallen_saville_batch(suc, disch):
+    """Mallen-Saville polytropic head for arrays of states.
+
+    Array version of :py:func:`head_pol_mallen_saville`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns T, h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns T, h and s.
+
+    Returns
+    -------
+    head_pol_mallen_saville : pint.Quantity
+        Mallen-Saville polytropic head (J/kg).
+    """
+    return Q_(_head_pol_mallen_saville_batch(suc, disch), "joule/kilogram")
+
+
+def eff_pol_mallen_saville_batch(suc, disch):
+    """Mallen-Saville polytropic efficiency for arrays of states.
+
+    Array version of :py:func:`eff_pol_mallen_saville`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns T, h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns T, h and s.
+
+    Returns
+    -------
+    eff_pol_mallen_saville : pint.Quantity
+        Mallen-Saville polytropic efficiency (dimensionless).
+    """
+    head = _head_pol_mallen_saville_batch(suc, disch)
+    return Q_(head / _dh_batch(suc, disch), "dimensionless")
+
+
+def head_pol_sandberg_colby_batch(suc, disch):
+    """Sandberg-Colby polytropic head for arrays of states.
+
+    Array version of :py:func:`head_pol_sandberg_colby`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, T, v (or rho), h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p, T, v (or rho), h and s.
+
+    Returns
+    -------
+    head_pol_sandberg_colby : pint.Quantity
+        Sandberg-Colby polytropic head (J/kg).
+    """
+    f = _f_sandberg_colby_batch(suc, disch)
+    return Q_(f * _head_pol_batch(suc, disch), "joule/kilogram")
+
+
+def eff_pol_sandberg_colby_batch(suc, disch):
+    """Sandberg-Colby polytropic efficiency for arrays of states.
+
+    Array version of :py:func:`eff_pol_sandberg_colby`.
+
+    Parameters
+    ----------
+    suc : ccp.StateArray, dict, pandas.DataFrame
+        Suction states, as a StateArray or as columns p, T, v (or rho), h and s.
+    disch : ccp.StateArray, dict, pandas.DataFrame
+        Discharge states, as a StateArray or as columns p, T, v (or rho), h and s.
+
+    Returns
+    -------
+    eff_pol_sandberg_colby : pint.Quantity
+        Sandberg-Colby polytropic efficiency (dimensionless).
+    """
+    head = _f_sandberg_colby_batch(suc, disch) * _head_pol_batch(suc, disch)
+    return Q_(head / _dh_batch(suc, disch), "dimensionless")
+
+
+# batch functions for each polytropic method, used for arrays of points
+_polytropic_batch_methods = {
+    "schultz": (head_pol_schultz_batch, eff_pol_schultz_batch),
+    "mallen_saville": (head_pol_mallen_saville_batch, eff_pol_mallen_saville_batch),
+    "sandberg_colby": (head_pol_sandberg_colby_batch, eff_pol_sandberg_colby_batch),
+}
+
+
 @check_units
 def power_calc(flow_m, head, eff):
     """Calculate power.
@@ -2236,7 +2928,147 @@ def head_from_psi(D, psi, speed):
     return head.to("J/kg")
 
 
-def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
+_partial_deriv_keys = {
+    "p": CP.iP,
+    "T": CP.iT,
+    "h": CP.iHmass,
+    "rho": CP.iDmass,
+}
+
+
+def _path_derivatives(state, x, constant):
+    """Derivatives of p, v and h with respect to x, keeping constant fixed.
+
+    Parameters
+    ----------
+    state : ccp.State
+        State where the derivatives are evaluated.
+    x : str
+        Solver variable ("p" or "T").
+    constant : str
+        Property kept constant by the solver ("p", "T", "h" or "rho").
+
+    Returns
+    -------
+    dp, dv, dh : float
+        Derivatives in SI units.
+    """
+    x_key = _partial_deriv_keys[x]
+    constant_key = _partial_deriv_keys[constant]
+
+    if x == "p":
+        dp = 1.0
+    elif constant == "p":
+        dp = 0.0
+    else:
+        dp = state.first_partial_deriv(CP.iP, x_key, constant_key)
+
+    if constant == "rho":
+        dv = 0.0
+    else:
+        # dv = -v**2 drho
+        dv = -(state.v_si() ** 2) * state.first_partial_deriv(
+            CP.iDmass, x_key, constant_key
+        )
+
+    if constant == "h":
+        dh = 0.0
+    else:
+        dh = state.first_partial_deriv(CP.iHmass, x_key, constant_key)
+
+    return dp, dv, dh
+
+
+def _head_pol_derivative(suc, disch, dp, dv):
+    """Derivative of :py:func:`head_pol` given dp and dv of the discharge state."""
+    ps = suc.p_si()
+    vs = suc.v_si()
+    pd = disch.p_si()
+    vd = disch.v_si()
+
+    log_p = np.log(pd / ps)
+    log_v = np.log(vs / vd)
+    n = log_p / log_v
+    dn = ((dp / pd) * log_v + log_p * (dv / vd)) / log_v**2
+
+    work = pd * vd - ps * vs
+    dwork = dp * vd + pd * dv
+
+    return -dn / (n - 1) ** 2 * work + (n / (n - 1)) * dwork
+
+
+def _head_derivative(suc, disch, head, x, constant):
+    """Derivative of the polytropic head along the solver path.
+
+    The head of any polytropic method is written as H = f * Hp, where Hp is
+    calculated by :py:func:`head_pol`. The correction factor f is evaluated at
+    the current state and kept constant, while the derivative of Hp is
+    calculated with the partial derivatives from the EOS.
+
+    Returns
+    -------
+    dhead, dh : float
+        Derivatives of the head and of the discharge enthalpy in SI units.
+    """
+    dp, dv, dh = _path_derivatives(disch, x, constant)
+    f = head / head_pol(suc, disch).magnitude
+
+    return f * _head_pol_derivative(suc, disch, dp, dv), dh
+
+
+def _solve_disch(objective, disch, x, constant, xtol):
+    """Solve for the discharge state.
+
+    Newton's method is used with the derivative returned by the objective
+    function. If the EOS does not provide the partial derivatives (e.g.
+    REFPROP 9.1), the secant method is used instead.
+
+    Parameters
+    ----------
+    objective : callable
+        Function that updates the discharge state with x and returns the
+        residual and, if called with derivative=True, its derivative.
+    disch : ccp.State
+        Discharge state at the initial estimate.
+    x : str
+        Solver variable ("p" or "T").
+    constant : str
+        Property kept constant by the solver.
+    xtol : float
+        Tolerance in x.
+
+    Returns
+    -------
+    result : scipy.optimize.RootResults
+        Solver result with the number of iterations and function calls.
+    """
+    x0 = disch.p_si() if x == "p" else disch.T_si()
+
+    try:
+        _path_derivatives(disch, x, constant)
+    except ValueError:
+        # partial derivatives not available for this EOS
+        x1 = x0 * (1 + 1e-4) + (1e-4 if x0 >= 0 else -1e-4)
+        result = root_scalar(
+            lambda x: objective(x, derivative=False),
+            x0=x0,
+            x1=x1,
+            method="secant",
+            xtol=xtol,
+        )
+    else:
+        result = root_scalar(objective, x0=x0, fprime=True, method="newton", xtol=xtol)
+
+    if not result.converged:
+        raise RuntimeError(
+            f"Failed to converge after {result.iterations} iterations, "
+            f"value is {result.root}."
+        )
+
+    return result
+
+
+def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None, full_output=False):
     """Calculate discharge state from suction, head and efficiency.
 
     Parameters
@@ -2247,33 +3079,51 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
         Polytropic head (J/kg).
     eff : pint.Quantity, float
         Polytropic efficiency (dimensionless).
+    full_output : bool, optional
+        If True, the solver result is also returned.
 
     Returns
     -------
     disch : ccp.State
         Discharge state.
+    result : scipy.optimize.RootResults
+        Solver result with the number of iterations and function calls.
+        Only returned if full_output is True.
     """
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
-    head_calc_func = globals()[f"head_pol_{polytropic_method}"]
+    head_calc_func, _ = _polytropic_functions(polytropic_method)
     h_disch = head / eff + suc.h()
 
     #  consider first an isentropic compression
     disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid)
 
-    def update_pressure(p):
-        disch.update(h=h_disch, p=p)
-        new_head = head_calc_func(suc, disch)
+    h_disch_si = h_disch.to("joule/kilogram").magnitude
+    head_si = Q_(head, "joule/kilogram").magnitude
+
+    def update_pressure(p, derivative=True):
+        disch.update_si(h=h_disch_si, p=p)
+        new_head = head_calc_func(suc, disch).magnitude
+        if not derivative:
+            return new_head - head_si
+
+        dhead, _ = _head_derivative(suc, disch, new_head, "p", "h")
 
-        return (new_head - head).magnitude
+        return new_head - head_si, dhead
 
-    newton(update_pressure, disch.p().magnitude, tol=1e-1)
+    result = _solve_disch(update_pressure, disch, "p", "h", xtol=1e-1)
+    disch.update_si(h=h_disch_si, p=result.root)
+
+    if full_output:
+        return disch, result
 
     return disch
 
 
-def disch_from_suc_disch_p_eff(suc, disch_p, eff, polytropic_method=None):
+def disch_from_suc_disch_p_eff(
+    suc, disch_p, eff, polytropic_method=None, full_output=False
+):
     """Calculate discharge state from suction, discharge pressure and efficiency.
 
     Parameters
@@ -2284,31 +3134,52 @@ def disch_from_suc_disch_p_eff(suc, disch_p, eff, polytropic_method=None):
         Discharge pressure (Pa).
     eff : pint.Quantity, float
         Polytropic efficiency (dimensionless).
+    full_output : bool, optional
+        If True, the solver result is also returned.
 
     Returns
     -------
     disch : ccp.State
         Discharge state.
+    result : scipy.optimize.RootResults
+        Solver result with the number of iterations and function calls.
+        Only returned if full_output is True.
     """
     # consider first an isentropic compression
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
     disch = ccp.State(p=disch_p, s=suc.s(), fluid=suc.fluid)
-    eff_calc_func = globals()[f"eff_pol_{polytropic_method}"]
+    head_calc_func, _ = _polytropic_functions(polytropic_method)
+
+    disch_p_si = disch.p_si()
+    eff_si = Q_(eff, "dimensionless").magnitude
 
-    def update_state(x):
-        disch.update(p=disch_p, T=x)
-        new_eff = eff_calc_func(suc, disch)
+    def update_state(x, derivative=True):
+        disch.update_si(p=disch_p_si, T=x)
+        new_head = head_calc_func(suc, disch).magnitude
+        dh_disch = disch.h_si() - suc.h_si()
+        new_eff = new_head / dh_disch
+        if not derivative:
+            return new_eff - eff_si
 
-        return (new_eff - eff).magnitude
+        dhead, dh = _head_derivative(suc, disch, new_head, "T", "p")
+        deff = (dhead * dh_disch - new_head * dh) / dh_disch**2
 
-    newton(update_state, disch.T().magnitude)
+        return new_eff - eff_si, deff
+
+    result = _solve_disch(update_state, disch, "T", "p", xtol=1.48e-8)
+    disch.update_si(p=disch_p_si, T=result.root)
+
+    if full_output:
+        return disch, result
 
     return disch
 
 
-def disch_from_suc_disch_T_head(suc, disch_T, head, polytropic_method=None):
+def disch_from_suc_disch_T_head(
+    suc, disch_T, head, polytropic_method=None, full_output=False
+):
     """Calculate discharge state from suction, discharge temperature and head.
 
     Parameters
@@ -2319,26 +3190,42 @@ def disch_from_suc_disch_T_head(suc, disch_T, head, polytropic_method=None):
         Discharge temperature (degK).
     head : pint.Quantity, float
         Polytropic head (J/kg).
+    full_output : bool, optional
+        If True, the solver result is also returned.
 
     Returns
     -------
     disch : ccp.State
         Discharge state.
+    result : scipy.optimize.RootResults
+        Solver result with the number of iterations and function calls.
+        Only returned if full_output is True.
     """
     # consider first an isentropic compression
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
     disch = ccp.State(T=disch_T, s=suc.s(), fluid=suc.fluid)
-    head_calc_func = globals()[f"head_pol_{polytropic_method}"]
+    head_calc_func, _ = _polytropic_functions(polytropic_method)
+
+    disch_T_si = disch.T_si()
+    head_si = Q_(head, "joule/kilogram").magnitude
+
+    def update_state(x, derivative=True):
+        disch.update_si(T=disch_T_si, p=x)
+        new_head = head_calc_func(suc, disch).magnitude
+        if not derivative:
+            return new_head - head_si
+
+        dhead, _ = _head_derivative(suc, disch, new_head, "p", "T")
 
-    def update_state(x):
-        disch.update(T=disch_T, p=x)
-        new_head = head_calc_func(suc, disch)
+        return new_head - head_si, dhead
 
-        return (new_head - head).magnitude
+    result = _solve_disch(update_state, disch, "p", "T", xtol=1e-7)
+    disch.update_si(T=disch_T_si, p=result.root)
 
-    newton(update_state, disch.p().magnitude, tol=1e-7)
+    if full_output:
+        return disch, result
 
     return disch
 
@@ -0,0 +1,332 @@
+"""Compact storage for a large number of performance points."""
+
+import numpy as np
+import pandas as pd
+
+import ccp
+from ccp import Q_
+from ccp.point import Point
+from ccp.state import State
+
+# columns stored in the table with their SI units
+_point_table_units = {
+    "flow_v": "m**3/s",
+    "flow_m": "kg/s",
+    "speed": "rad/s",
+    "head": "J/kg",
+    "eff": "dimensionless",
+    "power": "W",
+    "power_losses": "W",
+    "phi": "dimensionless",
+    "psi": "dimensionless",
+    "mach": "dimensionless",
+    "reynolds": "dimensionless",
+    "b": "m",
+    "D": "m",
+    "suc_p": "Pa",
+    "suc_T": "degK",
+    "suc_h": "J/kg",
+    "suc_s": "J/(kg*degK)",
+    "suc_rho": "kg/m**3",
+    "disch_p": "Pa",
+    "disch_T": "degK",
+    "disch_h": "J/kg",
+    "disch_s": "J/(kg*degK)",
+    "disch_rho": "kg/m**3",
+}
+_point_table_columns = tuple(_point_table_units)
+_point_table_dtype = np.dtype([(column, float) for column in _point_table_columns])
+
+
+def _point_values(point):
+    """Return the table values (SI units) for a ccp.Point."""
+    values = {}
+    for column in _point_table_columns:
+        if column.startswith(("suc_", "disch_")):
+            state, attr = column.split("_", 1)
+            value = getattr(getattr(point, state), attr)()
+        else:
+            value = getattr(point, column)
+        if value is None:
+            values[column] = np.nan
+        else:
+            values[column] = Q_(value).to(_point_table_units[column]).m
+
+    return values
+
+
+def _rehydrate(fluid, values, EOS, polytropic_method):
+    """Create a ccp.Point from the table values (SI units)."""
+    suc = State(p=values["suc_p"], T=values["suc_T"], fluid=fluid, EOS=EOS)
+    disch = State(p=values["disch_p"], T=values["disch_T"], fluid=fluid, EOS=EOS)
+    power_losses = values["power_losses"]
+    if np.isnan(power_losses):
+        power_losses = None
+
+    return Point(
+        suc=suc,
+        disch=disch,
+        flow_v=values["flow_v"],
+        speed=values["speed"],
+        b=values["b"],
+        D=values["D"],
+        power_losses=power_losses,
+        polytropic_method=polytropic_method,
+    )
+
+
+class PointRecord:
+    """A single row of a ccp.PointTable.
+
+    Values are stored as floats in SI units (see ccp.PointTable.units).
+    The full ccp.Point can be recreated with :py:meth:`to_point`.
+
+    Parameters
+    ----------
+    fluid : dict
+        Dictionary with constituent and composition (mole fraction).
+    EOS : str
+        Equation of state used to calculate the point.
+    polytropic_method : str
+        Polytropic method used to calculate the point.
+    **values : float
+        Value for each column of the table.
+    """
+
+    __slots__ = ("fluid", "EOS", "polytropic_method") + _point_table_columns
+
+    def __init__(self, fluid, EOS, polytropic_method, **values):
+        self.fluid = fluid
+        self.EOS = EOS
+        self.polytropic_method = polytropic_method
+        for column in _point_table_columns:
+            setattr(self, column, float(values.get(column, np.nan)))
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{column}={getattr(self, column):.6g}"
+            for column in ("flow_v", "speed", "head", "eff")
+        )
+        return f"{self.__class__.__name__}({values})"
+
+    def to_point(self):
+        """Recreate the ccp.Point for this record.
+
+        The point is calculated from the suction and discharge states, flow,
+        speed, impeller dimensions and power losses, with the EOS and
+        polytropic method of the table.
+
+        Returns
+        -------
+        point : ccp.Point
+        """
+        values = {column: getattr(self, column) for column in _point_table_columns}
+        return _rehydrate(self.fluid, values, self.EOS, self.polytropic_method)
+
+
+class PointTable:
+    """Columnar table with the scalar results of performance points.
+
+    Each column is stored as float in SI units in a NumPy structured array,
+    so that a large number of points can be kept in memory without the
+    ccp.Point and ccp.State objects. A full ccp.Point can be recreated on
+    demand for any row with :py:meth:`to_point`.
+
+    Parameters
+    ----------
+    data : dict, pandas.DataFrame or numpy.ndarray, optional
+        Values for each column. Values can be floats (SI units are
+        considered) or pint quantities. Missing columns are filled with NaN.
+        Available columns are listed in ccp.PointTable.units.
+    fluid : dict
+        Dictionary with constituent and composition (mole fraction) shared
+        by all points in the table.
+    EOS : str, optional
+        Equation of state used to calculate the points. It is also used to
+        recreate the points with :py:meth:`to_point`.
+        Default is ccp.config.EOS.
+    polytropic_method : str, optional
+        Polytropic method used to calculate the points. It is also used to
+        recreate the points with :py:meth:`to_point`.
+        Default is ccp.config.POLYTROPIC_METHOD.
+
+    Returns
+    -------
+    table : ccp.PointTable
+
+    Examples
+    --------
+    >>> import ccp
+    >>> data = dict(flow_v=[1.0, 2.0], head=[100e3, 90e3])
+    >>> table = ccp.PointTable(data, fluid={"methane": 1.0})
+    >>> table.head.to("kJ/kg")
+    <Quantity([100.  90.], 'kilojoule / kilogram')>
+    """
+
+    units = _point_table_units
+
+    def __init__(self, data=None, fluid=None, EOS=None, polytropic_method=None):
+        if fluid is None:
+            raise TypeError("A fluid is required. Provide as fluid=dict(...)")
+        if EOS is None:
+            EOS = ccp.config.EOS
+        if polytropic_method is None:
+            polytropic_method = ccp.config.POLYTROPIC_METHOD
+        self.fluid = fluid
+        self.EOS = EOS
+        self.polytropic_method = polytropic_method
+
+        if data is None:
+            data = {}
+        if isinstance(data, np.ndarray) and data.dtype == _point_table_dtype:
+            self.data = data
+            return
+
+        columns = {}
+        for column, values in dict(data).items():
+            if column not in _point_table_units:
+                raise ValueError(
+                    f"Column {column!r} is not available. "
+                    f"Options are: {', '.join(_point_table_columns)}."
+                )
+            if isinstance(values, Q_):
+                values = values.to(_point_table_units[column]).m
+            columns[column] = np.atleast_1d(np.asarray(values, dtype=float))
+
+        size = max((len(values) for values in columns.values()), default=0)
+        self.data = np.full(size, np.nan, dtype=_point_table_dtype)
+        for column, values in columns.items():
+            self.data[column] = values
+
+    @classmethod
+    def from_points(cls, points):
+        """Create a table from a list of points.
+
+        Parameters
+        ----------
+        points : list
+            List with ccp.Point objects. All points must have the same fluid,
+            equation of state and polytropic method.
+
+        Returns
+        -------
+        table : ccp.PointTable
+        """
+        points = list(points)
+        if not points:
+            raise ValueError("At least 1 point should be given.")
+        fluid = points[0].suc.fluid
+        EOS = points[0].suc.EOS
+        polytropic_method = points[0].polytropic_method
+        table = cls(fluid=fluid, EOS=EOS, polytropic_method=polytropic_method)
+        table.data = np.empty(len(points), dtype=_point_table_dtype)
+        for i, point in enumerate(points):
+            if point.suc.fluid != fluid:
+                raise ValueError("Fluid for each point should be equal.")
+            if point.suc.EOS != EOS or point.polytropic_method != polytropic_method:
+                raise ValueError(
+                    "EOS and polytropic method for each point should be equal."
+                )
+            table.data[i] = tuple(_point_values(point).values())
+
+        return table
+
+    @classmethod
+    def concatenate(cls, tables):
+        """Join tables with the same fluid, EOS and polytropic method.
+
+        Parameters
+        ----------
+        tables : list
+            List with ccp.PointTable objects.
+
+        Returns
+        -------
+        table : ccp.PointTable
+        """
+        tables = list(tables)
+        fluid = tables[0].fluid
+        EOS = tables[0].EOS
+        polytropic_method = tables[0].polytropic_method
+        for table in tables:
+            if table.fluid != fluid:
+                raise ValueError("Fluid for each table should be equal.")
+            if table.EOS != EOS or table.polytropic_method != polytropic_method:
+                raise ValueError(
+                    "EOS and polytropic method for each table should be equal."
+                )
+
+        return cls(
+            np.concatenate([table.data for table in tables]),
+            fluid=fluid,
+            EOS=EOS,
+            polytropic_method=polytropic_method,
+        )
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            row = self.data[item]
+            return PointRecord(
+                self.fluid,
+                self.EOS,
+                self.polytropic_method,
+                **{column: row[column] for column in _point_table_columns},
+            )
+
+        return self.__class__(
+            np.atleast_1d(self.data[item]),
+            fluid=self.fluid,
+            EOS=self.EOS,
+            polytropic_method=self.polytropic_method,
+        )
+
+    def __getattr__(self, name):
+        # columns are returned as pint quantities, e.g.: table.head
+        if name in _point_table_units:
+            return Q_(self.data[name], _point_table_units[name])
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(points={len(self)}, fluid={self.fluid})"
+
+    @property
+    def nbytes(self):
+        """Memory used by the table values (bytes)."""
+        return self.data.nbytes
+
+    def to_point(self, index):
+        """Recreate the ccp.Point for a row of the table.
+
+        The point is calculated from the suction and discharge states, flow,
+        speed, impeller dimensions and power losses, with the EOS and
+        polytropic method of the table.
+
+        Parameters
+        ----------
+        index : int
+            Row index.
+
+        Returns
+        -------
+        point : ccp.Point
+        """
+        row = self.data[index]
+        return _rehydrate(
+            self.fluid,
+            {column: row[column] for column in _point_table_columns},
+            self.EOS,
+            self.polytropic_method,
+        )
+
+    def to_dataframe(self):
+        """Return the table as a pandas.DataFrame with values in SI units."""
+        return pd.DataFrame(self.data)
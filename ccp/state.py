@@ -1,3 +1,5 @@
+import threading
+from contextlib import contextmanager
 from copy import copy
 from warnings import warn
 
@@ -12,6 +14,7 @@ from . import _RP
 from . import Q_
 from .config.fluids import get_name, normalize_mix
 from .config.units import check_units
+from .config.utilities import LRUCache
 
 
 class State(CP.AbstractState):
@@ -46,6 +49,15 @@ class State(CP.AbstractState):
     -------
     state : ccp.State
 
+    Notes
+    -----
+    Accessors such as :py:meth:`p` or :py:meth:`h` return pint quantities.
+    For solver loops, where the unit handling overhead is comparable to the
+    EOS calls, the state can be updated with :py:meth:`update_si` and read
+    with the ``*_si`` accessors (:py:meth:`p_si`, :py:meth:`T_si`,
+    :py:meth:`h_si`, :py:meth:`s_si`, :py:meth:`rho_si` and :py:meth:`v_si`),
+    which take and return plain floats in SI units.
+
     Examples
     --------
     >>> import ccp
@@ -124,7 +136,7 @@ class State(CP.AbstractState):
                     "You might have repeated components in the fluid dictionary."
                 )
 
-        self.update(**self.setup_args)
+        self._update_quantities(**self.setup_args)
 
     def __repr__(self):
         args = {k: v for k, v in self.init_args.items() if v is not None}
@@ -330,6 +342,30 @@ class State(CP.AbstractState):
             v = (1 / self.rho()).to(units)
         return v
 
+    def p_si(self):
+        """Pressure as a float in Pa."""
+        return super().p()
+
+    def T_si(self):
+        """Temperature as a float in degK."""
+        return super().T()
+
+    def h_si(self):
+        """Enthalpy as a float in J/kg."""
+        return super().hmass()
+
+    def s_si(self):
+        """Entropy as a float in J/(kg degK)."""
+        return super().smass()
+
+    def rho_si(self):
+        """Specific mass as a float in kg/m**3."""
+        return super().rhomass()
+
+    def v_si(self):
+        """Specific volume as a float in m**3/kg."""
+        return 1 / super().rhomass()
+
     def z(self, units=None):
         """Compressibility (dimensionless).
 
@@ -355,13 +391,13 @@ class State(CP.AbstractState):
             )
         except ValueError:
             # manually calculate the derivative for REFPROP 9.1
-            dummy_state = copy(self)
             p0 = self.p()
             p1 = p0 + Q_(1e-6, "Pa")
 
-            dummy_state.update(p=p1, s=self.s())
+            with self.scratch() as dummy_state:
+                dummy_state.update(p=p1, s=self.s())
+                rho1 = dummy_state.rho()
             rho0 = self.rho()
-            rho1 = dummy_state.rho()
             delta_p = p1 - p0
             delta_rho = rho1 - rho0
             speed_sound = Q_(np.sqrt(delta_p / delta_rho), "m/s")
@@ -416,13 +452,13 @@ class State(CP.AbstractState):
             )
         except ValueError:
             # manually calculate the derivative for REFPROP 9.1
-            dummy_state = copy(self)
             p0 = self.p()
             p1 = p0 + Q_(1e-1, "Pa")
 
-            dummy_state.update(p=p1, s=self.s())
+            with self.scratch() as dummy_state:
+                dummy_state.update(p=p1, s=self.s())
+                v1 = dummy_state.v()
             v0 = self.v()
-            v1 = dummy_state.v()
             dp = p1 - p0
             dv = v1 - v0
             dpdv_s = dp / dv
@@ -471,13 +507,13 @@ class State(CP.AbstractState):
             )
         except ValueError:
             # manually calculate the derivative for REFPROP 9.1
-            dummy_state = copy(self)
             p0 = self.p()
             p1 = p0 + Q_(1e-1, "Pa")
 
-            dummy_state.update(p=p1, s=self.s())
+            with self.scratch() as dummy_state:
+                dummy_state.update(p=p1, s=self.s())
+                T1 = dummy_state.T()
             T0 = self.T()
-            T1 = dummy_state.T()
             dp = p1 - p0
             dT = T1 - T0
             dTdp_s = dT / dp
@@ -605,127 +641,249 @@ class State(CP.AbstractState):
             Enthalpy (J/kg).
         s : float, pint.Quantity
             Entropy (J/(kg*degK)).
+
+        Notes
+        -----
+        If ccp.config.STATE_CACHE_SIZE is greater than zero, flash results are
+        stored in a bounded LRU cache keyed by the fluid composition, the EOS and
+        the input pair rounded to ccp.config.STATE_CACHE_DIGITS significant digits.
+        A repeated flash is then replaced by an update with density and
+        temperature, which does not require iterations.
+        See :py:func:`flash_cache_info` and :py:func:`flash_cache_clear`.
+        """
+        self._update_quantities(p=p, T=T, rho=rho, h=h, s=s)
+
+    def update_si(self, p=None, T=None, rho=None, h=None, s=None):
+        """Update the state with SI magnitudes.
+
+        This is the unit-free counterpart of :py:meth:`update`. Arguments are
+        plain floats in SI units and are not checked by the units decorator,
+        which avoids the pint overhead in solver loops.
+
+        Parameters
+        ----------
+        p : float
+            Pressure (Pa).
+        T : float
+            Temperature (degK).
+        rho : float
+            Specific mass (kg/m**3).
+        h : float
+            Enthalpy (J/kg).
+        s : float
+            Entropy (J/(kg*degK)).
+
+        Examples
+        --------
+        >>> import ccp
+        >>> fluid = {"Methane": 0.5, "Ethane": 0.5}
+        >>> state = ccp.State(p=100000, T=300, fluid=fluid)
+        >>> state.update_si(p=200000, T=310)
+        >>> state.T_si()
+        310.0
         """
-        args = locals().copy()
-        for item in ["kwargs", "self", "__class__"]:
-            args.pop(item)
-        args = [k for k, v in args.items() if v is not None]
+        inputs = dict(p=p, T=T, rho=rho, h=h, s=s)
         try:
-            if p is not None and T is not None:
-                try:
-                    super().update(CP.PT_INPUTS, p.magnitude, T.magnitude)
-                except ValueError:
-                    # handle convergence error by forcing gas state directly with REFPROP
-                    # calculate with p and T and update with their values
-                    fluids = self._fluid.replace("&", "*")
-                    r = _RP.REFPROPdll(
-                        fluids,
-                        "PTV",
-                        "H,P",
-                        _RP.MASS_BASE_SI,
-                        0,
-                        0,
-                        p.magnitude,
-                        T.magnitude,
-                        self.get_mole_fractions(),
-                    )
-                    super().update(CP.HmassP_INPUTS, r.Output[0], r.Output[1])
-            elif p is not None and rho is not None:
+            self._update(**inputs)
+        except ValueError as e:
+            raise self._update_error(inputs) from e
+
+    def _update_quantities(self, p=None, T=None, rho=None, h=None, s=None):
+        """Update the state with quantities already converted to SI units."""
+        inputs = dict(p=p, T=T, rho=rho, h=h, s=s)
+        try:
+            self._update(
+                **{k: (None if v is None else v.magnitude) for k, v in inputs.items()}
+            )
+        except ValueError as e:
+            raise self._update_error(inputs) from e
+
+    def _update_error(self, inputs):
+        args_dict = {k: v for k, v in inputs.items() if v is not None}
+        args_dict["fluid"] = self.fluid
+        args_repr = (
+            str(args_dict).replace(">", "").replace("<", "").replace("Quantity", "Q_")
+        )
+
+        return ValueError(f"Could not define state with ccp.State(**{args_repr})")
+
+    def _update(self, p=None, T=None, rho=None, h=None, s=None):
+        """Flash calculation with SI magnitudes."""
+        args = [
+            k for k, v in dict(p=p, T=T, rho=rho, h=h, s=s).items() if v is not None
+        ]
+
+        cache_key = None
+        if ccp.config.STATE_CACHE_SIZE > 0:
+            _flash_cache.maxsize = ccp.config.STATE_CACHE_SIZE
+            cache_key = self._flash_cache_key(
+                {k: v for k, v in zip(["p", "T", "rho", "h", "s"], [p, T, rho, h, s])}
+            )
+            cached = _flash_cache.get(cache_key)
+            if cached is not None:
                 try:
-                    super().update(CP.DmassP_INPUTS, rho.magnitude, p.magnitude)
+                    super().update(CP.DmassT_INPUTS, *cached)
+                    return
                 except ValueError:
-                    # handle convergence error by forcing gas state directly with REFPROP
-                    # calculate with p and T and update with their values
-                    fluids = self._fluid.replace("&", "*")
-                    r = _RP.REFPROPdll(
-                        fluids,
-                        "DPV",
-                        "P,T",
-                        _RP.MASS_BASE_SI,
-                        0,
-                        0,
-                        rho.magnitude,
-                        p.magnitude,
-                        self.get_mole_fractions(),
-                    )
-                    super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
-
-            elif p is not None and h is not None:
-                super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
-            elif p is not None and s is not None:
-                if ccp.config.EOS == "REFPROP":
-                    try:
-                        super().update(CP.PSmass_INPUTS, p.magnitude, s.magnitude)
-                    except ValueError:
-                        # handle convergence error by forcing gas state directly with REFPROP
-                        # calculate with p and T and update with their values
-                        fluids = self._fluid.replace("&", "*")
-                        r = _RP.REFPROPdll(
-                            fluids,
-                            "PSV",
-                            "P,T",
-                            _RP.MASS_BASE_SI,
-                            0,
-                            0,
-                            p.magnitude,
-                            s.magnitude,
-                            self.get_mole_fractions(),
-                        )
-                        super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
+                    pass
+
+        if p is not None and T is not None:
+            try:
+                super().update(CP.PT_INPUTS, p, T)
+            except ValueError:
+                # handle convergence error by forcing gas state directly with REFPROP
+                # calculate with p and T and update with their values
+                fluids = self._fluid.replace("&", "*")
+                r = _RP.REFPROPdll(
+                    fluids,
+                    "PTV",
+                    "H,P",
+                    _RP.MASS_BASE_SI,
+                    0,
+                    0,
+                    p,
+                    T,
+                    self.get_mole_fractions(),
+                )
+                super().update(CP.HmassP_INPUTS, r.Output[0], r.Output[1])
+        elif p is not None and rho is not None:
+            try:
+                super().update(CP.DmassP_INPUTS, rho, p)
+            except ValueError:
+                # handle convergence error by forcing gas state directly with REFPROP
+                # calculate with p and T and update with their values
+                fluids = self._fluid.replace("&", "*")
+                r = _RP.REFPROPdll(
+                    fluids,
+                    "DPV",
+                    "P,T",
+                    _RP.MASS_BASE_SI,
+                    0,
+                    0,
+                    rho,
+                    p,
+                    self.get_mole_fractions(),
+                )
+                super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
 
-                else:
-                    # ps update not available for some EOS, this is a workaround based on:
-                    # https://github.com/CoolProp/CoolProp/issues/2000
-                    def objective(T):
-                        super(State, self).update(CP.PT_INPUTS, p.magnitude, T)
-                        return self.smass() - s.magnitude
-
-                    T0 = self.T().m
-                    if T0 == float("-inf"):
-                        T0 = 300
-                    newton(objective, x0=T0)
-            elif rho is not None and s is not None:
+        elif p is not None and h is not None:
+            super().update(CP.HmassP_INPUTS, h, p)
+        elif p is not None and s is not None:
+            if ccp.config.EOS == "REFPROP":
                 try:
-                    super().update(CP.DmassSmass_INPUTS, rho.magnitude, s.magnitude)
+                    super().update(CP.PSmass_INPUTS, p, s)
                 except ValueError:
                     # handle convergence error by forcing gas state directly with REFPROP
                     # calculate with p and T and update with their values
                     fluids = self._fluid.replace("&", "*")
                     r = _RP.REFPROPdll(
                         fluids,
-                        "DSV",
+                        "PSV",
                         "P,T",
                         _RP.MASS_BASE_SI,
                         0,
                         0,
-                        rho.magnitude,
-                        s.magnitude,
+                        p,
+                        s,
                         self.get_mole_fractions(),
                     )
                     super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
-            elif rho is not None and T is not None:
-                super().update(CP.DmassT_INPUTS, rho.magnitude, T.magnitude)
-            elif h is not None and s is not None:
-                super().update(CP.HmassSmass_INPUTS, h.magnitude, s.magnitude)
-            elif T is not None and s is not None:
-                super().update(CP.SmassT_INPUTS, s.magnitude, T.magnitude)
+
             else:
-                raise KeyError(f"Update key " f"{args}" f" not implemented")
-        except ValueError as e:
-            args_dict = {}
-            for k in args:
-                args_dict[k] = locals()[k]
-            args_dict["fluid"] = self.fluid
-            args_repr = (
-                str(args_dict)
-                .replace(">", "")
-                .replace("<", "")
-                .replace("Quantity", "Q_")
+                # ps update not available for some EOS, this is a workaround based on:
+                # https://github.com/CoolProp/CoolProp/issues/2000
+                def objective(T):
+                    super(State, self).update(CP.PT_INPUTS, p, T)
+                    return self.smass() - s
+
+                T0 = super().T()
+                if T0 == float("-inf"):
+                    T0 = 300
+                newton(objective, x0=T0)
+        elif rho is not None and s is not None:
+            try:
+                super().update(CP.DmassSmass_INPUTS, rho, s)
+            except ValueError:
+                # handle convergence error by forcing gas state directly with REFPROP
+                # calculate with p and T and update with their values
+                fluids = self._fluid.replace("&", "*")
+                r = _RP.REFPROPdll(
+                    fluids,
+                    "DSV",
+                    "P,T",
+                    _RP.MASS_BASE_SI,
+                    0,
+                    0,
+                    rho,
+                    s,
+                    self.get_mole_fractions(),
+                )
+                super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
+        elif rho is not None and T is not None:
+            super().update(CP.DmassT_INPUTS, rho, T)
+        elif h is not None and s is not None:
+            super().update(CP.HmassSmass_INPUTS, h, s)
+        elif T is not None and s is not None:
+            super().update(CP.SmassT_INPUTS, s, T)
+        else:
+            raise KeyError(f"Update key " f"{args}" f" not implemented")
+
+        if cache_key is not None:
+            _flash_cache.put(cache_key, (self.rhomass(), super().T()))
+
+    def _flash_cache_key(self, inputs):
+        """Key for the flash cache with fluid, EOS and the rounded input pair."""
+        digits = ccp.config.STATE_CACHE_DIGITS
+        input_pair = tuple(
+            (k, float(f"{v:.{digits}g}")) for k, v in inputs.items() if v is not None
+        )
+        return self._fluid_key() + (input_pair,)
+
+    def _fluid_key(self):
+        """Key with the EOS backend and the fluid composition."""
+        return (self.backend_name(), self._fluid, tuple(self.fluid.values()))
+
+    @contextmanager
+    def scratch(self):
+        """Work state with the same fluid and EOS, set to this state.
+
+        The work state is taken from a pool of pre-built states with the mole
+        fractions already set, and is returned to the pool at the end of the
+        block. This avoids building a new EOS backend, as done by
+        ``copy(state)``, for intermediate calculations. The work state should
+        not be used outside the ``with`` block.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> fluid = {"Methane": 0.5, "Ethane": 0.5}
+        >>> state = ccp.State(p=100000, T=300, fluid=fluid)
+        >>> with state.scratch() as work:
+        ...     work.update(p=200000, T=310)
+        ...     work.T()
+        <Quantity(310.0, 'kelvin')>
+        >>> state.T()
+        <Quantity(300.0, 'kelvin')>
+        """
+        key = self._fluid_key()
+        with _scratch_lock:
+            free_states = _scratch_pool.get(key)
+            work = free_states.pop() if free_states else None
+
+        if work is None:
+            work = self.__class__(
+                p=self.p(), T=self.T(), fluid=self.fluid, EOS=self.EOS
             )
+        else:
+            work.update_si(rho=self.rho_si(), T=self.T_si())
 
-            raise ValueError(
-                f"Could not define state with ccp.State(**{args_repr})"
-            ) from e
+        try:
+            yield work
+        finally:
+            with _scratch_lock:
+                free_states = _scratch_pool.setdefault(work._fluid_key(), [])
+                if len(free_states) < _SCRATCH_POOL_SIZE:
+                    free_states.append(work)
 
     def get_coolprop_state(self):
         """Return a CoolProp state object."""
@@ -874,3 +1032,419 @@ class State(CP.AbstractState):
         )
 
         return fig
+
+
+_flash_cache = LRUCache(maxsize=ccp.config.STATE_CACHE_SIZE)
+
+# free work states for State.scratch, keyed by EOS backend and fluid composition
+_SCRATCH_POOL_SIZE = 4
+_scratch_pool = {}
+_scratch_lock = threading.Lock()
+
+
+def flash_cache_info():
+    """Flash cache statistics.
+
+    Returns
+    -------
+    info : CacheInfo
+        Named tuple with hits, misses, maxsize and currsize.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> ccp.state.flash_cache_clear()
+    >>> ccp.state.flash_cache_info()
+    CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+    """
+    _flash_cache.maxsize = ccp.config.STATE_CACHE_SIZE
+    return _flash_cache.info()
+
+
+def flash_cache_clear():
+    """Remove all results from the flash cache and reset its counters."""
+    _flash_cache.clear()
+
+
+class StateArray:
+    """Thermodynamic states evaluated over arrays of properties.
+
+    Evaluates a sequence of states from arrays of two properties using a single
+    underlying ccp.State, so that the fluid backend is created only once.
+    Each row is flashed with :py:meth:`ccp.State.update`, which keeps the
+    REFPROP fallbacks available for the scalar state.
+    Properties are returned as array-backed pint quantities.
+
+    Parameters
+    ----------
+    p : array-like, pint.Quantity
+        Pressure
+    T : array-like, pint.Quantity
+        Temperature
+    h : array-like, pint.Quantity
+        Enthalpy
+    s : array-like, pint.Quantity
+        Entropy
+    rho : array-like, pint.Quantity
+        Specific mass
+    fluid : dict
+        Dictionary with constituent and composition (mole fraction).
+        (e.g.: fluid={'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092})
+    EOS : str, optional
+        String with REFPROP, HEOS, PR or SRK.
+        Default is set in ccp.config.EOS
+    errors : str, optional
+        If "raise", a ValueError is raised when a state can not be calculated.
+        If "coerce", the properties for that row are set to NaN.
+        Default is "raise".
+
+    Returns
+    -------
+    states : ccp.StateArray
+
+    Examples
+    --------
+    >>> import ccp
+    >>> Q_ = ccp.Q_
+    >>> fluid = {'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092}
+    >>> states = ccp.StateArray(p=Q_([1, 2], 'bar'), T=300, fluid=fluid)
+    >>> states.p('bar')
+    <Quantity([1. 2.], 'bar')>
+    >>> states[1]
+    State(p=Q_("200000 Pa"), T=Q_("300 K"), fluid={"NITROGEN": 0.78120, "OXYGEN": 0.20960, "ARGON": 0.00920})
+    """
+
+    @check_units
+    def __init__(
+        self,
+        p=None,
+        T=None,
+        h=None,
+        s=None,
+        rho=None,
+        fluid=None,
+        EOS=None,
+        errors="raise",
+    ):
+        if fluid is None:
+            raise TypeError("A fluid is required. Provide as fluid=dict(...)")
+        if errors not in ("raise", "coerce"):
+            raise ValueError('errors must be "raise" or "coerce"')
+
+        self.EOS = EOS
+        self.errors = errors
+        self._state = None
+        self._fluid_arg = fluid
+        # set as in ccp.State, so that it is available even if no row is valid
+        constituents = [get_name(k) for k in fluid]
+        molar_fractions = list(fluid.values())
+        normalize_mix(molar_fractions)
+        self.fluid = dict(zip(constituents, molar_fractions))
+        self.update(p=p, T=T, h=h, s=s, rho=rho)
+
+    @check_units
+    def update(self, p=None, T=None, h=None, s=None, rho=None):
+        """Update the states with new arrays of properties.
+
+        The underlying ccp.State is reused.
+
+        Parameters
+        ----------
+        p : array-like, pint.Quantity
+            Pressure (Pa).
+        T : array-like, pint.Quantity
+            Temperature (degK).
+        h : array-like, pint.Quantity
+            Enthalpy (J/kg).
+        s : array-like, pint.Quantity
+            Entropy (J/(kg*degK)).
+        rho : array-like, pint.Quantity
+            Specific mass (kg/m**3).
+        """
+        inputs = {
+            k: v for k, v in dict(p=p, T=T, h=h, s=s, rho=rho).items() if v is not None
+        }
+        if len(inputs) != 2:
+            raise KeyError(f"Update key {list(inputs)} not implemented")
+
+        magnitudes = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(v.m, dtype=float)) for v in inputs.values()]
+        )
+        self.init_args = dict(zip(inputs, magnitudes))
+        self._columns = {k: np.full(len(self), np.nan) for k in _state_array_columns}
+        self._units = {}
+        self.valid = np.zeros(len(self), dtype=bool)
+
+        for i in range(len(self)):
+            row = {k: v[i] for k, v in self.init_args.items()}
+            try:
+                if self._state is None:
+                    self._state = State(**row, fluid=self._fluid_arg, EOS=self.EOS)
+                else:
+                    # magnitudes are already in SI units, skip the units check
+                    self._state.update_si(**row)
+            except ValueError:
+                if self.errors == "raise":
+                    raise
+                continue
+
+            self.valid[i] = True
+            for k, func in _state_array_columns.items():
+                self._columns[k][i] = func(self._state)
+
+    def __len__(self):
+        return len(next(iter(self.init_args.values())))
+
+    def __getitem__(self, item):
+        if not isinstance(item, (int, np.integer)):
+            raise TypeError(
+                f"{self.__class__.__name__} indices must be integers, "
+                f"not {type(item).__name__}. Use the property arrays "
+                f"(e.g. states.p()[1:]) to select multiple rows."
+            )
+        if not self.valid[item]:
+            raise ValueError(f"State {item} could not be calculated.")
+        return State(
+            p=self._columns["p"][item],
+            T=self._columns["T"][item],
+            fluid=self.fluid,
+            EOS=self.EOS,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={len(self)}, fluid={self.fluid})"
+
+    def _evaluate(self, attr):
+        """Evaluate a ccp.State accessor for each row and cache the magnitudes."""
+        if attr not in self._columns:
+            values = np.full(len(self), np.nan)
+            state = self._state
+            for i in np.flatnonzero(self.valid):
+                try:
+                    CP.AbstractState.update(
+                        state,
+                        CP.DmassT_INPUTS,
+                        self._columns["rho"][i],
+                        self._columns["T"][i],
+                    )
+                except ValueError:
+                    state.update_si(**{k: v[i] for k, v in self.init_args.items()})
+                value = getattr(state, attr)()
+                values[i] = value.m
+                self._units[attr] = value.units
+            self._columns[attr] = values
+
+        return self._columns[attr]
+
+    def _probe(self):
+        """State with the fluid of the array at standard conditions.
+
+        Used for values that do not depend on the rows (units, molar mass),
+        since self._state is not created if no row is valid.
+        """
+        if self._state is not None:
+            return self._state
+        return State(p=101325, T=288.15, fluid=self._fluid_arg, EOS=self.EOS)
+
+    def _attr_units(self, attr):
+        """Units of a ccp.State accessor.
+
+        Units are taken from the evaluated rows. If no row is valid, they are
+        taken from a probe state at standard conditions.
+        """
+        if attr not in self._units:
+            self._units[attr] = getattr(self._probe(), attr)().units
+
+        return self._units[attr]
+
+    def _quantity(self, attr, units):
+        if attr in _state_array_units:
+            values = Q_(self._columns[attr], _state_array_units[attr])
+        else:
+            values = Q_(self._evaluate(attr), self._attr_units(attr))
+        if units:
+            values = values.to(units)
+        return values
+
+    def p(self, units=None):
+        """Pressure in Pascal.
+
+        Returns
+        -------
+        p : pint.Quantity
+            Pressure (pascal).
+        """
+        return self._quantity("p", units)
+
+    def T(self, units=None):
+        """Temperature in Kelvin.
+
+        Returns
+        -------
+        T : pint.Quantity
+            Temperature (Kelvin).
+        """
+        return self._quantity("T", units)
+
+    def h(self, units=None):
+        """Specific Enthalpy (joule/kilogram).
+
+        Returns
+        -------
+        h : pint.Quantity
+            Enthalpy (joule/kilogram).
+        """
+        return self._quantity("h", units)
+
+    def s(self, units=None):
+        """Specific entropy (per unit of mass).
+
+        Returns
+        -------
+        s : pint.Quantity
+            Entropy (joule/(kelvin kilogram)).
+        """
+        return self._quantity("s", units)
+
+    def rho(self, units=None):
+        """Specific mass (kilogram/m**3).
+
+        Returns
+        -------
+        rho : pint.Quantity
+            Specific mass (kilogram/m**3).
+        """
+        return self._quantity("rho", units)
+
+    def v(self, units=None):
+        """Specific volume (m**3/kilogram).
+
+        Returns
+        -------
+        v : pint.Quantity
+            Specific volume (m**3/kilogram).
+        """
+        v = 1 / self.rho()
+        if units:
+            v = v.to(units)
+        return v
+
+    def cp(self, units=None):
+        """Specific heat at constant pressure joule/(kilogram kelvin).
+
+        Returns
+        -------
+        cp : pint.Quantity
+            Specific heat at constant pressure joule/(kilogram kelvin).
+        """
+        return self._quantity("cp", units)
+
+    def cv(self, units=None):
+        """Specific heat at constant volume joule/(kilogram kelvin).
+
+        Returns
+        -------
+        cv : pint.Quantity
+            Specific heat at constant volume joule/(kilogram kelvin).
+        """
+        return self._quantity("cv", units)
+
+    def z(self, units=None):
+        """Compressibility (dimensionless).
+
+        Returns
+        -------
+        z : pint.Quantity
+            Compressibility (dimensionless).
+        """
+        return self._quantity("z", units)
+
+    def speed_sound(self, units=None):
+        """Speed of sound (m/s).
+
+        Returns
+        -------
+        speed_sound : pint.Quantity
+            Speed of sound (m/s).
+        """
+        return self._quantity("speed_sound", units)
+
+    def viscosity(self, units=None):
+        """Viscosity in pascal second.
+
+        Returns
+        -------
+        viscosity : pint.Quantity
+            Viscosity (pascal second)
+        """
+        return self._quantity("viscosity", units)
+
+    def kinematic_viscosity(self, units=None):
+        """Kinematic viscosity in m²/s.
+
+        Returns
+        -------
+        kinematic_viscosity : pint.Quantity
+            Kinematic viscosity (m²/s)
+        """
+        kinematic_viscosity = (self.viscosity() / self.rho()).to("m²/s")
+        if units:
+            kinematic_viscosity = kinematic_viscosity.to(units)
+        return kinematic_viscosity
+
+    def kv(self, units=None):
+        """Isentropic volume exponent (dimensionless).
+
+        Returns
+        -------
+        kv : pint.Quantity
+            Isentropic volume exponent (dimensionless).
+        """
+        return self._quantity("kv", units)
+
+    def conductivity(self, units=None):
+        """Thermal conductivity (W/m/K).
+
+        Returns
+        -------
+        conductivity : pint.Quantity
+            Thermal conductivity (W/m/K).
+        """
+        return self._quantity("conductivity", units)
+
+    def molar_mass(self, units=None):
+        """Molar mass in kg/mol.
+
+        Returns
+        -------
+        molar_mass : pint.Quantity
+            Molar mass (kg/mol).
+        """
+        return self._probe().molar_mass(units)
+
+    def gas_constant(self, units=None):
+        """Gas constant in joule / (mol kelvin).
+
+        Returns
+        -------
+        gas_constant : pint.Quantity
+            Gas constant (joule / (mol kelvin).
+        """
+        return self._probe().gas_constant(units)
+
+
+# columns evaluated for each row while flashing the StateArray
+_state_array_columns = {
+    "p": CP.AbstractState.p,
+    "T": CP.AbstractState.T,
+    "h": CP.AbstractState.hmass,
+    "s": CP.AbstractState.smass,
+    "rho": CP.AbstractState.rhomass,
+}
+_state_array_units = {
+    "p": "pascal",
+    "T": "kelvin",
+    "h": "joule/kilogram",
+    "s": "joule/(kelvin kilogram)",
+    "rho": "kilogram/m**3",
+}
@@ -74,3 +74,40 @@ def test_pickle(curve0):
     assert pickled_curve0 == curve0
     assert hasattr(curve0, "head_plot") is True
     assert hasattr(pickled_curve0, "head_plot") is True
+
+
+def test_lazy_attributes(curve0):
+    for obj, attr in [(curve0, "head"), (curve0.suc, "p"), (curve0.disch, "T")]:
+        assert f"{attr}_plot" not in obj.__dict__
+        assert f"{attr}_interpolated" not in obj.__dict__
+        plot = getattr(obj, f"{attr}_plot")
+        # created once and stored in the instance
+        assert getattr(obj, f"{attr}_plot") is plot
+        assert f"{attr}_plot" in obj.__dict__
+
+    assert_allclose(curve0.head_interpolated(1.5), curve0.head.mean())
+
+
+def test_curve_data(curve0):
+    assert_allclose(curve0.data["flow_v"], [1.0, 2.0])
+    assert_allclose(curve0.data["head"], curve0.head.m)
+    assert_allclose(curve0.data["disch_T"], [370.0, 375.0])
+    assert curve0.units["disch_p"] == "pascal"
+
+    interpolant = curve0._interpolant("head")
+    curve0.head_interpolated(1.5)
+    assert curve0._interpolant("head") is interpolant
+
+    # changing the points resets the data and the interpolants
+    p0, p1 = curve0.points
+    disch = State(p=Q_(2.8, "bar"), T=380, fluid={"co2": 1 - 1e-15, "n2": 1e-15})
+    p2 = Point(suc=p0.suc, disch=disch, flow_v=3, speed=1, b=1, D=1)
+    curve0.points = [p2, p0]
+    assert_allclose(curve0.flow_v.m, [1.0, 3.0])
+    assert curve0._interpolant("head") is not interpolant
+    assert_allclose(curve0.disch.T(), [370.0, 380.0])
+
+    # points modified in place are also detected
+    curve0.points[1] = p1
+    assert_allclose(curve0.flow_v.m, [1.0, 2.0])
+    assert_allclose(curve0.head_interpolated(1.5), curve0.head.mean())
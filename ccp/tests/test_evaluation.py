@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import ccp
 from numpy.testing import assert_allclose
@@ -348,6 +349,7 @@ def test_evaluation_calculate_points_delta_p_flag():
     df_results = df_results[df_results.valid]
     assert_allclose(df_results["delta_eff"].mean(), 11.237109, rtol=1e-2)
 
+
 def test_evaluation_calculate_points_delta_p_3_values():
     data_path = Path(ccp.__file__).parent / "tests/data"
     # load data.parquet
@@ -415,3 +417,163 @@ def test_evaluation_calculate_points_delta_p_3_values():
     df_results = evaluation.calculate_points(df[:3], drop_invalid_values=False)
     # check mean with invalid values (-1)
     assert_allclose(df_results["delta_eff"].mean(), -1, rtol=1e-2)
+
+
+def test_calculate_points_chunk():
+    from ccp.evaluation import calculate_points_chunk, set_points_context
+
+    fluid = {"AIR": 1.0}
+    suc = ccp.State(p=Q_(1, "bar"), T=300, fluid=fluid)
+    points = [
+        ccp.Point(suc=suc, speed=1000, flow_v=flow_v, head=head, eff=0.8, b=0.01, D=0.3)
+        for flow_v, head in [(1.0, 80e3), (1.5, 75e3), (2.0, 60e3)]
+    ]
+    imp = ccp.Impeller(points)
+    set_points_context([imp], fluid)
+
+    # ps, Ts, pd, Td, flow_v, speed, cluster, valid
+    disch = points[1].disch
+    rows = np.array(
+        [
+            [1e5, 300, disch.p().m, disch.T().m, 1.5, 1000, 0, 1],
+            [1e5, 300, disch.p().m, disch.T().m, 1.5, 1000, 0, 0],
+        ]
+    )
+    results = calculate_points_chunk(rows)
+    assert_allclose(results[0, :4], [0.8, 75e3, points[1].power.m, disch.p("bar").m])
+    assert_allclose(results[0, :4], results[0, 4:], rtol=1e-6)
+    assert np.isnan(results[1]).all()
+
+
+def air_impeller_data(n, freq):
+    """Impeller with air and measurements around its point at 1000 rad/s."""
+    fluid = {"AIR": 1.0}
+    suc = ccp.State(p=Q_(1, "bar"), T=300, fluid=fluid)
+    points = [
+        ccp.Point(
+            suc=suc,
+            speed=speed,
+            flow_v=flow_v * speed / 1000,
+            head=head * (speed / 1000) ** 2,
+            eff=eff,
+            b=0.01,
+            D=0.3,
+        )
+        for speed in [900, 1000, 1100]
+        for flow_v, head, eff in [
+            (1.0, 80e3, 0.78),
+            (1.5, 75e3, 0.8),
+            (2.0, 60e3, 0.76),
+        ]
+    ]
+    imp = ccp.Impeller(points)
+
+    rng = np.random.default_rng(0)
+    disch = points[4].disch
+    df = pd.DataFrame(
+        {
+            "ps": 1 + 0.001 * rng.standard_normal(n),
+            "Ts": 300 + 0.01 * rng.standard_normal(n),
+            "pd": disch.p("bar").m * (1 + 0.0005 * rng.standard_normal(n)),
+            "Td": disch.T().m + 0.01 * rng.standard_normal(n),
+            "flow_v": 1.5 + 0.001 * rng.standard_normal(n),
+            "speed": 1000 + 0.1 * rng.standard_normal(n),
+            "delta_p": np.full(n, 0.1),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq=freq),
+    )
+    data_units = {
+        "ps": "bar",
+        "Ts": "degK",
+        "pd": "bar",
+        "Td": "degK",
+        "flow_v": "m³/s",
+        "speed": "rad/s",
+        "delta_p": "bar",
+    }
+
+    return imp, df, data_units
+
+
+def test_evaluation_append():
+    imp, df, data_units = air_impeller_data(40, "1min")
+    evaluation = ccp.Evaluation(
+        data=df[:30],
+        operation_fluid={"AIR": 1.0},
+        data_units=data_units,
+        impellers=[imp],
+        n_clusters=2,
+    )
+    kmeans = evaluation.kmeans
+
+    df_new = evaluation.append(df[30:], max_drift=None)
+    assert evaluation.kmeans is kmeans
+    assert len(df_new) == 10
+    assert len(evaluation.df) == len(df) - 2
+
+    # same results as calculating all points with the fitted clusters
+    df_results = evaluation.calculate_points(df)
+    assert_allclose(df_new["delta_eff"], df_results.loc[df_new.index, "delta_eff"])
+    assert_allclose(evaluation.df["timescale"], df_results["timescale"])
+
+    # samples far from the clusters trigger a new fit
+    df_drift = df[30:].copy()
+    df_drift["ps"] *= 1.5
+    df_drift.index += pd.Timedelta("1h")
+    df_new = list(evaluation.stream([df_drift]))[0]
+    assert evaluation.kmeans is not kmeans
+    assert evaluation.drift == 0
+    assert len(evaluation.df) == 46
+
+
+def test_evaluation_append_after_load():
+    imp, df, data_units = air_impeller_data(40, "1min")
+    evaluation = ccp.Evaluation(
+        data=df[:30],
+        operation_fluid={"AIR": 1.0},
+        data_units=data_units,
+        impellers=[imp],
+        n_clusters=2,
+    )
+    file = Path(tempdir) / "evaluation_append.ccp_eval"
+    evaluation.save(file)
+    loaded_evaluation = ccp.Evaluation.load(file)
+    assert_allclose(loaded_evaluation.cluster_radius, evaluation.cluster_radius)
+
+    df_new = evaluation.append(df[30:], max_drift=None)
+    loaded_df_new = loaded_evaluation.append(df[30:], max_drift=None)
+    assert_allclose(loaded_df_new["delta_eff"], df_new["delta_eff"])
+    assert loaded_evaluation.drift == evaluation.drift
+
+
+def test_evaluation_resample():
+    imp, df, data_units = air_impeller_data(1800, "1s")
+    # irregular samples
+    df = df.drop(df.index[np.random.default_rng(1).random(len(df)) < 0.3])
+    evaluation = ccp.Evaluation(
+        data=df[df.index < "2024-01-01 00:22:00"],
+        operation_fluid={"AIR": 1.0},
+        data_units=data_units,
+        impellers=[imp],
+        n_clusters=2,
+        window="1min",
+        resample="5min",
+    )
+    # a single point for each period, the first one without a complete window
+    assert list(evaluation.df.index.minute) == [0, 5, 10, 15, 20]
+
+    df_new = evaluation.append(df[df.index >= "2024-01-01 00:22:00"], max_drift=None)
+    assert list(df_new.index.minute) == [20, 25]
+    assert list(evaluation.df.index.minute) == [0, 5, 10, 15, 20, 25]
+
+    df_results = evaluation.calculate_points(df)
+    assert_allclose(evaluation.df["delta_eff"], df_results["delta_eff"])
+
+
+def test_timescale():
+    from ccp.evaluation import _timescale
+
+    # spans longer than a day
+    index = pd.date_range("2024-01-01", periods=5, freq="12h")
+    assert_allclose(_timescale(index), [0, 0.25, 0.5, 0.75, 1])
+    assert _timescale(index[:1]) == 0
@@ -1,6 +1,7 @@
 import pytest
 import ccp
 from numpy.testing import assert_allclose
+from ccp.fo import calc_flow_batch
 
 Q_ = ccp.Q_
 
@@ -85,3 +86,25 @@ def test_flow_orifice(fo1, fo2, fo3, fo4):
     assert_allclose(fo2.qm.to("kg/h").m, 36408.6871553386)
     assert_allclose(fo3.qm.to("kg/h").m, 36408.6871553386)
     assert_allclose(fo4.qm.to("kg/h").m, 36408.6871553386)
+
+
+@pytest.mark.parametrize(
+    "D, tappings", [(Q_(250, "mm"), "flange"), (Q_(60, "mm"), "corner")]
+)
+def test_calc_flow_batch(D, tappings):
+    fluid = {"methane": 0.9, "ethane": 0.1}
+    p1 = Q_([10, 10, 8], "bar")
+    T1 = Q_([40, 40, 30], "degC")
+    delta_p = Q_([0.1, 0.2, 0.05], "bar")
+    d = 0.68 * D
+    state = ccp.StateArray(p=p1, T=T1, fluid=fluid)
+
+    flow_m = calc_flow_batch(state, delta_p, D, d, tappings=tappings)
+
+    expected = [
+        ccp.FlowOrifice(
+            ccp.State(p=p, T=T, fluid=fluid), dp, D, d, tappings=tappings
+        ).qm.m
+        for p, T, dp in zip(p1, T1, delta_p)
+    ]
+    assert_allclose(flow_m.to("kg/s").m, expected, rtol=1e-9)
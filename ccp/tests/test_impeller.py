@@ -184,6 +184,142 @@ def test_impeller_disch_state(imp2):
     )
 
 
+def test_impeller_point_speed_interpolation(imp2):
+    # points from the interpolated curve are reproduced by Impeller.point
+    curve = imp2.curve(Q_(1300, "rad/s"))
+    for curve_point in curve:
+        point = imp2.point(flow_v=curve_point.flow_v, speed=Q_(1300, "rad/s"))
+        assert_allclose(point.disch.p(), curve_point.disch.p(), rtol=1e-8)
+        assert_allclose(point.disch.T(), curve_point.disch.T(), rtol=1e-8)
+        assert_allclose(point.head, curve_point.head, rtol=1e-8)
+        assert_allclose(point.power_losses, curve_point.power_losses)
+
+    # linear interpolation between points and extrapolation before surge
+    flows = curve.flow_v.m
+    point = imp2.point(flow_v=(flows[0] + flows[1]) / 2, speed=Q_(1300, "rad/s"))
+    assert_allclose(point.disch.p().m, curve.disch.p().m[:2].mean(), rtol=1e-8)
+    with pytest.warns(UserWarning, match="extrapolated"):
+        point = imp2.point(flow_v=2 * flows[0] - flows[1], speed=Q_(1300, "rad/s"))
+    assert_allclose(
+        point.disch.T().m,
+        2 * curve.disch.T().m[0] - curve.disch.T().m[1],
+        rtol=1e-8,
+    )
+
+
+def test_impeller_points_batch(imp2, monkeypatch):
+    flow_v = Q_([1.2, 1.3, 1.2, 1.35], "m³/s")
+    speed = Q_([1263, 1300, 1300, 1337], "rad/s")
+    table = imp2.points_batch(flow_v=flow_v, speed=speed)
+    assert isinstance(table, ccp.PointTable)
+    assert len(table) == 4
+
+    for i in range(4):
+        point = imp2.point(flow_v=flow_v[i], speed=speed[i])
+        assert_allclose(table.head.m[i], point.head.m, rtol=1e-8)
+        assert_allclose(table.eff.m[i], point.eff.m, rtol=1e-8)
+        assert_allclose(table.power.m[i], point.power.m, rtol=1e-8)
+        assert_allclose(table.disch_p.m[i], point.disch.p().m, rtol=1e-8)
+        assert_allclose(table.disch_T.m[i], point.disch.T().m, rtol=1e-8)
+        assert_allclose(table.power_losses.m[i], point.power_losses.m)
+
+    points = imp2.points_batch(flow_v=flow_v[:2], speed=1300, materialize=True)
+    assert all(isinstance(point, Point) for point in points)
+    assert_allclose(points[1].head.m, table.head.m[1], rtol=1e-8)
+
+    with pytest.warns(UserWarning, match="1 of 1 expected points"):
+        imp2.points_batch(flow_v=1.0, speed=1300)
+
+    # polytropic method without batch functions is calculated point by point
+    monkeypatch.setattr(ccp.config, "POLYTROPIC_METHOD", "huntington")
+    table = imp2.points_batch(flow_v=flow_v[:2], speed=1300)
+    point = imp2.point(flow_v=flow_v[1], speed=1300)
+    assert_allclose(table.head.m[1], point.head.m, rtol=1e-8)
+
+
+def test_impeller_interpolate_speed_points_changed(imp2):
+    curve = imp2.curves[0]
+    p1 = curve.points[1]
+    new_point = Point(
+        suc=p1.suc,
+        disch=State(p=1.01 * p1.disch.p(), T=p1.disch.T(), fluid=p1.suc.fluid),
+        flow_v=p1.flow_v,
+        speed=p1.speed,
+        b=p1.b,
+        D=p1.D,
+    )
+    # points list modified in place
+    curve.points[1] = new_point
+    *_, disch_p = imp2._interpolate_speed(curve.speed)
+    assert_allclose(disch_p[1], new_point.disch.p().to(curve.units["disch_p"]).m)
+
+
+def test_impeller_interpolate_speed_number_of_points(imp2):
+    imp2.curves[0].points = imp2.curves[0].points[:-1]
+    with pytest.raises(ValueError, match="same number of points"):
+        imp2.curve(Q_(1300, "rad/s"))
+
+
+def test_impeller_curve_cache(imp2, monkeypatch):
+    imp2.curve_cache_clear()
+    curve = imp2.curve(Q_(1300, "rad/s"))
+    assert imp2.curve(Q_(1300, "rad/s")) is curve
+    assert imp2.curve(Q_(1300 * 60 / (2 * np.pi), "RPM")) is curve
+    assert imp2.curve_cache_info() == (2, 1, ccp.config.CURVE_CACHE_SIZE, 1)
+
+    # cache is dropped when pickling and recreated if the points change
+    imp_pickled = pickle.loads(pickle.dumps(imp2))
+    assert imp_pickled.curve_cache_info() == (0, 0, ccp.config.CURVE_CACHE_SIZE, 0)
+    for imp_curve in imp2.curves:
+        imp_curve.points = imp_curve.points[:2]
+    assert imp2.curve(Q_(1300, "rad/s")) is not curve
+    assert imp2.curve_cache_info() == (0, 1, ccp.config.CURVE_CACHE_SIZE, 1)
+
+    # points replaced in place in a curve list
+    curve = imp2.curve(Q_(1300, "rad/s"))
+    p1 = imp2.curves[0].points[1]
+    imp2.curves[0].points[1] = Point(
+        suc=p1.suc,
+        disch=State(p=1.01 * p1.disch.p(), T=p1.disch.T(), fluid=p1.suc.fluid),
+        flow_v=p1.flow_v,
+        speed=p1.speed,
+        b=p1.b,
+        D=p1.D,
+    )
+    new_curve = imp2.curve(Q_(1300, "rad/s"))
+    assert new_curve is not curve
+    assert new_curve.disch.p().m[1] > curve.disch.p().m[1]
+    assert imp2.curve(Q_(1300, "rad/s")) is new_curve
+
+    monkeypatch.setattr(ccp.config, "CURVE_CACHE_SIZE", 0)
+    imp2.curve_cache_clear()
+    curve = imp2.curve(Q_(1300, "rad/s"))
+    assert imp2.curve(Q_(1300, "rad/s")) is not curve
+    assert imp2.curve_cache_info() == (0, 0, 0, 0)
+
+
+def test_get_interpolated_values():
+    from scipy.optimize import fsolve
+    from ccp.impeller import get_interpolated_values, system_to_interpolate
+
+    rng = np.random.default_rng(0)
+    flow_0, val_0 = rng.uniform(1, 2, 10), rng.uniform(1e5, 2e5, 10)
+    flow_1, val_1 = rng.uniform(2, 3, 10), rng.uniform(2e5, 3e5, 10)
+
+    for fac in [-0.2, 0.3, 0.7, 1.5]:
+        flow_x, val_x = get_interpolated_values(fac, flow_0, val_0, flow_1, val_1)
+        for i in range(10):
+            args = (fac, flow_0[i], val_0[i], flow_1[i], val_1[i])
+            expected = fsolve(system_to_interpolate, [flow_0[i], val_0[i]], args=args)
+            assert_allclose([flow_x[i], val_x[i]], expected, rtol=1e-8)
+
+        # scalar arguments
+        assert_allclose(
+            get_interpolated_values(fac, flow_0[0], val_0[0], flow_1[0], val_1[0]),
+            [flow_x[0], val_x[0]],
+        )
+
+
 def test_impeller2_new_suction(imp2):
     new_suc = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15})
     imp2_new = Impeller.convert_from(imp2, suc=new_suc, find="speed")
@@ -850,3 +986,13 @@ def test_pickle(imp0):
     assert pickled_imp0 == imp0
     assert hasattr(imp0, "head_plot") is True
     assert hasattr(pickled_imp0, "head_plot") is True
+
+
+def test_lazy_attributes(imp0):
+    assert "head_plot" not in imp0.__dict__
+    assert "head_compare" not in imp0.__dict__
+    assert "p_plot" not in imp0.disch.__dict__
+    assert imp0.head_plot.attr == "head"
+    assert imp0.disch.p_plot.attr == "disch.p"
+    assert imp0.disch.p_compare.impeller_object is imp0
+    assert_allclose(imp0.disch.p(), [[7682000.0, 7600000.0]])
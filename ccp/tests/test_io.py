@@ -168,3 +168,67 @@ def test_filter_real_data():
     )
 
     assert len(df) == 2
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 5])
+def test_filter_data_chunks(chunksize):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 4.01, 4.02, 5, 6.01, 6.02, 6.04, 6.05],
+            "b": [4, 5, 6, 7, 7.01, 7.02, 8, 9, 10, 11, 12],
+        }
+    )
+    data_type = {"a": "pressure", "b": "temperature"}
+    chunks = (df[i : i + chunksize] for i in range(0, len(df), chunksize))
+    assert_frame_equal(
+        pd.concat(
+            ccp.data_io.filter_data_chunks(
+                chunks, data_type=data_type, drop_invalid_values=False
+            )
+        ),
+        ccp.data_io.filter_data(df, data_type=data_type, drop_invalid_values=False),
+    )
+
+
+@pytest.mark.parametrize("resample", [None, "2min"])
+def test_filter_data_time_window(resample):
+    df = pd.read_csv(
+        data_dir / "UTGCA_1231_A_1s.csv", index_col=0, parse_dates=True, nrows=600
+    )
+    df.columns = ["Ts", "ps", "Td", "pd", "flow_v", "flow_v_norm", "speed"]
+    # irregular samples
+    df = df.drop(df.index[np.random.default_rng(0).random(len(df)) < 0.3])
+    data_type = {
+        "ps": "pressure",
+        "Ts": "temperature",
+        "pd": "pressure",
+        "Td": "temperature",
+        "speed": "speed",
+    }
+    df_filtered = ccp.data_io.filter_data(
+        df,
+        window="1min",
+        data_type=data_type,
+        drop_invalid_values=False,
+        resample=resample,
+    )
+    if resample is None:
+        # rows without a complete window are removed
+        assert df_filtered.index[0] >= df.index[0] + pd.Timedelta("1min")
+    else:
+        assert len(df_filtered) == 5
+
+    chunks = (df[i : i + 50] for i in range(0, len(df), 50))
+    assert_frame_equal(
+        pd.concat(
+            ccp.data_io.filter_data_chunks(
+                chunks,
+                window="1min",
+                data_type=data_type,
+                drop_invalid_values=False,
+                resample=resample,
+            )
+        ),
+        df_filtered,
+        check_freq=False,
+    )
@@ -0,0 +1,116 @@
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import parallel
+
+
+def config_eos(x):
+    return ccp.config.EOS
+
+
+@pytest.fixture
+def pool():
+    parallel.configure(max_workers=2)
+    yield
+    parallel.configure()
+
+
+def test_executor_reused(pool):
+    executor = parallel.get_executor()
+    assert isinstance(executor, ProcessPoolExecutor)
+    assert list(parallel.map(math.sqrt, [x**2 for x in range(10)])) == list(range(10))
+    assert parallel.get_executor() is executor
+
+    parallel.shutdown()
+    assert parallel.get_executor() is not executor
+
+
+def test_config_sent_to_workers(pool):
+    eos = ccp.config.EOS
+    # start the workers before changing the configuration
+    list(parallel.map(config_eos, range(10)))
+    ccp.config.EOS = "PR"
+    try:
+        assert list(parallel.map(config_eos, range(10))) == ["PR"] * 10
+    finally:
+        ccp.config.EOS = eos
+
+
+def test_user_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel.configure(executor=executor)
+        try:
+            assert ccp.config.PARALLEL_BACKEND is executor
+            assert parallel.get_executor() is executor
+            assert list(parallel.map(abs, range(-5, 5))) == list(map(abs, range(-5, 5)))
+            parallel.shutdown()
+            # executors supplied by the user are not shut down by ccp
+            assert list(executor.map(abs, [-3])) == [3]
+        finally:
+            parallel.configure()
+
+
+def test_backends(pool):
+    ccp.config.PARALLEL_BACKEND = "serial"
+    assert parallel.get_executor() is None
+    assert list(parallel.map(abs, range(-10, 0))) == list(range(10, 0, -1))
+
+    ccp.config.PARALLEL_BACKEND = "threads"
+    executor = parallel.get_executor()
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert executor._max_workers == 2
+    ccp.config.PARALLEL_MAX_WORKERS = 3
+    assert parallel.get_executor()._max_workers == 3
+
+    ccp.config.PARALLEL_BACKEND = "gpu"
+    with pytest.raises(ValueError, match="backend 'gpu' is not available"):
+        parallel.get_executor()
+
+
+def test_serial_under_threshold(pool, monkeypatch):
+    def fail():
+        raise AssertionError("executor should not be used")
+
+    monkeypatch.setattr(parallel, "get_executor", fail)
+    size = ccp.config.PARALLEL_MIN_SIZE - 1
+    assert list(parallel.map(abs, [-1] * size)) == [1] * size
+
+
+def test_default_chunksize():
+    assert parallel.default_chunksize(0, 4) == 1
+    assert parallel.default_chunksize(16, 4) == 1
+    assert parallel.default_chunksize(17, 4) == 2
+    assert parallel.default_chunksize(100000, 8) == 3125
+
+
+_factor = {}
+
+
+def set_factor(factor):
+    _factor["value"] = factor
+
+
+def multiply(rows):
+    return rows * _factor["value"]
+
+
+@pytest.mark.parametrize("backend", ["serial", "threads", "processes"])
+def test_map_chunks(pool, backend):
+    ccp.config.PARALLEL_BACKEND = backend
+    rows = np.arange(40.0).reshape(20, 2)
+    results = parallel.map_chunks(multiply, rows, set_factor, (3,))
+    assert_allclose(results, 3 * rows)
+
+
+def test_map_chunks_persistent_pool(pool):
+    executor = parallel.get_executor()
+    rows = np.arange(40.0).reshape(20, 2)
+    assert_allclose(parallel.map_chunks(multiply, rows, set_factor, (3,)), 3 * rows)
+    # workers are set up again with the new arguments
+    assert_allclose(parallel.map_chunks(multiply, rows, set_factor, (5,)), 5 * rows)
+    assert parallel.get_executor() is executor
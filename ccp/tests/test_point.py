@@ -277,6 +277,52 @@ def test_head_reference_2017(suc_0, disch_0):
     assert_allclose(h, 82951.388465, rtol=1e-8)
 
 
+def test_head_reference_reentrant():
+    from concurrent.futures import ThreadPoolExecutor
+
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid={"methane": 1.0})
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid={"methane": 1.0})
+    expected = [
+        head_reference(suc, disch, num_steps=10),
+        head_reference_2017(suc, disch, num_steps=10),
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = [
+            executor.submit(head_reference, suc, disch, num_steps=10),
+            executor.submit(head_reference_2017, suc, disch, num_steps=10),
+        ]
+        results = [result.result() for result in results]
+
+    for (h, eff), (h_expected, eff_expected) in zip(results, expected):
+        assert_allclose(h, h_expected, rtol=1e-10)
+        assert_allclose(eff, eff_expected, rtol=1e-10)
+    # suction and discharge are not modified by the integration
+    assert_allclose(suc.T(), 291.5)
+    assert_allclose(disch.T(), 405.7)
+
+
+def test_head_reference_tol():
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid={"methane": 1.0})
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid={"methane": 1.0})
+    h_fine, eff_fine, info_fine = head_reference(
+        suc, disch, num_steps=256, full_output=True
+    )
+    assert info_fine.num_steps == 256
+    assert info_fine.tol is None
+
+    for func in [head_reference, head_reference_2017]:
+        for richardson in [True, False]:
+            h, eff, info = func(
+                suc, disch, tol=1e-5, richardson=richardson, full_output=True
+            )
+            assert info.tol <= 1e-5
+            assert info.num_steps < 256
+            assert info.flashes < info_fine.flashes
+            assert_allclose(h, h_fine, rtol=1e-5)
+            assert_allclose(eff, eff_fine, rtol=1e-4)
+
+
 def test_head_pol_huntington(suc_0, disch_0):
     h = head_pol_huntington(suc_0, disch_0)
     assert h.units == "joule/kilogram"
@@ -299,6 +345,31 @@ def test_eff_isentropic(suc_0, disch_0):
     assert_allclose(eff_isentropic(suc_0, disch_0), 0.76996, rtol=1e-5)
 
 
+def test_disch_from_suc_solvers(suc_0, disch_0):
+    head = head_pol_schultz(suc_0, disch_0)
+    eff = eff_pol_schultz(suc_0, disch_0)
+
+    disch, result = disch_from_suc_head_eff(suc_0, head, eff, full_output=True)
+    assert result.converged
+    assert result.iterations < 10
+    assert_allclose(disch.p(), disch_0.p(), rtol=1e-6)
+    assert_allclose(disch.T(), disch_0.T(), rtol=1e-6)
+
+    disch, result = disch_from_suc_disch_p_eff(
+        suc_0, disch_0.p(), eff, full_output=True
+    )
+    assert result.converged
+    assert result.iterations < 10
+    assert_allclose(disch.T(), disch_0.T(), rtol=1e-6)
+
+    disch, result = disch_from_suc_disch_T_head(
+        suc_0, disch_0.T(), head, full_output=True
+    )
+    assert result.converged
+    assert result.iterations < 10
+    assert_allclose(disch.p(), disch_0.p(), rtol=1e-6)
+
+
 def test_reynolds(suc_0):
     re = reynolds(suc_0, speed=1, b=1, D=1)
     assert str(re.units) == "dimensionless"
@@ -521,6 +592,75 @@ def test_pickle(point_disch_flow_v_speed_suc):
     assert hasattr(pickled_point, "head_plot") is True
 
 
+def test_dispatch_calc_from():
+    dispatch = Point._dispatch_calc_from
+    # every _calc_from_* method is reachable from its set of arguments
+    methods = [name for name in dir(Point) if name.startswith("_calc_from_")]
+    assert len(dispatch) == len(methods)
+    assert (
+        dispatch[frozenset(["suc", "disch_p", "eff", "flow_v", "speed"])]
+        is Point._calc_from_disch_p_eff_flow_v_speed_suc
+    )
+    assert (
+        dispatch[
+            frozenset(
+                ["suc", "disch_T", "flow_m", "pressure_ratio", "power_losses", "speed"]
+            )
+        ]
+        is Point._calc_from_disch_T_flow_m_power_losses_pressure_ratio_speed_suc
+    )
+
+    class NewPoint(Point):
+        def _calc_from_disch_speed_suc(self):
+            self._calc_from_disch_flow_v_speed_suc()
+
+    assert frozenset(["suc", "disch", "speed"]) in NewPoint._dispatch_calc_from
+    assert frozenset(["suc", "disch", "speed"]) not in Point._dispatch_calc_from
+
+
+def test_calc_from_invalid_arguments(suc_0, disch_0):
+    with pytest.raises(ValueError) as ex:
+        Point(suc=suc_0, disch=disch_0, speed=1)
+    assert "disch, speed, suc" in str(ex.value)
+    assert "disch, flow_v, speed, suc" in str(ex.value)
+
+    with pytest.raises(ValueError) as ex:
+        Point(suc=suc_0, disch=disch_0, flow_v=1, speed=1, polytropic_method="x")
+    assert "schultz" in str(ex.value)
+
+
+def test_lazy_point(suc_0, disch_0, point_disch_flow_v_speed_suc):
+    lazy_point = LazyPoint(suc=suc_0, disch=disch_0, flow_v=1, speed=1, b=1, D=1)
+    assert lazy_point == point_disch_flow_v_speed_suc
+    assert "reynolds" not in lazy_point.__dict__
+    assert "head_plot" not in lazy_point.__dict__
+    assert_allclose(lazy_point.reynolds, point_disch_flow_v_speed_suc.reynolds)
+    assert_allclose(lazy_point.mach, point_disch_flow_v_speed_suc.mach)
+    assert callable(lazy_point.head_plot)
+    assert callable(lazy_point.suc.p_plot)
+    with pytest.raises(AttributeError):
+        lazy_point.not_an_attribute
+
+    pickled_point = pickle.loads(pickle.dumps(lazy_point))
+    assert pickled_point == lazy_point
+    assert "head_plot" not in pickled_point.__dict__
+
+
+def test_lazy_plot(suc_0, disch_0, point_disch_flow_v_speed_suc):
+    point = point_disch_flow_v_speed_suc
+    assert "head_plot" not in point.__dict__
+    assert callable(point.head_plot)
+    assert "head_plot" in point.__dict__
+
+    # plots for states shared between points are bound to the last point
+    point_1 = Point(suc=suc_0, disch=disch_0, flow_v=2, speed=1, b=1, D=1)
+    fig = point_1.suc.p_plot()
+    assert_allclose(fig.data[0].x, [2.0])
+
+    with pytest.raises(AttributeError):
+        State(p=Q_(1.839, "bar"), T=291.5, fluid={"methane": 1.0}).p_plot
+
+
 def test_global_polytropic_method(suc_0, disch_0):
     ccp.config.POLYTROPIC_METHOD = "huntington"
     p0 = Point(suc=suc_0, disch=disch_0, flow_v=1, speed=1, b=1, D=1)
@@ -608,3 +748,46 @@ def test_ptc10_c6_sample_calculation():
         find="volume_ratio",
     )
     assert_allclose(point_sp.eff, 0.792242)
+
+
+def test_batch_functions(suc_0, disch_0):
+    fluid = suc_0.fluid
+    suc = StateArray(p=[suc_0.p().m] * 2, T=[suc_0.T().m] * 2, fluid=fluid)
+    disch = StateArray(
+        p=[disch_0.p().m, 1.1 * disch_0.p().m],
+        T=[disch_0.T().m, disch_0.T().m + 10],
+        fluid=fluid,
+    )
+
+    for func in [
+        n_exp,
+        head_pol,
+        eff_pol,
+        head_isentropic,
+        eff_isentropic,
+        f_schultz,
+        head_pol_schultz,
+        eff_pol_schultz,
+        head_pol_mallen_saville,
+        eff_pol_mallen_saville,
+        head_pol_sandberg_colby,
+        eff_pol_sandberg_colby,
+    ]:
+        batch_func = globals()[f"{func.__name__}_batch"]
+        results = batch_func(suc, disch)
+        for i in range(2):
+            expected = func(suc[i], disch[i])
+            assert results.units == expected.units
+            assert_allclose(results[i].m, expected.m, rtol=1e-6)
+
+    # columns given as a dict
+    disch_s = StateArray(p=disch.p(), s=suc.s(), fluid=fluid)
+    columns = [
+        {k: getattr(states, k)() for k in ["p", "T", "v", "h", "s"]}
+        for states in [suc, disch, disch_s]
+    ]
+    assert_allclose(
+        head_pol_schultz_batch(*columns).m, head_pol_schultz_batch(suc, disch).m
+    )
+    with pytest.raises(TypeError):
+        head_pol_schultz_batch(columns[0], columns[1])
@@ -0,0 +1,115 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import Q_, State, Point, PointTable, PointRecord
+
+
+@pytest.fixture
+def points():
+    fluid = {"methane": 1.0}
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    points = []
+    for i, (disch_p, disch_T) in enumerate([(5.902, 405.7), (5.5, 400.0)]):
+        disch = State(p=Q_(disch_p, "bar"), T=disch_T, fluid=fluid)
+        points.append(
+            Point(
+                suc=suc,
+                disch=disch,
+                flow_v=1 + i,
+                speed=Q_(10000, "RPM"),
+                b=0.01,
+                D=0.3,
+                power_losses=Q_(10, "kW"),
+            )
+        )
+    return points
+
+
+def test_from_points(points):
+    table = PointTable.from_points(points)
+    assert len(table) == 2
+    assert table.fluid == points[0].suc.fluid
+    assert table.head.units == "joule/kilogram"
+    assert_allclose(table.head.m, [p.head.m for p in points])
+    assert_allclose(table.eff.m, [p.eff.m for p in points])
+    assert_allclose(table.speed.m, [p.speed.m for p in points])
+    assert_allclose(table.reynolds.m, [p.reynolds.m for p in points])
+    assert_allclose(table.disch_T.m, [405.7, 400.0])
+    assert_allclose(table.power_losses.m, [10000.0, 10000.0])
+    assert table.nbytes == 2 * len(PointTable.units) * 8
+
+
+def test_record(points):
+    table = PointTable.from_points(points)
+    record = table[1]
+    assert isinstance(record, PointRecord)
+    assert not hasattr(record, "__dict__")
+    assert_allclose(record.head, points[1].head.m)
+    assert_allclose(record.suc_p, 183900.0)
+
+    point = record.to_point()
+    assert point == points[1]
+    assert_allclose(point.power_losses.to("W").m, 10000.0)
+
+
+def test_rehydrate(points):
+    table = PointTable.from_points(points)
+    for i, point in enumerate(points):
+        new_point = table.to_point(i)
+        assert new_point == point
+        assert_allclose(new_point.power, point.power)
+
+
+def test_slice_concatenate(points):
+    table = PointTable.from_points(points)
+    assert len(table[:1]) == 1
+    assert_allclose(table[np.array([False, True])].flow_v.m, [2.0])
+
+    joined = PointTable.concatenate([table, table[1:]])
+    assert len(joined) == 3
+    assert_allclose(joined.flow_v.m, [1.0, 2.0, 2.0])
+
+    with pytest.raises(ValueError):
+        PointTable.concatenate([table, PointTable(fluid={"ethane": 1.0})])
+
+
+def test_from_columns():
+    table = PointTable(
+        dict(flow_v=Q_([3600, 7200], "m**3/h"), head=[100e3, 90e3]),
+        fluid={"methane": 1.0},
+    )
+    assert_allclose(table.flow_v.m, [1.0, 2.0])
+    assert np.isnan(table.eff.m).all()
+    assert list(table.to_dataframe().columns) == list(PointTable.units)
+
+    with pytest.raises(ValueError):
+        PointTable(dict(flow=[1.0]), fluid={"methane": 1.0})
+
+
+def test_pickle(points):
+    table = PointTable.from_points(points)
+    pickled_table = pickle.loads(pickle.dumps(table))
+    assert_allclose(pickled_table.head.m, table.head.m)
+    assert pickled_table.fluid == table.fluid
+
+
+def test_eos_polytropic_method(points):
+    for point in points:
+        point.polytropic_method = "huntington"
+    table = PointTable.from_points(points)
+    assert table.EOS == ccp.config.EOS
+    assert table.polytropic_method == "huntington"
+    assert table[1:].polytropic_method == "huntington"
+    assert PointTable.concatenate([table, table]).polytropic_method == "huntington"
+
+    for point in [table.to_point(0), table[0].to_point()]:
+        assert point.polytropic_method == "huntington"
+        assert point.suc.EOS == ccp.config.EOS
+
+    schultz_table = PointTable(fluid={"methane": 1.0}, polytropic_method="schultz")
+    with pytest.raises(ValueError):
+        PointTable.concatenate([table, schultz_table])
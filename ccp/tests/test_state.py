@@ -428,3 +428,118 @@ def test_pt_gas_update():
 
     assert_allclose(s.T().m, 289.15, rtol=1e-3)
     assert_allclose(s.p().m, 3.82e5, rtol=1e-3)
+
+
+def test_state_array():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    p = Q_([1, 2, 3], "bar")
+    T = Q_([300, 310, 320], "degK")
+    states = StateArray(p=p, T=T, fluid=fluid)
+
+    assert len(states) == 3
+    assert states.p().units == "pascal"
+    assert states.rho().units == "kilogram/meter**3"
+    for i in range(len(states)):
+        state = State(p=p[i], T=T[i], fluid=fluid)
+        assert_allclose(states.h()[i].m, state.h().m)
+        assert_allclose(states.s()[i].m, state.s().m)
+        assert_allclose(states.rho()[i].m, state.rho().m)
+        assert_allclose(states.speed_sound()[i].m, state.speed_sound().m, rtol=1e-6)
+        assert_allclose(states.viscosity()[i].m, state.viscosity().m, rtol=1e-6)
+        assert states[i] == state
+
+    # other input pairs and broadcasting of scalars
+    states_ps = StateArray(p=states.p(), s=states.s(), fluid=fluid)
+    assert_allclose(states_ps.T().m, T.m)
+    states_T = StateArray(p=p, T=300, fluid=fluid)
+    assert_allclose(states_T.T().m, [300, 300, 300])
+
+
+def test_state_array_errors():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    with pytest.raises(KeyError):
+        StateArray(p=[100000, 200000], fluid=fluid)
+    with pytest.raises(ValueError):
+        StateArray(p=[100000, 200000], T=[300, 300], fluid=fluid, errors="ignore")
+
+    # all rows invalid
+    states = StateArray(p=[-1, -2], h=[1e5, 1e5], fluid=fluid, errors="coerce")
+    assert not states.valid.any()
+    assert repr(states) == ("StateArray(size=2, fluid={'METHANE': 0.5, 'ETHANE': 0.5})")
+    assert states.speed_sound().units == "meter/second"
+    assert np.isnan(states.speed_sound().m).all()
+    state = State(p=100000, T=300, fluid=fluid)
+    assert_allclose(states.molar_mass().m, state.molar_mass().m)
+    assert_allclose(states.gas_constant().m, state.gas_constant().m)
+    with pytest.raises(ValueError, match="could not be calculated"):
+        states[0]
+    with pytest.raises(TypeError, match="indices must be integers"):
+        states[:1]
+    with pytest.raises(TypeError, match="indices must be integers"):
+        states[np.array([0, 1])]
+
+
+def test_flash_cache():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    state_no_cache = State(p=200000, T=310, fluid=fluid)
+
+    ccp.config.STATE_CACHE_SIZE = 2
+    ccp.state.flash_cache_clear()
+    try:
+        state = State(p=200000, T=310, fluid=fluid)
+        assert ccp.state.flash_cache_info() == (0, 1, 2, 1)
+        state.update(p=100000, T=300)
+        state.update(p=Q_(2, "bar"), T=310)
+        assert ccp.state.flash_cache_info() == (1, 2, 2, 2)
+        assert_allclose(state.p().m, state_no_cache.p().m)
+        assert_allclose(state.h().m, state_no_cache.h().m)
+        assert_allclose(state.rho().m, state_no_cache.rho().m)
+
+        # least recently used result is discarded
+        state.update(p=300000, T=320)
+        state.update(p=100000, T=300)
+        assert ccp.state.flash_cache_info() == (1, 4, 2, 2)
+    finally:
+        ccp.config.STATE_CACHE_SIZE = 0
+        ccp.state.flash_cache_clear()
+
+
+def test_update_si():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    state = State(p=Q_(2, "bar"), T=310, fluid=fluid)
+    state_si = State(p=100000, T=300, fluid=fluid)
+    state_si.update_si(p=200000, T=310)
+
+    assert_allclose(state_si.p_si(), state.p().m)
+    assert_allclose(state_si.T_si(), state.T().m)
+    assert_allclose(state_si.h_si(), state.h().m)
+    assert_allclose(state_si.s_si(), state.s().m)
+    assert_allclose(state_si.rho_si(), state.rho().m)
+    assert_allclose(state_si.v_si(), state.v().m)
+
+    state_si.update_si(p=200000, s=state.s_si())
+    assert_allclose(state_si.T_si(), 310, rtol=1e-6)
+
+
+def test_scratch():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    state = State(p=200000, T=310, fluid=fluid)
+
+    with state.scratch() as work:
+        assert work is not state
+        assert work.fluid == state.fluid
+        assert_allclose(work.p().m, 200000)
+        assert_allclose(work.T().m, 310)
+        work.update(p=300000, s=state.s())
+        assert_allclose(state.p().m, 200000)
+        work_id = id(work)
+
+    # work states are reused and set to the calling state
+    with state.scratch() as work:
+        assert id(work) == work_id
+        assert_allclose(work.p().m, 200000)
+        assert_allclose(work.T().m, 310)
+
+        # nested blocks get different work states
+        with state.scratch() as other_work:
+            assert other_work is not work
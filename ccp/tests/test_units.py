@@ -1,9 +1,11 @@
+import os
 import pickle
 from collections import namedtuple
 
 import pytest
 from numpy.testing import assert_allclose
 
+from ccp.config import units
 from ccp.config.units import Q_, check_units
 
 
@@ -261,3 +263,71 @@ def test_unit_Q_conversion(auxiliary_function):
     results_dict = {k: v for k, v in zip(arguments.keys(), results)}
     for arg, actual in results_dict.items():
         assert_allclose(actual, arguments[arg].expected_converted_value)
+
+
+def test_check_units_cached_conversion(monkeypatch):
+    """Repeated calls through the cached conversion match a direct pint conversion."""
+    monkeypatch.setattr(units, "_conversion_factors", {})
+
+    def func(p, T, flow_v):
+        return p, T, flow_v
+
+    decorated = check_units(func)
+
+    def reference(p, T, flow_v):
+        return func(p.to("pascal"), T.to("degK"), flow_v.to("m**3/s"))
+
+    kwargs = dict(p=Q_(1, "bar"), T=Q_(20, "degC"), flow_v=Q_(1, "m**3/h"))
+    decorated(**kwargs)
+    key = (units.ureg.Unit("bar"), units.ureg.Unit("pascal"))
+    assert_allclose(units._conversion_factors[key], (1e5, 0.0))
+
+    # following calls use the cached factors instead of the pint registry
+    def fail(unit, base_unit):
+        raise AssertionError(f"factor for {unit} should be cached")
+
+    monkeypatch.setattr(units, "_conversion_factor", fail)
+    for _ in range(3):
+        for actual, expected in zip(decorated(**kwargs), reference(**kwargs)):
+            assert actual.units == expected.units
+            assert_allclose(actual.m, expected.m)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("CCP_BENCHMARK"), reason="set CCP_BENCHMARK=1 to run"
+)
+def test_check_units_overhead(record_property):
+    """Micro-benchmark for the per-call overhead of check_units.
+
+    The reference reproduces what the decorator did on every call before the
+    signature binding and conversion factors were cached: inspect the signature
+    and convert each argument through the pint registry. Timings are reported
+    (run with -s, or in the junit xml) and not asserted.
+    """
+    import inspect
+    from timeit import timeit
+
+    def func(p, T, flow_v):
+        return p, T, flow_v
+
+    decorated = check_units(func)
+
+    def reference(p, T, flow_v):
+        inspect.getfullargspec(func)
+        return func(p.to("pascal"), T.to("degK"), flow_v.to("m**3/s"))
+
+    kwargs = dict(p=Q_(1, "bar"), T=Q_(20, "degC"), flow_v=Q_(1, "m**3/h"))
+    for actual, expected in zip(decorated(**kwargs), reference(**kwargs)):
+        assert actual.units == expected.units
+        assert_allclose(actual.m, expected.m)
+
+    number = 2000
+    before = timeit(lambda: reference(**kwargs), number=number) / number
+    after = timeit(lambda: decorated(**kwargs), number=number) / number
+    record_property("check_units_before_us", before * 1e6)
+    record_property("check_units_after_us", after * 1e6)
+    print(
+        f"check_units per call overhead: before {before * 1e6:.1f} us, "
+        f"after {after * 1e6:.1f} us"
+    )